@@ -7,9 +7,14 @@ from alembic import context
 from sqlalchemy import pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
+from sqlalchemy.schema import SchemaItem
 
-from qna_agent.chats.models import Chat  # noqa: F401 - needed for Alembic
+from qna_agent.chats.models import (
+    INDEXED_METADATA_KEYS,
+    Chat,  # noqa: F401 - needed for Alembic
+)
 from qna_agent.config import get_settings
+from qna_agent.jobs.models import MessageJob  # noqa: F401 - needed for Alembic
 from qna_agent.messages.models import Message  # noqa: F401 - needed for Alembic
 from qna_agent.models import Base
 
@@ -23,12 +28,48 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Indexes only created on one dialect, see their ddl_if() in the models
+DIALECT_INDEXES = {
+    "ix_chats_metadata": "postgresql",
+    "ix_messages_search_vector": "postgresql",
+    **{f"ix_chats_metadata_{key}": "sqlite" for key in INDEXED_METADATA_KEYS},
+}
+
 
 def get_url() -> str:
     """Get database URL from settings."""
     return get_settings().database_url
 
 
+def get_version_table() -> str:
+    """Get the version table of the selected migration stream.
+
+    Opt-in streams (see the ``[partitioning]`` section of alembic.ini) keep
+    their own version table so the main stream never sees their revisions.
+    """
+    return config.get_main_option("version_table") or "alembic_version"
+
+
+def include_object(
+    obj: SchemaItem,
+    name: str | None,
+    type_: str,
+    reflected: bool,
+    compare_to: SchemaItem | None,
+) -> bool:
+    """Leave objects autogenerate cannot compare out of ``alembic check``.
+
+    The SQLite FTS5 index of messages (``messages_fts``, its shadow tables
+    and ``messages_fts_keys``) is created by raw DDL, and dialect-specific
+    indexes only exist on their dialect.
+    """
+    if type_ == "table" and name is not None and name.startswith("messages_fts"):
+        return False
+    if type_ == "index" and name in DIALECT_INDEXES:
+        return DIALECT_INDEXES[name] == context.get_context().dialect.name
+    return True
+
+
 def emit_postgres_timeouts() -> None:
     """Emit PostgreSQL timeout settings for offline mode.
 
@@ -46,6 +87,8 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        version_table=get_version_table(),
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -58,7 +101,9 @@ def set_postgres_timeouts(connection: Connection) -> None:
     dialect = connection.dialect.name
     if dialect == "postgresql":
         connection.execute(text(f"SET lock_timeout = '{POSTGRES_LOCK_TIMEOUT}'"))
-        connection.execute(text(f"SET statement_timeout = '{POSTGRES_STATEMENT_TIMEOUT}'"))
+        connection.execute(
+            text(f"SET statement_timeout = '{POSTGRES_STATEMENT_TIMEOUT}'")
+        )
 
 
 def do_run_migrations(connection: Connection) -> None:
@@ -68,6 +113,8 @@ def do_run_migrations(connection: Connection) -> None:
         connection=connection,
         target_metadata=target_metadata,
         transaction_per_migration=True,
+        version_table=get_version_table(),
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -0,0 +1,157 @@
+"""partition_messages_by_month
+
+Opt-in: converts ``messages`` into a table range-partitioned by month on
+``created_at`` so old months can be detached and archived by the retention
+worker. PostgreSQL only; a no-op on other databases.
+
+The table is copied into the new layout, so run this in a maintenance
+window. The primary key becomes ``(id, created_at)`` because it must
+include the partition key, and the foreign keys from ``message_jobs`` to
+``messages`` are dropped since they cannot reference ``id`` alone.
+
+Revision ID: f3c8d2a41b97
+Revises:
+Create Date: 2026-10-19 16:05:12.408813
+
+"""
+
+from alembic import op
+
+revision: str = "f3c8d2a41b97"
+down_revision: str | None = None
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+# Months created ahead of the current one; the retention worker keeps
+# extending this window
+PARTITIONS_AHEAD = 2
+
+CREATE_PARTITIONS_SQL = f"""
+    DO $$
+    DECLARE
+        month timestamptz := date_trunc(
+            'month',
+            coalesce((SELECT min(created_at) FROM messages_unpartitioned), now()),
+            'UTC'
+        );
+        last_month timestamptz := date_trunc('month', now(), 'UTC')
+            + interval '{PARTITIONS_AHEAD} months';
+    BEGIN
+        WHILE month <= last_month LOOP
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF messages FOR VALUES FROM (%L) TO (%L)',
+                'messages_p' || to_char(month AT TIME ZONE 'UTC', 'YYYYMM'),
+                month,
+                month + interval '1 month'
+            );
+            month := month + interval '1 month';
+        END LOOP;
+    END $$
+"""
+
+
+# Full-text index of the main migration chain, if it has been applied
+SEARCH_INDEX_SQL = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'messages' AND column_name = 'search_vector'
+    ) THEN
+        CREATE INDEX ix_messages_search_vector
+            ON messages USING gin (search_vector);
+    END IF;
+END
+$$
+"""
+
+
+def _use_postgres_sql() -> bool:
+    """Check if PostgreSQL SQL should be used.
+
+    Returns True for PostgreSQL or offline mode (for squawk-compatible SQL).
+    """
+    ctx = op.get_context()
+    return ctx.dialect.name == "postgresql" or ctx.as_sql
+
+
+def upgrade() -> None:
+    if not _use_postgres_sql():
+        return
+
+    # Copying the table can take longer than the default migration timeout
+    op.execute("SET LOCAL statement_timeout = 0")
+    op.execute("LOCK TABLE messages IN ACCESS EXCLUSIVE MODE")
+    op.execute(
+        "ALTER TABLE message_jobs DROP CONSTRAINT IF EXISTS "
+        "fk_message_jobs_user_message_id_messages"
+    )
+    op.execute(
+        "ALTER TABLE message_jobs DROP CONSTRAINT IF EXISTS "
+        "fk_message_jobs_assistant_message_id_messages"
+    )
+    op.execute("ALTER TABLE messages RENAME TO messages_unpartitioned")
+    op.execute("""
+        CREATE TABLE messages (
+            LIKE messages_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute(CREATE_PARTITIONS_SQL)
+    # Catches rows outside the created months until a partition exists
+    op.execute("CREATE TABLE messages_default PARTITION OF messages DEFAULT")
+    op.execute("INSERT INTO messages SELECT * FROM messages_unpartitioned")
+    op.execute("DROP TABLE messages_unpartitioned")
+
+    # Built after the copy, which is faster than maintaining them row by row
+    op.execute(
+        "ALTER TABLE messages ADD CONSTRAINT pk_messages PRIMARY KEY (id, created_at)"
+    )
+    op.execute("""
+        ALTER TABLE messages ADD CONSTRAINT fk_messages_chat_id_chats
+            FOREIGN KEY (chat_id) REFERENCES chats(id) ON DELETE CASCADE
+    """)
+    op.execute(
+        "CREATE INDEX ix_messages_chat_id_created_at "
+        "ON messages (chat_id, created_at, id)"
+    )
+    op.execute(SEARCH_INDEX_SQL)
+
+
+def downgrade() -> None:
+    if not _use_postgres_sql():
+        return
+
+    op.execute("SET LOCAL statement_timeout = 0")
+    op.execute("LOCK TABLE messages IN ACCESS EXCLUSIVE MODE")
+    op.execute("ALTER TABLE messages RENAME TO messages_partitioned")
+    op.execute("""
+        CREATE TABLE messages (
+            LIKE messages_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        )
+    """)
+    op.execute("INSERT INTO messages SELECT * FROM messages_partitioned")
+    op.execute("DROP TABLE messages_partitioned")
+
+    op.execute("ALTER TABLE messages ADD CONSTRAINT pk_messages PRIMARY KEY (id)")
+    op.execute("""
+        ALTER TABLE messages ADD CONSTRAINT fk_messages_chat_id_chats
+            FOREIGN KEY (chat_id) REFERENCES chats(id) ON DELETE CASCADE
+    """)
+    op.execute(
+        "CREATE INDEX ix_messages_chat_id_created_at "
+        "ON messages (chat_id, created_at, id)"
+    )
+    op.execute(SEARCH_INDEX_SQL)
+    # NOT VALID: jobs may reference messages archived while partitioned
+    op.execute("""
+        ALTER TABLE message_jobs
+            ADD CONSTRAINT fk_message_jobs_user_message_id_messages
+            FOREIGN KEY (user_message_id) REFERENCES messages(id)
+            ON DELETE CASCADE NOT VALID
+    """)
+    op.execute("""
+        ALTER TABLE message_jobs
+            ADD CONSTRAINT fk_message_jobs_assistant_message_id_messages
+            FOREIGN KEY (assistant_message_id) REFERENCES messages(id)
+            ON DELETE SET NULL NOT VALID
+    """)
@@ -0,0 +1,62 @@
+"""add_chat_metadata_indexes
+
+Revision ID: a4d2e8c61f35
+Revises: f1b6d93a7c20
+Create Date: 2026-10-19 21:37:50.264918
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "a4d2e8c61f35"
+down_revision: str | None = "f1b6d93a7c20"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+# Keys of qna_agent.chats.models.INDEXED_METADATA_KEYS, frozen for this migration
+SQLITE_INDEXED_KEYS = ("tenant_id", "user_id")
+
+
+def _use_postgres_sql() -> bool:
+    """Check if PostgreSQL SQL should be used.
+
+    Returns True for PostgreSQL or offline mode (for squawk-compatible SQL).
+    """
+    ctx = op.get_context()
+    return ctx.dialect.name == "postgresql" or ctx.as_sql
+
+
+def upgrade() -> None:
+    if _use_postgres_sql():
+        # jsonb supports containment and GIN indexing; rewrites the table
+        op.execute("SET LOCAL statement_timeout = 0")
+        op.execute(
+            "ALTER TABLE chats ALTER COLUMN metadata TYPE jsonb USING metadata::jsonb"
+        )
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chats_metadata "
+                "ON chats USING gin (metadata jsonb_path_ops)"
+            )
+    else:
+        for key in SQLITE_INDEXED_KEYS:
+            op.create_index(
+                f"ix_chats_metadata_{key}",
+                "chats",
+                [sa.text(f"json_extract(metadata, '$.{key}')")],
+                unique=False,
+            )
+
+
+def downgrade() -> None:
+    if _use_postgres_sql():
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chats_metadata")
+        op.execute("SET LOCAL statement_timeout = 0")
+        op.execute(
+            "ALTER TABLE chats ALTER COLUMN metadata TYPE json USING metadata::json"
+        )
+    else:
+        for key in SQLITE_INDEXED_KEYS:
+            op.drop_index(f"ix_chats_metadata_{key}", table_name="chats")
@@ -0,0 +1,117 @@
+"""add_message_jobs
+
+Revision ID: b41d7c9e2f10
+Revises: e67a105d2cdb
+Create Date: 2026-10-19 10:12:41.503218
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b41d7c9e2f10"
+down_revision: str | None = "e67a105d2cdb"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+# JobStatus of qna_agent.jobs.models, frozen for this migration: a
+# non-native enum stored by member name
+JOB_STATUS = sa.Enum(
+    "PENDING", "RUNNING", "COMPLETED", "FAILED", name="jobstatus", native_enum=False
+)
+
+
+def _use_postgres_sql() -> bool:
+    """Check if PostgreSQL SQL should be used.
+
+    Returns True for PostgreSQL or offline mode (for squawk-compatible SQL).
+    """
+    ctx = op.get_context()
+    return ctx.dialect.name == "postgresql" or ctx.as_sql
+
+
+def upgrade() -> None:
+    if _use_postgres_sql():
+        op.execute("""
+            CREATE TABLE IF NOT EXISTS message_jobs (
+                id UUID NOT NULL,
+                chat_id UUID NOT NULL,
+                user_message_id UUID NOT NULL,
+                assistant_message_id UUID,
+                status VARCHAR(9) NOT NULL,
+                attempts INTEGER NOT NULL,
+                error TEXT,
+                started_at TIMESTAMPTZ,
+                created_at TIMESTAMPTZ NOT NULL,
+                updated_at TIMESTAMPTZ NOT NULL,
+                CONSTRAINT pk_message_jobs PRIMARY KEY (id),
+                CONSTRAINT fk_message_jobs_chat_id_chats
+                    FOREIGN KEY (chat_id) REFERENCES chats(id) ON DELETE CASCADE,
+                CONSTRAINT fk_message_jobs_user_message_id_messages
+                    FOREIGN KEY (user_message_id) REFERENCES messages(id)
+                    ON DELETE CASCADE,
+                CONSTRAINT fk_message_jobs_assistant_message_id_messages
+                    FOREIGN KEY (assistant_message_id) REFERENCES messages(id)
+                    ON DELETE SET NULL
+            )
+        """)
+
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_jobs_chat_id "
+                "ON message_jobs (chat_id)"
+            )
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_jobs_status "
+                "ON message_jobs (status)"
+            )
+    else:
+        op.create_table(
+            "message_jobs",
+            sa.Column("id", sa.Uuid(), nullable=False),
+            sa.Column("chat_id", sa.Uuid(), nullable=False),
+            sa.Column("user_message_id", sa.Uuid(), nullable=False),
+            sa.Column("assistant_message_id", sa.Uuid(), nullable=True),
+            sa.Column("status", JOB_STATUS, nullable=False),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["chat_id"],
+                ["chats.id"],
+                name=op.f("fk_message_jobs_chat_id_chats"),
+                ondelete="CASCADE",
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_message_id"],
+                ["messages.id"],
+                name=op.f("fk_message_jobs_user_message_id_messages"),
+                ondelete="CASCADE",
+            ),
+            sa.ForeignKeyConstraint(
+                ["assistant_message_id"],
+                ["messages.id"],
+                name=op.f("fk_message_jobs_assistant_message_id_messages"),
+                ondelete="SET NULL",
+            ),
+            sa.PrimaryKeyConstraint("id", name=op.f("pk_message_jobs")),
+        )
+        op.create_index(
+            op.f("ix_message_jobs_chat_id"), "message_jobs", ["chat_id"], unique=False
+        )
+        op.create_index(
+            op.f("ix_message_jobs_status"), "message_jobs", ["status"], unique=False
+        )
+
+
+def downgrade() -> None:
+    if _use_postgres_sql():
+        op.execute("DROP INDEX IF EXISTS ix_message_jobs_status")
+        op.execute("DROP INDEX IF EXISTS ix_message_jobs_chat_id")
+        op.execute("DROP TABLE IF EXISTS message_jobs")
+    else:
+        op.drop_index(op.f("ix_message_jobs_status"), table_name="message_jobs")
+        op.drop_index(op.f("ix_message_jobs_chat_id"), table_name="message_jobs")
+        op.drop_table("message_jobs")
@@ -0,0 +1,151 @@
+"""compress_message_payloads
+
+Revision ID: e9a4c7b25d18
+Revises: d7f3b1a06c52
+Create Date: 2026-10-19 18:20:41.118204
+
+"""
+
+from collections.abc import Callable
+from compression import zstd
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e9a4c7b25d18"
+down_revision: str | None = "d7f3b1a06c52"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+# Payload format of qna_agent.types, frozen for this migration
+PLAIN = b"\x00"
+ZSTD = b"\x01"
+THRESHOLD = 1024
+LEVEL = 3
+BATCH_SIZE = 500
+
+
+def _use_postgres_sql() -> bool:
+    """Check if PostgreSQL SQL should be used.
+
+    Returns True for PostgreSQL or offline mode (for squawk-compatible SQL).
+    """
+    ctx = op.get_context()
+    return ctx.dialect.name == "postgresql" or ctx.as_sql
+
+
+def _pack(data: bytes) -> bytes:
+    """Encode a payload, compressing it above the threshold."""
+    if len(data) >= THRESHOLD:
+        compressed = zstd.compress(data, level=LEVEL)
+        if len(compressed) < len(data):
+            return ZSTD + compressed
+    return PLAIN + data
+
+
+def _unpack(value: bytes) -> bytes:
+    """Decode a payload produced by _pack."""
+    if value[:1] == ZSTD:
+        return zstd.decompress(value[1:])
+    return value[1:]
+
+
+def _as_bytes(value: str | bytes) -> bytes:
+    """Raw UTF-8 payload of a text value or a plain binary payload."""
+    if isinstance(value, str):
+        return value.encode()
+    return _unpack(bytes(value))
+
+
+def _rewrite(
+    where: str,
+    convert: Callable[[str | bytes], object],
+) -> None:
+    """Rewrite payload columns of the matching messages in batches.
+
+    Skipped in offline mode: rows left as plain payloads stay readable.
+    """
+    if op.get_context().as_sql:
+        return
+
+    connection = op.get_bind()
+    query = f"SELECT id, content, tool_calls FROM messages WHERE ({where})"
+    first = sa.text(f"{query} ORDER BY id LIMIT :limit")
+    following = sa.text(f"{query} AND id > :after ORDER BY id LIMIT :limit")
+    update = sa.text(
+        "UPDATE messages SET content = :content, tool_calls = :tool_calls "
+        "WHERE id = :id"
+    )
+    rows = connection.execute(first, {"limit": BATCH_SIZE}).all()
+    while rows:
+        connection.execute(
+            update,
+            [
+                {
+                    "id": row.id,
+                    "content": convert(row.content),
+                    "tool_calls": None
+                    if row.tool_calls is None
+                    else convert(row.tool_calls),
+                }
+                for row in rows
+            ],
+        )
+        rows = connection.execute(
+            following, {"after": rows[-1].id, "limit": BATCH_SIZE}
+        ).all()
+
+
+def upgrade() -> None:
+    if _use_postgres_sql():
+        op.execute("SET LOCAL statement_timeout = 0")
+        op.execute(
+            "ALTER TABLE messages "
+            "ALTER COLUMN content TYPE bytea "
+            "USING '\\x00'::bytea || convert_to(content, 'UTF8'), "
+            "ALTER COLUMN tool_calls TYPE bytea "
+            "USING '\\x00'::bytea || convert_to(tool_calls::text, 'UTF8')"
+        )
+        _rewrite(
+            f"octet_length(content) > {THRESHOLD} "
+            f"OR octet_length(tool_calls) > {THRESHOLD}",
+            lambda value: _pack(_as_bytes(value)),
+        )
+    else:
+        # SQLite stores any value in any column, so payloads are rewritten
+        # before the table is rebuilt with the new column types
+        _rewrite(
+            "typeof(content) = 'text' OR typeof(tool_calls) = 'text'",
+            lambda value: _pack(_as_bytes(value)),
+        )
+        with op.batch_alter_table("messages") as batch_op:
+            batch_op.alter_column(
+                "content", type_=sa.LargeBinary(), existing_nullable=False
+            )
+            batch_op.alter_column(
+                "tool_calls", type_=sa.LargeBinary(), existing_nullable=True
+            )
+
+
+def downgrade() -> None:
+    if _use_postgres_sql():
+        op.execute("SET LOCAL statement_timeout = 0")
+        _rewrite(
+            f"get_byte(content, 0) = {ZSTD[0]} OR get_byte(tool_calls, 0) = {ZSTD[0]}",
+            lambda value: PLAIN + _as_bytes(value),
+        )
+        op.execute(
+            "ALTER TABLE messages "
+            "ALTER COLUMN content TYPE text "
+            "USING convert_from(substring(content FROM 2), 'UTF8'), "
+            "ALTER COLUMN tool_calls TYPE json "
+            "USING convert_from(substring(tool_calls FROM 2), 'UTF8')::json"
+        )
+    else:
+        _rewrite(
+            "typeof(content) = 'blob' OR typeof(tool_calls) = 'blob'",
+            lambda value: _as_bytes(value).decode(),
+        )
+        with op.batch_alter_table("messages") as batch_op:
+            batch_op.alter_column("content", type_=sa.Text(), existing_nullable=False)
+            batch_op.alter_column("tool_calls", type_=sa.JSON(), existing_nullable=True)
@@ -0,0 +1,240 @@
+"""add_message_search
+
+Revision ID: f1b6d93a7c20
+Revises: e9a4c7b25d18
+Create Date: 2026-10-19 20:04:12.503817
+
+"""
+
+import sqlite3
+from compression import zstd
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f1b6d93a7c20"
+down_revision: str | None = "e9a4c7b25d18"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+BATCH_SIZE = 500
+
+# Payload format of qna_agent.types, frozen for this migration
+ZSTD = b"\x01"
+
+# Contentless FTS5 tables support deletes since SQLite 3.43; the documents
+# are then only indexed, otherwise they are kept in messages.search_vector.
+# Documents are keyed by messages_fts_keys since VACUUM may renumber the
+# implicit rowids of messages.
+SQLITE_CONTENTLESS = sqlite3.sqlite_version_info >= (3, 43, 0)
+
+SQLITE_FTS_KEYS = """
+    CREATE TABLE IF NOT EXISTS messages_fts_keys (
+        id INTEGER PRIMARY KEY,
+        message_id CHAR(32) NOT NULL UNIQUE
+    )
+    """
+
+SQLITE_FTS_CONTENTLESS = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        search_vector, content='', contentless_delete=1
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages
+    WHEN new.search_vector IS NOT NULL
+    BEGIN
+        INSERT INTO messages_fts_keys (message_id) VALUES (new.id);
+        INSERT INTO messages_fts (rowid, search_vector)
+        SELECT id, new.search_vector FROM messages_fts_keys
+        WHERE message_id = new.id;
+        UPDATE messages SET search_vector = NULL WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages
+    BEGIN
+        DELETE FROM messages_fts WHERE rowid = (
+            SELECT id FROM messages_fts_keys WHERE message_id = old.id
+        );
+        DELETE FROM messages_fts_keys WHERE message_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_update
+    AFTER UPDATE OF search_vector ON messages
+    WHEN new.search_vector IS NOT NULL
+    BEGIN
+        INSERT OR IGNORE INTO messages_fts_keys (message_id) VALUES (new.id);
+        DELETE FROM messages_fts WHERE rowid = (
+            SELECT id FROM messages_fts_keys WHERE message_id = new.id
+        );
+        INSERT INTO messages_fts (rowid, search_vector)
+        SELECT id, new.search_vector FROM messages_fts_keys
+        WHERE message_id = new.id;
+        UPDATE messages SET search_vector = NULL WHERE rowid = new.rowid;
+    END
+    """,
+)
+
+SQLITE_FTS_EXTERNAL = (
+    """
+    CREATE VIEW IF NOT EXISTS messages_fts_documents AS
+    SELECT messages_fts_keys.id, messages.search_vector
+    FROM messages_fts_keys
+    JOIN messages ON messages.id = messages_fts_keys.message_id
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        search_vector, content='messages_fts_documents', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages
+    BEGIN
+        INSERT INTO messages_fts_keys (message_id) VALUES (new.id);
+        INSERT INTO messages_fts (rowid, search_vector)
+        SELECT id, new.search_vector FROM messages_fts_keys
+        WHERE message_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages
+    BEGIN
+        INSERT INTO messages_fts (messages_fts, rowid, search_vector)
+        SELECT 'delete', id, old.search_vector FROM messages_fts_keys
+        WHERE message_id = old.id;
+        DELETE FROM messages_fts_keys WHERE message_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_update
+    AFTER UPDATE OF search_vector ON messages
+    BEGIN
+        INSERT INTO messages_fts (messages_fts, rowid, search_vector)
+        SELECT 'delete', id, old.search_vector FROM messages_fts_keys
+        WHERE message_id = old.id;
+        INSERT INTO messages_fts (rowid, search_vector)
+        SELECT id, new.search_vector FROM messages_fts_keys
+        WHERE message_id = new.id;
+    END
+    """,
+)
+
+
+def _use_postgres_sql() -> bool:
+    """Check if PostgreSQL SQL should be used.
+
+    Returns True for PostgreSQL or offline mode (for squawk-compatible SQL).
+    """
+    ctx = op.get_context()
+    return ctx.dialect.name == "postgresql" or ctx.as_sql
+
+
+def _is_partitioned() -> bool:
+    """Whether messages was partitioned by the opt-in partitioning migration.
+
+    Indexes cannot be built concurrently on a partitioned table.
+    """
+    if op.get_context().as_sql:
+        return False
+    return bool(
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = 'messages'::regclass)"
+            )
+        )
+        .scalar()
+    )
+
+
+def _text(payload: bytes) -> str:
+    """Plain content of a stored message payload."""
+    header, data = payload[:1], payload[1:]
+    if header == ZSTD:
+        data = zstd.decompress(data)
+    return data.decode()
+
+
+def _backfill(write: str) -> None:
+    """Index existing messages in batches.
+
+    ``write`` is the statement indexing the message ``:id`` from its
+    ``:text``. Skipped in offline mode, where existing messages stay
+    unsearchable.
+    """
+    if op.get_context().as_sql:
+        return
+
+    connection = op.get_bind()
+    query = "SELECT id, content FROM messages WHERE search_vector IS NULL"
+    first = sa.text(f"{query} ORDER BY id LIMIT :limit")
+    following = sa.text(f"{query} AND id > :after ORDER BY id LIMIT :limit")
+    index = sa.text(write)
+    rows = connection.execute(first, {"limit": BATCH_SIZE}).all()
+    while rows:
+        connection.execute(
+            index,
+            [{"id": row.id, "text": _text(bytes(row.content))} for row in rows],
+        )
+        rows = connection.execute(
+            following, {"after": rows[-1].id, "limit": BATCH_SIZE}
+        ).all()
+
+
+def upgrade() -> None:
+    if _use_postgres_sql():
+        op.execute("SET LOCAL statement_timeout = 0")
+        op.execute(
+            "ALTER TABLE messages ADD COLUMN IF NOT EXISTS search_vector tsvector"
+        )
+        _backfill(
+            "UPDATE messages SET search_vector = to_tsvector('simple', :text) "
+            "WHERE id = :id"
+        )
+        if _is_partitioned():
+            op.execute(
+                "CREATE INDEX IF NOT EXISTS ix_messages_search_vector "
+                "ON messages USING gin (search_vector)"
+            )
+        else:
+            with op.get_context().autocommit_block():
+                op.execute(
+                    "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                    "ix_messages_search_vector "
+                    "ON messages USING gin (search_vector)"
+                )
+    else:
+        op.add_column("messages", sa.Column("search_vector", sa.Text()))
+        op.execute(SQLITE_FTS_KEYS)
+        op.execute("INSERT INTO messages_fts_keys (message_id) SELECT id FROM messages")
+        if SQLITE_CONTENTLESS:
+            for statement in SQLITE_FTS_CONTENTLESS:
+                op.execute(statement)
+            _backfill(
+                "INSERT INTO messages_fts (rowid, search_vector) "
+                "SELECT id, :text FROM messages_fts_keys WHERE message_id = :id"
+            )
+        else:
+            _backfill("UPDATE messages SET search_vector = :text WHERE id = :id")
+            for statement in SQLITE_FTS_EXTERNAL:
+                op.execute(statement)
+            op.execute("INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if _use_postgres_sql():
+        # Also drops ix_messages_search_vector
+        op.execute("ALTER TABLE messages DROP COLUMN IF EXISTS search_vector")
+    else:
+        op.execute("DROP TRIGGER IF EXISTS messages_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS messages_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS messages_fts_insert")
+        op.execute("DROP TABLE IF EXISTS messages_fts")
+        op.execute("DROP VIEW IF EXISTS messages_fts_documents")
+        op.execute("DROP TABLE IF EXISTS messages_fts_keys")
+        with op.batch_alter_table("messages") as batch_op:
+            batch_op.drop_column("search_vector")
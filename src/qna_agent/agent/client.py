@@ -1,7 +1,9 @@
 """LiteLLM client wrapper with Langfuse integration."""
 
+import asyncio
 import os
-from typing import Any
+import time
+from typing import Any, cast
 
 import litellm
 from litellm import ModelResponse, acompletion  # type: ignore[attr-defined]
@@ -9,6 +11,51 @@ from loguru import logger
 
 from qna_agent.agent.config import get_agent_settings
 from qna_agent.agent.exceptions import LLMConnectionError, LLMResponseError
+from qna_agent.metrics import ratio, registry
+
+LLM_REQUESTS = registry.counter(
+    "llm_requests_total",
+    "Chat completion calls made by the agent",
+)
+LLM_HEDGED_REQUESTS = registry.counter(
+    "llm_hedged_requests_total",
+    "Chat completion calls that fired a hedge request",
+)
+LLM_HEDGE_WINS = registry.counter(
+    "llm_hedge_wins_total",
+    "Hedged calls where the hedge request finished first",
+)
+LLM_REQUEST_DURATION = registry.histogram(
+    "llm_request_duration_seconds",
+    "Latency of individual LLM requests, including cancelled hedge losers",
+)
+LLM_PROMPT_TOKENS = registry.counter(
+    "llm_prompt_tokens_total",
+    "Prompt tokens reported by the provider",
+)
+LLM_CACHED_PROMPT_TOKENS = registry.counter(
+    "llm_cached_prompt_tokens_total",
+    "Prompt tokens served from the provider's prompt cache",
+)
+LLM_CACHE_WRITE_TOKENS = registry.counter(
+    "llm_cache_write_tokens_total",
+    "Prompt tokens written to the provider's prompt cache",
+)
+registry.gauge(
+    "llm_prompt_cache_hit_rate",
+    "Share of prompt tokens served from the prompt cache",
+    ratio(LLM_CACHED_PROMPT_TOKENS, LLM_PROMPT_TOKENS),
+)
+registry.gauge(
+    "llm_hedge_rate",
+    "Share of completion calls that were hedged",
+    ratio(LLM_HEDGED_REQUESTS, LLM_REQUESTS),
+)
+registry.gauge(
+    "llm_hedge_win_rate",
+    "Share of hedged calls won by the hedge request",
+    ratio(LLM_HEDGE_WINS, LLM_HEDGED_REQUESTS),
+)
 
 
 class LLMClient:
@@ -41,6 +88,11 @@ class LLMClient:
     ) -> dict[str, Any]:
         """Send a chat completion request to the LLM.
 
+        Cache-control hints are attached to the system prompt and the latest
+        message for providers that support them. When hedging is enabled and
+        the request is slower than the configured latency percentile, a
+        duplicate request is raced against it.
+
         Args:
             messages: List of messages in OpenAI format
             tools: Optional list of tool definitions
@@ -54,6 +106,9 @@ class LLMClient:
             LLMResponseError: If LLM returns an invalid response
         """
         try:
+            if self._use_cache_hints():
+                messages = _with_cache_hints(messages)
+
             kwargs: dict[str, Any] = {
                 "model": self._settings.litellm_model,
                 "messages": messages,
@@ -74,12 +129,18 @@ class LLMClient:
                     "generation_name": "qna-agent",
                 }
 
-            response: ModelResponse = await acompletion(**kwargs)  # type: ignore[assignment]
+            LLM_REQUESTS.inc()
+            if self._settings.llm_hedge_enabled:
+                response = await self._hedged_completion(kwargs)
+            else:
+                response = await self._timed_completion(kwargs)
 
             if not response or not response.choices:
                 raise LLMResponseError("Empty response from LLM")
 
-            return response.model_dump()
+            result = response.model_dump()
+            _record_usage(result.get("usage"))
+            return result
 
         except litellm.exceptions.APIConnectionError as e:
             logger.error(f"LLM connection error: {e}")
@@ -87,3 +148,117 @@ class LLMClient:
         except litellm.exceptions.APIError as e:
             logger.error(f"LLM API error: {e}")
             raise LLMResponseError(f"LLM API error: {e}") from e
+
+    async def _timed_completion(self, kwargs: dict[str, Any]) -> ModelResponse:
+        """Run a single completion request and record its latency.
+
+        A request cancelled after losing a hedge race is recorded with the
+        time it had run so far. Leaving it out would keep the slow requests
+        out of the percentile the hedge delay is based on, lowering the
+        delay and hedging ever more requests.
+        """
+        started = time.perf_counter()
+        try:
+            response: ModelResponse = await acompletion(**kwargs)  # type: ignore[assignment]
+        except asyncio.CancelledError:
+            LLM_REQUEST_DURATION.observe(time.perf_counter() - started)
+            raise
+        LLM_REQUEST_DURATION.observe(time.perf_counter() - started)
+        return response
+
+    async def _hedged_completion(self, kwargs: dict[str, Any]) -> ModelResponse:
+        """Race a hedge request against a primary that exceeds the hedge delay.
+
+        The first successful response wins and the other request is cancelled.
+        If both fail, the primary request's error is raised.
+        """
+        primary = asyncio.create_task(self._timed_completion(kwargs))
+        tasks: set[asyncio.Task[ModelResponse]] = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_delay())
+            if primary in done:
+                return primary.result()
+
+            hedge_kwargs = dict(kwargs)
+            if self._settings.llm_hedge_api_base:
+                hedge_kwargs["api_base"] = self._settings.llm_hedge_api_base
+            hedge = asyncio.create_task(self._timed_completion(hedge_kwargs))
+            tasks.add(hedge)
+            LLM_HEDGED_REQUESTS.inc()
+            logger.debug("LLM request exceeded hedge delay, sending hedge request")
+
+            pending: set[asyncio.Task[ModelResponse]] = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            LLM_HEDGE_WINS.inc()
+                        return task.result()
+
+            raise cast(BaseException, primary.exception())
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _use_cache_hints(self) -> bool:
+        """Whether to attach Anthropic-style cache_control hints."""
+        match self._settings.llm_prompt_cache_hints:
+            case "always":
+                return True
+            case "never":
+                return False
+            case _:
+                model = self._settings.litellm_model.lower()
+                return "anthropic" in model or "claude" in model
+
+    def _hedge_delay(self) -> float:
+        """Delay before hedging, based on observed latency percentile."""
+        floor = self._settings.llm_hedge_min_delay
+        if LLM_REQUEST_DURATION.count < self._settings.llm_hedge_min_samples:
+            return floor
+        observed = LLM_REQUEST_DURATION.percentile(self._settings.llm_hedge_percentile)
+        return max(floor, observed or 0.0)
+
+
+def _with_cache_hints(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark the static prefix and the latest message as cache breakpoints.
+
+    The first breakpoint covers the tools and system prompt shared by all
+    requests; the second moves with the conversation so each agent-loop
+    iteration reuses the history cached by the previous one.
+    """
+    hinted = list(messages)
+    for index in sorted({0, len(hinted) - 1}):
+        hinted[index] = _with_cache_control(hinted[index])
+    return hinted
+
+
+def _with_cache_control(message: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of the message with cache_control on its last text block."""
+    content = message.get("content")
+    if isinstance(content, str) and content:
+        blocks: list[dict[str, Any]] = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content:
+        blocks = [dict(block) for block in cast(list[dict[str, Any]], content)]
+    else:
+        return message
+
+    blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return {**message, "content": blocks}
+
+
+def _record_usage(usage: dict[str, Any] | None) -> None:
+    """Record prompt and cached-prompt token counts from a response."""
+    if not usage:
+        return
+
+    details = cast(dict[str, Any], usage.get("prompt_tokens_details") or {})
+    cached: int = (
+        details.get("cached_tokens") or usage.get("cache_read_input_tokens") or 0
+    )
+    LLM_PROMPT_TOKENS.inc(usage.get("prompt_tokens") or 0)
+    LLM_CACHED_PROMPT_TOKENS.inc(cached)
+    LLM_CACHE_WRITE_TOKENS.inc(usage.get("cache_creation_input_tokens") or 0)
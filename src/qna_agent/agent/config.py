@@ -1,6 +1,7 @@
 """Agent-specific configuration."""
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -30,6 +31,22 @@ class AgentSettings(BaseSettings):
     temperature: float = 0.7
     max_tokens: int = 4096
 
+    # Share one agent run among concurrent requests with identical history;
+    # shared runs are traced without a chat ID
+    agent_coalesce_requests: bool = False
+
+    # Hedged requests: fire a duplicate request when the first one is slower
+    # than the given latency percentile (never earlier than the minimum delay)
+    llm_hedge_enabled: bool = False
+    llm_hedge_percentile: float = 0.95
+    llm_hedge_min_delay: float = 1.0
+    llm_hedge_min_samples: int = 20
+    llm_hedge_api_base: str = ""
+
+    # Prompt caching: "auto" sends cache_control hints only to providers that
+    # accept them (Anthropic-style); OpenAI-style providers cache automatically
+    llm_prompt_cache_hints: Literal["auto", "always", "never"] = "auto"
+
 
 @lru_cache
 def get_agent_settings() -> AgentSettings:
@@ -1,7 +1,9 @@
 """Agent service with tool calling loop."""
 
 import asyncio
+import hashlib
 import json
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
@@ -21,8 +23,14 @@ from qna_agent.agent.exceptions import (
     MaxIterationsExceededError,
     ToolExecutionError,
 )
-from qna_agent.agent.tools import SYSTEM_PROMPT, TOOLS
+from qna_agent.agent.tools import SYSTEM_MESSAGE, TOOLS
 from qna_agent.knowledge.service import KnowledgeService
+from qna_agent.metrics import registry
+
+AGENT_COALESCED_REQUESTS = registry.counter(
+    "agent_coalesced_requests_total",
+    "Agent requests served by joining an identical in-flight run",
+)
 
 
 @dataclass
@@ -33,6 +41,48 @@ class AgentResponse:
     tool_calls: list[dict[str, Any]] | None = None
 
 
+class RequestCoalescer:
+    """Single-flight deduplication of concurrent agent runs.
+
+    Callers with the same key share one in-flight run and all receive its
+    result (or its exception). A waiter being cancelled does not cancel the
+    shared run for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[AgentResponse]] = {}
+
+    async def run(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[AgentResponse]],
+    ) -> AgentResponse:
+        """Run fn, or join the in-flight run registered under the same key."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            AGENT_COALESCED_REQUESTS.inc()
+            logger.debug(f"Joining in-flight agent run {key[:12]}")
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[AgentResponse]) -> None:
+        """Drop a finished run from the in-flight table."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+
+_coalescer = RequestCoalescer()
+
+
+def _context_key(messages: list[dict[str, Any]]) -> str:
+    """Hash of the effective LLM context for a request."""
+    payload = json.dumps(messages, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 class AgentService:
     """Agent service with tool calling capabilities."""
 
@@ -52,6 +102,11 @@ class AgentService:
     ) -> AgentResponse:
         """Process a message through the agent with tool calling.
 
+        With coalescing enabled, concurrent calls with identical history
+        (for example the same first-turn question asked by many users) share
+        a single run. It answers several chats, so it is traced without a
+        chat ID.
+
         Args:
             chat_id: The chat ID for tracing
             messages: Chat history in OpenAI format
@@ -62,10 +117,24 @@ class AgentService:
         Raises:
             MaxIterationsExceededError: If max tool iterations exceeded
         """
-        full_messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            *messages,
-        ]
+        if not self._settings.agent_coalesce_requests:
+            return await self._run(chat_id, messages)
+
+        return await _coalescer.run(
+            _context_key(messages),
+            lambda: self._run(None, messages),
+        )
+
+    async def _run(
+        self,
+        chat_id: UUID | None,
+        messages: list[dict[str, Any]],
+    ) -> AgentResponse:
+        """Run the tool calling loop until the model produces an answer.
+
+        LLM calls are traced under ``chat_id``, if given.
+        """
+        full_messages = [SYSTEM_MESSAGE, *messages]
 
         all_tool_calls: list[dict[str, Any]] = []
 
@@ -76,7 +145,7 @@ class AgentService:
                 response = await self._llm.chat_completion(
                     messages=full_messages,
                     tools=TOOLS,
-                    chat_id=str(chat_id),
+                    chat_id=str(chat_id) if chat_id else None,
                 )
             except AuthenticationError as e:
                 logger.error(f"LLM authentication failed: {e}")
@@ -104,7 +173,7 @@ class AgentService:
                 tool_calls = message.get("tool_calls", [])
                 all_tool_calls.extend(tool_calls)
 
-                full_messages.append(message)
+                full_messages.append(_assistant_turn(message, tool_calls))
 
                 tool_results = await self._execute_tools(tool_calls)
                 full_messages.extend(tool_results)
@@ -172,3 +241,19 @@ class AgentService:
 
             case _:
                 raise ToolExecutionError(name, "Unknown tool")
+
+
+def _assistant_turn(
+    message: dict[str, Any],
+    tool_calls: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Keep only the fields the next request needs from an assistant message.
+
+    Provider-specific extras vary between responses and would otherwise make
+    the resent history differ byte-for-byte, defeating prompt caching.
+    """
+    return {
+        "role": "assistant",
+        "content": message.get("content"),
+        "tool_calls": tool_calls,
+    }
@@ -71,3 +71,8 @@ Available tools:
 - list_knowledge_files: See all available documents
 - read_knowledge_file: Read a specific document's contents
 """
+
+# Static request prefix. Kept as module constants so every request, and every
+# iteration of the agent loop, starts with a byte-identical prefix that the
+# provider's prompt cache can reuse.
+SYSTEM_MESSAGE: dict[str, Any] = {"role": "system", "content": SYSTEM_PROMPT}
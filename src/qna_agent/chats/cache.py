@@ -0,0 +1,76 @@
+"""In-process cache of chats known to exist."""
+
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from qna_agent.chats.config import get_chat_settings
+from qna_agent.metrics import ratio, registry
+
+CHAT_CACHE_HITS = registry.counter(
+    "chat_cache_hits_total",
+    "Chat existence checks answered from the in-process cache",
+)
+CHAT_CACHE_LOOKUPS = registry.counter(
+    "chat_cache_lookups_total",
+    "Chat existence checks",
+)
+registry.gauge(
+    "chat_cache_hit_rate",
+    "Share of chat existence checks answered from the cache",
+    ratio(CHAT_CACHE_HITS, CHAT_CACHE_LOOKUPS),
+)
+
+
+class ChatExistenceCache:
+    """Size-bounded LRU of chat IDs that exist, each kept for a short TTL.
+
+    Only existence is cached: endpoints returning chat details still read
+    the row so counters and validators are never stale. Deleting a chat
+    evicts it from this process; other processes notice within the TTL.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._expiry: OrderedDict[UUID, float] = OrderedDict()
+
+    def __contains__(self, chat_id: object) -> bool:
+        CHAT_CACHE_LOOKUPS.inc()
+        if not isinstance(chat_id, UUID):
+            return False
+        expiry = self._expiry.get(chat_id)
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del self._expiry[chat_id]
+            return False
+        self._expiry.move_to_end(chat_id)
+        CHAT_CACHE_HITS.inc()
+        return True
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def add(self, chat_id: UUID) -> None:
+        """Remember that a chat exists."""
+        if self._ttl <= 0:
+            return
+        self._expiry[chat_id] = time.monotonic() + self._ttl
+        self._expiry.move_to_end(chat_id)
+        while len(self._expiry) > self._max_size:
+            self._expiry.popitem(last=False)
+
+    def discard(self, chat_id: UUID) -> None:
+        """Forget a chat, e.g. because it was deleted."""
+        self._expiry.pop(chat_id, None)
+
+    def clear(self) -> None:
+        """Forget all chats."""
+        self._expiry.clear()
+
+
+chat_cache = ChatExistenceCache(
+    ttl=get_chat_settings().chat_cache_ttl,
+    max_size=get_chat_settings().chat_cache_size,
+)
@@ -0,0 +1,27 @@
+"""Chat domain configuration."""
+
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ChatSettings(BaseSettings):
+    """Chat settings loaded from environment variables."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env.local",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    # Seconds a chat known to exist skips the existence query; 0 disables.
+    # Deletes on other workers are noticed within this window at the latest
+    chat_cache_ttl: float = 5.0
+    chat_cache_size: int = 10_000
+
+
+@lru_cache
+def get_chat_settings() -> ChatSettings:
+    """Get cached chat settings instance."""
+    return ChatSettings()
@@ -3,12 +3,15 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, Path
+from fastapi import Depends, Path, Query
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from qna_agent.chats.exceptions import InvalidMetadataFilterError
 from qna_agent.chats.models import Chat
+from qna_agent.chats.schemas import MetadataValue, metadata_filter_adapter
 from qna_agent.chats.service import ChatService
-from qna_agent.database import get_session
+from qna_agent.database import get_read_session, get_session
 
 
 async def get_chat_service(
@@ -18,9 +21,49 @@ async def get_chat_service(
     return ChatService(session)
 
 
+async def get_chat_read_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> ChatService:
+    """Dependency to get chat service for read-only endpoints."""
+    return ChatService(session)
+
+
 async def valid_chat_id(
     chat_id: Annotated[UUID, Path(description="Chat ID")],
     service: Annotated[ChatService, Depends(get_chat_service)],
+) -> UUID:
+    """Dependency that validates chat exists and returns its ID.
+
+    Existence of recently seen chats is cached, so this usually costs no
+    query; use ``valid_chat_id_for_read`` when the chat row is needed.
+    """
+    await service.ensure_exists(chat_id)
+    return chat_id
+
+
+async def valid_chat_id_for_read(
+    chat_id: Annotated[UUID, Path(description="Chat ID")],
+    service: Annotated[ChatService, Depends(get_chat_read_service)],
 ) -> Chat:
-    """Dependency that validates chat exists and returns it."""
+    """Dependency that validates chat exists, for read-only endpoints."""
     return await service.get(chat_id)
+
+
+async def metadata_filter(
+    metadata: Annotated[
+        str | None,
+        Query(
+            description=(
+                "JSON object of top-level metadata values chats must have, "
+                'e.g. `{"tenant_id": "acme"}`'
+            ),
+        ),
+    ] = None,
+) -> dict[str, MetadataValue] | None:
+    """Dependency that parses the metadata filter of chat listings."""
+    if metadata is None:
+        return None
+    try:
+        return metadata_filter_adapter.validate_json(metadata)
+    except PydanticValidationError as e:
+        raise InvalidMetadataFilterError(metadata) from e
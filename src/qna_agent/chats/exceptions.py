@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from qna_agent.exceptions import NotFoundError
+from qna_agent.exceptions import NotFoundError, ValidationError
 
 
 class ChatNotFoundError(NotFoundError):
@@ -11,3 +11,14 @@ class ChatNotFoundError(NotFoundError):
     def __init__(self, chat_id: UUID) -> None:
         self.chat_id = chat_id
         super().__init__(f"Chat {chat_id} not found")
+
+
+class InvalidMetadataFilterError(ValidationError):
+    """Raised when a metadata filter is not a valid JSON object of scalars."""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+        super().__init__(
+            f"Invalid metadata filter: {value}. Expected a JSON object of up "
+            "to 10 string, number or boolean values with word-character keys"
+        )
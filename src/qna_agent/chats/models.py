@@ -1,15 +1,21 @@
 """Chat SQLAlchemy model."""
 
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, Text
+from sqlalchemy import JSON, DateTime, Index, Integer, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from qna_agent.models import Base, TimestampMixin, UUIDMixin
+from qna_agent.models import MAPPER_ARGS, Base, TimestampMixin, UUIDMixin
 
 if TYPE_CHECKING:
     from qna_agent.messages.models import Message
 
+# Metadata keys with an expression index on SQLite, where equality filters
+# on other keys scan the table. PostgreSQL indexes all keys with GIN.
+INDEXED_METADATA_KEYS = ("tenant_id", "user_id")
+
 
 class Chat(Base, UUIDMixin, TimestampMixin):
     """Chat session model."""
@@ -17,17 +23,51 @@ class Chat(Base, UUIDMixin, TimestampMixin):
     title: Mapped[str | None] = mapped_column(Text, nullable=True)
     metadata_: Mapped[dict[str, Any]] = mapped_column(
         "metadata",
-        JSON,
+        JSON().with_variant(JSONB(), "postgresql"),
         default=dict,
         nullable=False,
     )
+    # Denormalized from messages, updated in the same transaction as inserts
+    message_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    last_message_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
 
     messages: Mapped[list[Message]] = relationship(
         "Message",
         back_populates="chat",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
+    )
+
+    __mapper_args__ = MAPPER_ARGS
+    __table_args__ = (
+        # SQLite sorts NULLs last when descending; the PostgreSQL migration
+        # declares NULLS LAST explicitly to match the activity ordering
+        Index("ix_chats_last_message_at", last_message_at.desc()),
+        # Serves containment (@>) filters on any metadata key
+        Index(
+            "ix_chats_metadata",
+            metadata_,
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     def __repr__(self) -> str:
         return f"<Chat(id={self.id}, title={self.title!r})>"
+
+
+# Serve equality filters on the common keys on SQLite
+for key in INDEXED_METADATA_KEYS:
+    Index(
+        f"ix_chats_metadata_{key}",
+        func.json_extract(Chat.__table__.c.metadata, f"$.{key}"),
+    ).ddl_if(dialect="sqlite")
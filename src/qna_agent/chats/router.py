@@ -1,20 +1,29 @@
 """Chat API router."""
 
 import math
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
-from qna_agent.chats.dependencies import get_chat_service, valid_chat_id
+from qna_agent.chats.dependencies import (
+    get_chat_read_service,
+    get_chat_service,
+    metadata_filter,
+    valid_chat_id_for_read,
+)
 from qna_agent.chats.models import Chat
 from qna_agent.chats.schemas import (
+    ChatBatchDelete,
+    ChatBatchDeleteResponse,
     ChatCreate,
     ChatListResponse,
+    ChatOrdering,
     ChatResponse,
     ChatUpdate,
 )
 from qna_agent.chats.service import ChatService
+from qna_agent.conditional import make_etag, not_modified
 
 router = APIRouter(prefix="/chats", tags=["chats"])
 
@@ -38,15 +47,28 @@ async def create_chat(
     "",
     response_model=ChatListResponse,
     summary="List all chats",
-    description="Get a paginated list of all chat sessions.",
+    description=(
+        "Get a paginated list of chat sessions, optionally only those whose "
+        "metadata has the values of the `metadata` JSON object."
+    ),
 )
 async def list_chats(
-    service: Annotated[ChatService, Depends(get_chat_service)],
+    service: Annotated[ChatService, Depends(get_chat_read_service)],
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
+    order_by: Annotated[
+        ChatOrdering,
+        Query(description="Sort by creation time or by latest message"),
+    ] = ChatOrdering.CREATED_AT,
+    metadata: Annotated[dict[str, Any] | None, Depends(metadata_filter)] = None,
 ) -> ChatListResponse:
     """List all chat sessions with pagination."""
-    chats, total = await service.list(page=page, page_size=page_size)
+    chats, total = await service.list(
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        metadata=metadata,
+    )
     pages = math.ceil(total / page_size) if total > 0 else 0
 
     return ChatListResponse(
@@ -62,12 +84,21 @@ async def list_chats(
     "/{chat_id}",
     response_model=ChatResponse,
     summary="Get chat details",
-    description="Get details of a specific chat session.",
+    description=(
+        "Get details of a specific chat session. Supports conditional "
+        "requests with `If-None-Match` and `If-Modified-Since`."
+    ),
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
 )
 async def get_chat(
-    chat: Annotated[Chat, Depends(valid_chat_id)],
-) -> Chat:
+    request: Request,
+    response: Response,
+    chat: Annotated[Chat, Depends(valid_chat_id_for_read)],
+) -> Chat | Response:
     """Get a chat session by ID."""
+    etag = make_etag(chat.id, chat.updated_at, chat.message_count)
+    if cached := not_modified(request, response, etag, chat.updated_at):
+        return cached
     return chat
 
 
@@ -75,7 +106,11 @@ async def get_chat(
     "/{chat_id}",
     response_model=ChatResponse,
     summary="Update chat",
-    description="Update a chat session's title or metadata.",
+    description=(
+        "Update a chat session's title or metadata. Metadata is merged into "
+        "the existing metadata as a JSON merge patch (RFC 7386): nested "
+        "objects are merged and keys set to null are removed."
+    ),
 )
 async def update_chat(
     chat_id: UUID,
@@ -98,3 +133,25 @@ async def delete_chat(
 ) -> None:
     """Delete a chat session."""
     await service.delete(chat_id)
+
+
+@router.post(
+    ":batchDelete",
+    response_model=ChatBatchDeleteResponse,
+    summary="Delete chats in bulk",
+    description=(
+        "Delete up to 1000 chat sessions and all their messages with a "
+        "single statement. IDs that match no chat are reported, not rejected."
+    ),
+)
+async def batch_delete_chats(
+    data: ChatBatchDelete,
+    service: Annotated[ChatService, Depends(get_chat_service)],
+) -> ChatBatchDeleteResponse:
+    """Delete several chat sessions at once."""
+    deleted = await service.delete_many(data.ids)
+    found = set(deleted)
+    return ChatBatchDeleteResponse(
+        deleted=deleted,
+        not_found=list(dict.fromkeys(i for i in data.ids if i not in found)),
+    )
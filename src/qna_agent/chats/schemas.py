@@ -1,10 +1,44 @@
 """Pydantic schemas for chats domain."""
 
 from datetime import datetime
-from typing import Any
+from enum import StrEnum
+from typing import Annotated, Any, cast
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StrictBool,
+    StrictFloat,
+    StrictInt,
+    StrictStr,
+    StringConstraints,
+    TypeAdapter,
+)
+
+
+class ChatOrdering(StrEnum):
+    """Sort order for chat listings."""
+
+    CREATED_AT = "created_at"
+    ACTIVITY = "activity"
+
+
+type MetadataValue = str | bool | int | float
+
+# Top-level metadata values chats can be filtered by
+type MetadataFilter = Annotated[
+    dict[
+        Annotated[str, StringConstraints(pattern=r"^\w{1,64}$")],
+        StrictStr | StrictBool | StrictInt | StrictFloat,
+    ],
+    Field(min_length=1, max_length=10),
+]
+# The alias carries the constraints, which type checkers cannot express
+metadata_filter_adapter: TypeAdapter[dict[str, MetadataValue]] = TypeAdapter(
+    cast(Any, MetadataFilter)
+)
 
 
 class ChatCreate(BaseModel):
@@ -31,10 +65,31 @@ class ChatUpdate(BaseModel):
     )
     metadata: dict[str, Any] | None = Field(
         default=None,
-        description="Updated metadata for the chat",
+        description=(
+            "Metadata merge patch (RFC 7386): nested objects are merged, "
+            "other values replace existing ones and keys set to null are "
+            "removed"
+        ),
+    )
+
+
+class ChatBatchDelete(BaseModel):
+    """Schema for deleting several chats at once."""
+
+    ids: list[UUID] = Field(
+        min_length=1,
+        max_length=1000,
+        description="IDs of the chats to delete",
     )
 
 
+class ChatBatchDeleteResponse(BaseModel):
+    """Schema for batch delete response."""
+
+    deleted: list[UUID] = Field(description="IDs of the deleted chats")
+    not_found: list[UUID] = Field(description="IDs that matched no chat")
+
+
 class ChatResponse(BaseModel):
     """Schema for chat response."""
 
@@ -46,6 +101,10 @@ class ChatResponse(BaseModel):
         description="Additional metadata for the chat",
         validation_alias="metadata_",
     )
+    message_count: int = Field(ge=0, description="Number of messages in the chat")
+    last_message_at: datetime | None = Field(
+        description="Timestamp of the latest message",
+    )
     created_at: datetime = Field(description="Chat creation timestamp")
     updated_at: datetime = Field(description="Last update timestamp")
 
@@ -1,13 +1,44 @@
 """Chat service with business logic."""
 
+from collections.abc import Sequence
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    JSON,
+    RowMapping,
+    Text,
+    and_,
+    bindparam,
+    case,
+    delete,
+    func,
+    lambda_stmt,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
+from qna_agent.chats.cache import chat_cache
 from qna_agent.chats.exceptions import ChatNotFoundError
 from qna_agent.chats.models import Chat
-from qna_agent.chats.schemas import ChatCreate, ChatUpdate
+from qna_agent.chats.schemas import ChatCreate, ChatOrdering, ChatUpdate
+from qna_agent.database import mark_chat_written
+
+# Columns of ChatResponse, selected as plain rows for listings
+_LIST_COLUMNS = (
+    Chat.id,
+    Chat.title,
+    Chat.metadata_,
+    Chat.message_count,
+    Chat.last_message_at,
+    Chat.created_at,
+    Chat.updated_at,
+)
 
 
 class ChatService:
@@ -24,55 +55,202 @@ class ChatService:
         )
         self._session.add(chat)
         await self._session.flush()
-        await self._session.refresh(chat)
+        mark_chat_written(chat.id)
+        chat_cache.add(chat.id)
         return chat
 
     async def get(self, chat_id: UUID) -> Chat:
-        """Get a chat by ID. Raises ChatNotFoundError if not found."""
-        result = await self._session.execute(select(Chat).where(Chat.id == chat_id))
+        """Get a chat by ID. Raises ChatNotFoundError if not found.
+
+        The lookup runs on every chat endpoint, so it is a lambda statement:
+        SQLAlchemy builds it once and reuses it with a new ``chat_id``.
+        """
+        result = await self._session.execute(
+            lambda_stmt(lambda: select(Chat).where(Chat.id == chat_id))
+        )
         chat = result.scalar_one_or_none()
         if chat is None:
             raise ChatNotFoundError(chat_id)
         return chat
 
+    async def ensure_exists(self, chat_id: UUID) -> None:
+        """Check that a chat exists without loading it.
+
+        Chats found are remembered in ``chat_cache`` for a few seconds, so
+        checks on active chats usually skip the query. Raises
+        ChatNotFoundError if not found.
+        """
+        if chat_id in chat_cache:
+            return
+        result = await self._session.execute(
+            lambda_stmt(lambda: select(Chat.id).where(Chat.id == chat_id))
+        )
+        if result.scalar_one_or_none() is None:
+            raise ChatNotFoundError(chat_id)
+        chat_cache.add(chat_id)
+
     async def list(
         self,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[Chat], int]:
-        """List chats with pagination. Returns (chats, total_count)."""
+        order_by: ChatOrdering = ChatOrdering.CREATED_AT,
+        metadata: dict[str, Any] | None = None,
+    ) -> tuple[Sequence[RowMapping], int]:
+        """List chats with pagination. Returns (rows, total_count).
+
+        Chats are returned as Core row mappings with the columns of ``ChatResponse``
+        rather than ORM objects, which skips identity-map bookkeeping for
+        read-only listings.
+
+        ``ChatOrdering.ACTIVITY`` lists chats with the most recent message
+        first, followed by chats without messages.
+
+        ``metadata`` restricts the listing to chats whose metadata has all
+        of the given top-level values.
+        """
         offset = (page - 1) * page_size
+        condition = self._metadata_condition(metadata) if metadata else true()
 
         count_result = await self._session.execute(
-            select(func.count()).select_from(Chat)
+            select(func.count()).select_from(Chat).where(condition)
         )
         total = count_result.scalar_one()
 
+        match order_by:
+            case ChatOrdering.ACTIVITY:
+                ordering = (
+                    Chat.last_message_at.desc().nulls_last(),
+                    Chat.created_at.desc(),
+                )
+            case ChatOrdering.CREATED_AT:
+                ordering = (Chat.created_at.desc(),)
+
         result = await self._session.execute(
-            select(Chat)
-            .order_by(Chat.created_at.desc())
+            select(*_LIST_COLUMNS)
+            .where(condition)
+            .order_by(*ordering)
             .offset(offset)
             .limit(page_size)
         )
-        chats = list(result.scalars().all())
-
-        return chats, total
+        return result.mappings().all(), total
 
     async def update(self, chat_id: UUID, data: ChatUpdate) -> Chat:
-        """Update a chat. Raises ChatNotFoundError if not found."""
-        chat = await self.get(chat_id)
+        """Update a chat with a single UPDATE ... RETURNING.
 
+        ``metadata`` is applied in the database as a JSON merge patch
+        (RFC 7386): nested objects are merged, other values replace the
+        stored ones and keys set to null are removed at any depth. Raises
+        ChatNotFoundError if not found.
+        """
+        values: dict[Any, Any] = {}
         if data.title is not None:
-            chat.title = data.title
+            values[Chat.title] = data.title
         if data.metadata is not None:
-            chat.metadata_ = data.metadata
+            values[Chat.metadata_] = self._merge_metadata(data.metadata)
+        if not values:
+            return await self.get(chat_id)
 
-        await self._session.flush()
-        await self._session.refresh(chat)
+        result = await self._session.scalars(
+            update(Chat)
+            .where(Chat.id == chat_id)
+            .values(values)
+            .returning(Chat)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        chat = result.one_or_none()
+        if chat is None:
+            raise ChatNotFoundError(chat_id)
+        mark_chat_written(chat_id)
         return chat
 
     async def delete(self, chat_id: UUID) -> None:
-        """Delete a chat. Raises ChatNotFoundError if not found."""
-        chat = await self.get(chat_id)
-        await self._session.delete(chat)
-        await self._session.flush()
+        """Delete a chat with a single DELETE.
+
+        Messages and jobs are removed by the foreign keys' ON DELETE CASCADE
+        instead of being loaded and deleted one by one. Raises
+        ChatNotFoundError if not found.
+        """
+        deleted = await self.delete_many([chat_id])
+        if not deleted:
+            raise ChatNotFoundError(chat_id)
+
+    async def delete_many(self, chat_ids: Sequence[UUID]) -> list[UUID]:
+        """Delete several chats with a single DELETE.
+
+        Args:
+            chat_ids: IDs of the chats to delete
+
+        Returns:
+            IDs of the chats that existed and were deleted
+        """
+        result = await self._session.scalars(
+            delete(Chat).where(Chat.id.in_(chat_ids)).returning(Chat.id)
+        )
+        deleted = list(result.all())
+        for chat_id in deleted:
+            mark_chat_written(chat_id)
+            chat_cache.discard(chat_id)
+        return deleted
+
+    def _metadata_condition(self, metadata: dict[str, Any]) -> ColumnElement[bool]:
+        """Build a SQL condition matching chats with the given metadata values."""
+        if self._session.get_bind().dialect.name == "postgresql":
+            # Containment is served by the GIN index
+            return Chat.metadata_.op("@>")(literal(metadata, JSONB))
+
+        # Paths are rendered inline so the expression matches the
+        # json_extract indexes of INDEXED_METADATA_KEYS
+        conditions = [
+            func.json_extract(
+                Chat.metadata_,
+                bindparam(None, f"$.{key}", literal_execute=True),
+            )
+            == value
+            for key, value in metadata.items()
+        ]
+        return and_(*conditions)
+
+    def _merge_metadata(self, patch: dict[str, Any]) -> ColumnElement[Any]:
+        """Build a SQL expression merging ``patch`` into the stored metadata."""
+        if self._session.get_bind().dialect.name == "postgresql":
+            return _jsonb_merge_patch(Chat.metadata_.expression, patch)
+        # SQLite implements RFC 7386 natively
+        return func.json_patch(Chat.metadata_, literal(patch, JSON))
+
+
+def _jsonb_merge_patch(
+    target: ColumnElement[Any],
+    patch: dict[str, Any],
+) -> ColumnElement[Any]:
+    """Build a PostgreSQL expression applying an RFC 7386 merge patch.
+
+    ``jsonb || jsonb`` only merges top-level keys, so nested objects of the
+    patch are merged into the matching stored objects recursively.
+    """
+    merged = target
+    replaced = {
+        key: value
+        for key, value in patch.items()
+        if value is not None and not isinstance(value, dict)
+    }
+    if replaced:
+        merged = merged.op("||", return_type=JSONB)(literal(replaced, JSONB))
+    for key, value in patch.items():
+        if isinstance(value, dict):
+            # Text array paths keep every parameter typed for asyncpg
+            path = literal([key], ARRAY(Text))
+            stored = target.op("#>", return_type=JSONB)(path)
+            nested = case(
+                (func.jsonb_typeof(stored) == "object", stored),
+                else_=literal({}, JSONB),
+            )
+            merged = func.jsonb_set(
+                merged,
+                path,
+                _jsonb_merge_patch(nested, cast(dict[str, Any], value)),
+                type_=JSONB,
+            )
+    removed = [key for key, value in patch.items() if value is None]
+    if removed:
+        merged = merged.op("-", return_type=JSONB)(literal(removed, ARRAY(Text)))
+    return merged
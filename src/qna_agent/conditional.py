@@ -0,0 +1,90 @@
+"""Conditional GET support with ETag and Last-Modified validators."""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+# Clients may cache, but must revalidate before reusing a response
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Build a weak ETag from the values a representation depends on."""
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime,
+) -> Response | None:
+    """Evaluate the request's preconditions against the current validators.
+
+    The validators are also set on ``response`` so a full response carries
+    them. ``If-None-Match`` takes precedence over ``If-Modified-Since``.
+
+    Args:
+        request: The incoming request
+        response: The response the endpoint will return on a cache miss
+        etag: Current entity tag of the representation
+        last_modified: Time the representation last changed
+
+    Returns:
+        A 304 response if the client's copy is still fresh, otherwise None
+    """
+    last_modified = _as_utc(last_modified)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    else:
+        fresh = _not_modified_since(
+            request.headers.get("if-modified-since"), last_modified
+        )
+
+    if fresh:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def _not_modified_since(header: str | None, last_modified: datetime) -> bool:
+    """Whether a resource is unchanged since an If-Modified-Since date."""
+    if not header:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except TypeError, ValueError:
+        return False
+    # HTTP dates have whole-second precision
+    return last_modified.replace(microsecond=0) <= _as_utc(since)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return an aware UTC datetime, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
@@ -26,6 +26,37 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite+aiosqlite:///./data/qna.db"
 
+    # Database connection pool (ignored for SQLite)
+    database_pool_class: Literal["queue", "null"] = "queue"
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0
+    database_pool_recycle: int = 3600
+    database_pool_pre_ping: bool = True
+    # Disable asyncpg prepared statement caching for pgbouncer transaction pooling
+    database_pgbouncer: bool = False
+    # pgbouncer 1.21+ with max_prepared_statements tracks prepared statements
+    # itself, so asyncpg's statement cache can stay on behind it
+    database_pgbouncer_prepared_statements: bool = False
+    # Compiled SQL statements cached per engine
+    database_query_cache_size: int = 500
+
+    # SQLite tuning. "tuned" adds mmap, a larger page cache, in-memory temp
+    # tables and a busy timeout, serializes writes through a single
+    # connection, serves reads from a separate read-only pool and
+    # checkpoints the WAL in the background
+    database_sqlite_profile: Literal["default", "tuned"] = "default"
+    database_sqlite_mmap_size: int = 268_435_456
+    # Pages if positive, KiB if negative
+    database_sqlite_cache_size: int = -65_536
+    database_sqlite_busy_timeout: int = 5000
+    database_sqlite_checkpoint_interval: float = 30.0
+
+    # Read replicas (JSON list of URLs) used by read-only endpoints
+    database_replica_urls: list[str] = []
+    # Chats written within this many seconds are read from the primary
+    database_replica_lag: float = 5.0
+
     # LiteLLM
     litellm_api_key: str = ""
     litellm_api_base: str = "https://openrouter.ai/api/v1"
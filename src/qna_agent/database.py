@@ -1,45 +1,241 @@
 """Async SQLAlchemy database configuration."""
 
+import asyncio
+import itertools
+import time
 from collections.abc import AsyncGenerator
-from typing import Any
+from typing import Any, cast
+from uuid import UUID, uuid4
 
-from sqlalchemy import event
+from fastapi import Request
+from loguru import logger
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    NullPool,
+    PoolProxiedConnection,
+    QueuePool,
+)
 
-from qna_agent.config import get_settings
+from qna_agent.config import Settings, get_settings
+from qna_agent.metrics import registry
 
+DB_POOL_WAIT = registry.histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection or opening a new one",
+)
+DB_POOL_CHECKOUT = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Total connection checkout latency, including pre-ping",
+)
+SQLITE_WAL_CHECKPOINTS = registry.counter(
+    "sqlite_wal_checkpoints_total",
+    "Background SQLite WAL checkpoints",
+)
+SQLITE_WAL_CHECKPOINTED_FRAMES = registry.counter(
+    "sqlite_wal_checkpointed_frames_total",
+    "WAL frames copied into the SQLite database by background checkpoints",
+)
 
-def _create_engine() -> AsyncEngine:
-    """Create async SQLAlchemy engine based on database URL."""
-    settings = get_settings()
 
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool recording checkout wait and latency."""
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_CHECKOUT.observe(time.perf_counter() - started)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+
+def _unique_statement_name() -> str:
+    """Name prepared statements uniquely so pgbouncer backends never clash."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+def _engine_options(
+    settings: Settings,
+    url: str | None = None,
+    *,
+    sqlite_reader: bool = False,
+) -> dict[str, Any]:
+    """Build create_async_engine keyword arguments from settings.
+
+    Args:
+        settings: Application settings
+        url: Database URL, defaults to the primary database URL
+        sqlite_reader: Build the read pool of the tuned SQLite profile
+    """
     connect_args: dict[str, Any] = {}
-    pool_kwargs: dict[str, Any] = {}
+    options: dict[str, Any] = {
+        "echo": settings.debug,
+        "query_cache_size": settings.database_query_cache_size,
+    }
 
-    if "sqlite" in settings.database_url:
+    if "sqlite" in (url or settings.database_url):
         connect_args["check_same_thread"] = False
+        if settings.database_sqlite_profile == "tuned":
+            options |= _sqlite_pool_options(settings, reader=sqlite_reader)
+    elif settings.database_pool_class == "null":
+        options["poolclass"] = NullPool
     else:
-        pool_kwargs = {
-            "pool_size": 5,
-            "max_overflow": 10,
-            "pool_pre_ping": True,
-            "pool_recycle": 3600,
+        options |= {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "pool_timeout": settings.database_pool_timeout,
+            "pool_pre_ping": settings.database_pool_pre_ping,
+            "pool_recycle": settings.database_pool_recycle,
+        }
+
+    if (
+        settings.database_pgbouncer
+        and not settings.database_pgbouncer_prepared_statements
+    ):
+        # Prepared statements live on a server connection, which pgbouncer
+        # may swap between transactions
+        connect_args |= {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
         }
 
-    return create_async_engine(
+    options["connect_args"] = connect_args
+    return options
+
+
+def _sqlite_pool_options(settings: Settings, *, reader: bool) -> dict[str, Any]:
+    """Queue pool options of the tuned SQLite profile.
+
+    The writer pool holds a single connection, so concurrent write
+    transactions wait their turn in the pool's queue instead of contending
+    for SQLite's write lock and failing with "database is locked".
+    """
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.database_pool_size if reader else 1,
+        "max_overflow": settings.database_max_overflow if reader else 0,
+        "pool_timeout": settings.database_pool_timeout,
+    }
+
+
+def sqlite_pragmas(settings: Settings, *, reader: bool = False) -> list[str]:
+    """PRAGMA statements run on every new SQLite connection.
+
+    Foreign keys are needed for ON DELETE CASCADE, which deletes messages
+    without loading them. Read connections of the tuned profile are made
+    read-only so writes cannot bypass the single writer connection.
+    """
+    pragmas = ["journal_mode=WAL", "synchronous=NORMAL", "foreign_keys=ON"]
+    if settings.database_sqlite_profile == "tuned":
+        pragmas += [
+            f"busy_timeout={settings.database_sqlite_busy_timeout}",
+            f"mmap_size={settings.database_sqlite_mmap_size}",
+            f"cache_size={settings.database_sqlite_cache_size}",
+            "temp_store=MEMORY",
+        ]
+        if reader:
+            pragmas.append("query_only=ON")
+    return pragmas
+
+
+def _register_sqlite_pragmas(engine: AsyncEngine, *, reader: bool = False) -> None:
+    """Run the SQLite pragmas on each connection the engine opens."""
+    pragmas = sqlite_pragmas(get_settings(), reader=reader)
+
+    def set_sqlite_pragma(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragma)
+
+
+def _create_engine() -> AsyncEngine:
+    """Create async SQLAlchemy engine based on database URL."""
+    settings = get_settings()
+    engine = create_async_engine(settings.database_url, **_engine_options(settings))
+    if engine.dialect.name == "sqlite":
+        _register_sqlite_pragmas(engine)
+    return engine
+
+
+def _create_sqlite_reader_engine() -> AsyncEngine | None:
+    """Create the read pool of the tuned SQLite profile, if enabled.
+
+    In-memory databases are private to their connection, so they are
+    always served by the primary engine.
+    """
+    settings = get_settings()
+    url = make_url(settings.database_url)
+    if (
+        url.get_backend_name() != "sqlite"
+        or settings.database_sqlite_profile != "tuned"
+        or url.database in (None, "", ":memory:")
+    ):
+        return None
+
+    reader = create_async_engine(
         settings.database_url,
-        echo=settings.debug,
-        connect_args=connect_args,
-        **pool_kwargs,
+        **_engine_options(settings, sqlite_reader=True),
+    )
+    _register_sqlite_pragmas(reader, reader=True)
+    return reader
+
+
+def _create_replica_engines() -> list[AsyncEngine]:
+    """Create async SQLAlchemy engines for the configured read replicas."""
+    settings = get_settings()
+    return [
+        create_async_engine(url, **_engine_options(settings, url))
+        for url in settings.database_replica_urls
+    ]
+
+
+def _register_pool_metrics(engine: AsyncEngine) -> None:
+    """Expose queue pool occupancy as gauges."""
+    if not isinstance(engine.pool, QueuePool):
+        return
+
+    def pool() -> QueuePool:
+        # Looked up on every read since dispose() replaces the pool
+        return cast(QueuePool, engine.pool)
+
+    registry.gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out of the pool",
+        lambda: float(pool().checkedout()),
+    )
+    registry.gauge(
+        "db_pool_checked_in",
+        "Idle connections in the pool",
+        lambda: float(pool().checkedin()),
+    )
+    registry.gauge(
+        "db_pool_overflow",
+        "Connections open beyond pool_size (negative while below it)",
+        lambda: float(pool().overflow()),
     )
 
 
 engine = _create_engine()
+_register_pool_metrics(engine)
 
 async_session_factory = async_sessionmaker(
     engine,
@@ -49,16 +245,147 @@ async_session_factory = async_sessionmaker(
     autoflush=False,
 )
 
+sqlite_reader_engine = _create_sqlite_reader_engine()
+sqlite_read_session_factory = (
+    async_sessionmaker(
+        sqlite_reader_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+    if sqlite_reader_engine is not None
+    else None
+)
 
-@event.listens_for(engine.sync_engine, "connect")
-def set_sqlite_pragma(dbapi_connection: Any, _connection_record: Any) -> None:
-    """Enable WAL mode for SQLite for better concurrent read performance."""
-    settings = get_settings()
-    if "sqlite" in settings.database_url:
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.execute("PRAGMA synchronous=NORMAL")
-        cursor.close()
+replica_engines = _create_replica_engines()
+
+replica_session_factories = [
+    async_sessionmaker(
+        replica,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+    for replica in replica_engines
+]
+_replica_cycle = itertools.cycle(replica_session_factories)
+
+# Monotonic time of the last write per chat, for read-your-writes
+_recent_writes: dict[UUID, float] = {}
+_RECENT_WRITES_MAX = 10_000
+
+
+def mark_chat_written(chat_id: UUID) -> None:
+    """Record a write so reads of the chat skip lagging replicas."""
+    if not replica_session_factories:
+        return
+
+    now = time.monotonic()
+    if len(_recent_writes) >= _RECENT_WRITES_MAX:
+        cutoff = now - get_settings().database_replica_lag
+        for key in [k for k, t in _recent_writes.items() if t < cutoff]:
+            del _recent_writes[key]
+    _recent_writes[chat_id] = now
+
+
+def read_session_factory(
+    chat_id: UUID | None = None,
+) -> async_sessionmaker[AsyncSession]:
+    """Pick the session factory for a read.
+
+    Replicas are used round-robin, except for chats written by this process
+    within the replica lag window, which are read from the primary.
+    The read pool of the tuned SQLite profile sees every committed write,
+    so it is used for all reads.
+    """
+    if sqlite_read_session_factory is not None:
+        return sqlite_read_session_factory
+
+    if not replica_session_factories:
+        return async_session_factory
+
+    if chat_id is not None and chat_id in _recent_writes:
+        age = time.monotonic() - _recent_writes[chat_id]
+        if age < get_settings().database_replica_lag:
+            return async_session_factory
+        del _recent_writes[chat_id]
+
+    return next(_replica_cycle)
+
+
+class WalCheckpointer:
+    """Task checkpointing the SQLite WAL in the background.
+
+    Passive checkpoints copy committed pages back into the database file
+    without blocking readers or the writer, so commits rarely have to run
+    an automatic checkpoint themselves and the WAL stays small.
+    """
+
+    def __init__(self, engine: AsyncEngine | None, interval: float) -> None:
+        self._engine = engine
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start periodic checkpoints if an engine is configured."""
+        if self._engine is None:
+            return
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Checkpointing the SQLite WAL every {self._interval}s")
+
+    async def stop(self) -> None:
+        """Cancel periodic checkpoints."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def checkpoint(self) -> int:
+        """Run a passive checkpoint.
+
+        Returns:
+            Number of WAL frames checkpointed
+        """
+        if self._engine is None:
+            return 0
+        async with self._engine.connect() as connection:
+            result = await connection.exec_driver_sql("PRAGMA wal_checkpoint(PASSIVE)")
+            _busy, _frames, checkpointed = result.one()
+        SQLITE_WAL_CHECKPOINTS.inc()
+        SQLITE_WAL_CHECKPOINTED_FRAMES.inc(max(checkpointed, 0))
+        return checkpointed
+
+    async def _loop(self) -> None:
+        """Periodically checkpoint the WAL."""
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.checkpoint()
+            except Exception:
+                logger.exception("SQLite WAL checkpoint failed")
+
+
+wal_checkpointer = WalCheckpointer(
+    sqlite_reader_engine,
+    get_settings().database_sqlite_checkpoint_interval,
+)
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Dependency that provides a session for read-only endpoints.
+
+    The ``chat_id`` path parameter, if any, is used for read-your-writes.
+    """
+    try:
+        chat_id = UUID(request.path_params["chat_id"])
+    except KeyError, ValueError:
+        chat_id = None
+
+    async with read_session_factory(chat_id)() as session:
+        yield session
 
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
@@ -9,7 +9,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends
 from sse_starlette.sse import EventSourceResponse
 
-from qna_agent.chats.dependencies import valid_chat_id
+from qna_agent.chats.dependencies import valid_chat_id_for_read
 from qna_agent.chats.models import Chat
 from qna_agent.events.manager import event_manager
 
@@ -42,7 +42,7 @@ async def event_generator(chat_id: UUID) -> AsyncGenerator[dict[str, str]]:
     response_class=EventSourceResponse,
 )
 async def subscribe_to_events(
-    chat: Annotated[Chat, Depends(valid_chat_id)],
+    chat: Annotated[Chat, Depends(valid_chat_id_for_read)],
 ) -> EventSourceResponse:
     """Subscribe to SSE events for a chat."""
     return EventSourceResponse(event_generator(chat.id))
@@ -8,7 +8,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from qna_agent.config import get_settings
 from qna_agent.database import get_session
-from qna_agent.health.schemas import DetailedHealthResponse, HealthResponse
+from qna_agent.health.schemas import (
+    DetailedHealthResponse,
+    HealthResponse,
+    MetricsResponse,
+)
+from qna_agent.metrics import registry
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -71,3 +76,14 @@ async def readiness(
         database=db_status,
         knowledge_base=kb_status,
     )
+
+
+@router.get(
+    "/metrics",
+    response_model=MetricsResponse,
+    summary="Metrics snapshot",
+    description="Returns in-process counters, gauges and latency histograms.",
+)
+async def metrics() -> MetricsResponse:
+    """Metrics snapshot for this worker process."""
+    return MetricsResponse(**registry.snapshot())
@@ -1,5 +1,7 @@
 """Pydantic schemas for health domain."""
 
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -15,3 +17,13 @@ class DetailedHealthResponse(HealthResponse):
 
     database: str = Field(description="Database connection status")
     knowledge_base: str = Field(description="Knowledge base status")
+
+
+class MetricsResponse(BaseModel):
+    """In-process metrics snapshot."""
+
+    counters: dict[str, float] = Field(description="Counter values")
+    gauges: dict[str, float] = Field(description="Gauge values")
+    histograms: dict[str, dict[str, Any]] = Field(
+        description="Histogram count, sum and percentiles"
+    )
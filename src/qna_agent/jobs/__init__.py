@@ -0,0 +1,5 @@
+"""Jobs domain - Background processing of chat messages."""
+
+from qna_agent.jobs.router import router
+
+__all__ = ["router"]
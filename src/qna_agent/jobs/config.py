@@ -0,0 +1,30 @@
+"""Background job configuration."""
+
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class JobSettings(BaseSettings):
+    """Background job settings loaded from environment variables."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env.local",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    # Number of concurrent agent runs per process
+    job_workers: int = 4
+    # How often the queue table is polled for pending or abandoned jobs
+    job_poll_interval: float = 5.0
+    # Running jobs not finished within this many seconds are reclaimed
+    job_timeout: float = 300.0
+    job_max_attempts: int = 3
+
+
+@lru_cache
+def get_job_settings() -> JobSettings:
+    """Get cached job settings instance."""
+    return JobSettings()
@@ -0,0 +1,16 @@
+"""Job domain dependencies for FastAPI."""
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.database import get_session
+from qna_agent.jobs.service import JobService
+
+
+async def get_job_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> JobService:
+    """Dependency to get job service."""
+    return JobService(session)
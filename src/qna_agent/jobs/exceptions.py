@@ -0,0 +1,13 @@
+"""Job domain exceptions."""
+
+from uuid import UUID
+
+from qna_agent.exceptions import NotFoundError
+
+
+class JobNotFoundError(NotFoundError):
+    """Raised when a job is not found."""
+
+    def __init__(self, job_id: UUID) -> None:
+        self.job_id = job_id
+        super().__init__(f"Job {job_id} not found")
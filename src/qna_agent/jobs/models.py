@@ -0,0 +1,56 @@
+"""Message job SQLAlchemy model."""
+
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from qna_agent.models import MAPPER_ARGS, Base, TimestampMixin, UUIDMixin
+
+
+class JobStatus(StrEnum):
+    """Lifecycle of a background message job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class MessageJob(Base, UUIDMixin, TimestampMixin):
+    """Queued agent run answering a persisted user message."""
+
+    chat_id: Mapped[UUID] = mapped_column(
+        ForeignKey("chats.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_message_id: Mapped[UUID] = mapped_column(
+        ForeignKey("messages.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    assistant_message_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("messages.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    status: Mapped[JobStatus] = mapped_column(
+        Enum(JobStatus, native_enum=False),
+        default=JobStatus.PENDING,
+        nullable=False,
+        index=True,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    __mapper_args__ = MAPPER_ARGS
+
+    def __repr__(self) -> str:
+        return (
+            f"<MessageJob(id={self.id}, status={self.status}, chat_id={self.chat_id})>"
+        )
@@ -0,0 +1,64 @@
+"""Job API router."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response, status
+
+from qna_agent.chats.dependencies import valid_chat_id
+from qna_agent.jobs.dependencies import get_job_service
+from qna_agent.jobs.models import MessageJob
+from qna_agent.jobs.schemas import MessageJobResponse
+from qna_agent.jobs.service import JobService
+from qna_agent.jobs.worker import job_worker
+from qna_agent.messages.dependencies import get_message_service
+from qna_agent.messages.models import MessageRole
+from qna_agent.messages.schemas import MessageCreate
+from qna_agent.messages.service import MessageService
+
+router = APIRouter(prefix="/chats/{chat_id}", tags=["jobs"])
+
+
+@router.post(
+    "/messages/async",
+    response_model=MessageJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Send message for background processing",
+    description=(
+        "Store a user message and answer it in the background. The assistant "
+        "message is delivered via the events stream or by polling the job."
+    ),
+)
+async def create_message_async(
+    chat_id: Annotated[UUID, Depends(valid_chat_id)],
+    data: MessageCreate,
+    response: Response,
+    message_service: Annotated[MessageService, Depends(get_message_service)],
+    job_service: Annotated[JobService, Depends(get_job_service)],
+) -> MessageJob:
+    """Send a message and queue the AI response."""
+    user_message = await message_service.create(
+        chat_id=chat_id,
+        role=MessageRole.USER,
+        content=data.content,
+    )
+    job = await job_service.enqueue(chat_id=chat_id, user_message_id=user_message.id)
+    job_worker.submit(job.id)
+
+    response.headers["Location"] = f"/api/v1/chats/{chat_id}/jobs/{job.id}"
+    return job
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=MessageJobResponse,
+    summary="Get job status",
+    description="Poll a background message job until it is completed or failed.",
+)
+async def get_job(
+    job_id: UUID,
+    chat_id: Annotated[UUID, Depends(valid_chat_id)],
+    service: Annotated[JobService, Depends(get_job_service)],
+) -> MessageJob:
+    """Get a background message job."""
+    return await service.get(job_id, chat_id)
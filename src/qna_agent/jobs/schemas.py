@@ -0,0 +1,26 @@
+"""Pydantic schemas for jobs domain."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from qna_agent.jobs.models import JobStatus
+
+
+class MessageJobResponse(BaseModel):
+    """Schema for background message job response."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID = Field(description="Unique job identifier (UUID7)")
+    chat_id: UUID = Field(description="Parent chat ID")
+    status: JobStatus = Field(description="Job status")
+    user_message_id: UUID = Field(description="The user's message being answered")
+    assistant_message_id: UUID | None = Field(
+        default=None,
+        description="The AI assistant's response, once completed",
+    )
+    error: str | None = Field(default=None, description="Failure reason")
+    created_at: datetime = Field(description="Job creation timestamp")
+    updated_at: datetime = Field(description="Last status change timestamp")
@@ -0,0 +1,163 @@
+"""Job service with business logic."""
+
+from datetime import UTC, datetime
+from typing import Any, cast
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, CursorResult, and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.jobs.exceptions import JobNotFoundError
+from qna_agent.jobs.models import JobStatus, MessageJob
+
+
+class JobService:
+    """Service for background message job operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def enqueue(self, chat_id: UUID, user_message_id: UUID) -> MessageJob:
+        """Queue a job answering the given user message.
+
+        The session is committed so the user message and the job are visible
+        to the worker before the request finishes.
+        """
+        job = MessageJob(chat_id=chat_id, user_message_id=user_message_id)
+        self._session.add(job)
+        await self._session.commit()
+        return job
+
+    async def get(self, job_id: UUID, chat_id: UUID) -> MessageJob:
+        """Get a job of a chat by ID.
+
+        Raises:
+            JobNotFoundError: If the job does not exist in the chat
+        """
+        result = await self._session.execute(
+            select(MessageJob).where(
+                MessageJob.id == job_id,
+                MessageJob.chat_id == chat_id,
+            )
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            raise JobNotFoundError(job_id)
+        return job
+
+    async def claim(
+        self,
+        job_id: UUID,
+        stale_before: datetime,
+        max_attempts: int,
+    ) -> MessageJob | None:
+        """Atomically mark a job as running.
+
+        A job can be claimed while pending, or while running if its previous
+        attempt started before ``stale_before`` (the worker died). Returns
+        None if another worker owns the job or it is already finished.
+        """
+        now = datetime.now(UTC)
+        result = await self._session.execute(
+            update(MessageJob)
+            .where(
+                MessageJob.id == job_id,
+                _claimable(stale_before),
+                MessageJob.attempts < max_attempts,
+            )
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=MessageJob.attempts + 1,
+                started_at=now,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if cast(CursorResult[Any], result).rowcount != 1:
+            return None
+        return await self._session.get(MessageJob, job_id, populate_existing=True)
+
+    async def claimable_ids(
+        self,
+        stale_before: datetime,
+        max_attempts: int,
+        limit: int = 100,
+    ) -> list[UUID]:
+        """Get IDs of jobs waiting for a worker, oldest first."""
+        result = await self._session.execute(
+            select(MessageJob.id)
+            .where(_claimable(stale_before), MessageJob.attempts < max_attempts)
+            .order_by(MessageJob.created_at.asc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def fail_exhausted(self, stale_before: datetime, max_attempts: int) -> None:
+        """Fail abandoned jobs that have used up all their attempts."""
+        await self._session.execute(
+            update(MessageJob)
+            .where(_claimable(stale_before), MessageJob.attempts >= max_attempts)
+            .values(
+                status=JobStatus.FAILED,
+                error="Exceeded maximum attempts",
+                updated_at=datetime.now(UTC),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def complete(
+        self,
+        job_id: UUID,
+        attempt: int,
+        assistant_message_id: UUID,
+    ) -> bool:
+        """Mark a job as completed with its assistant message.
+
+        Only the worker running the given attempt may finish the job; it
+        loses ownership once the job is reclaimed or finished elsewhere.
+
+        Returns:
+            Whether the job was still owned by the attempt and got updated
+        """
+        return await self._finish(
+            job_id,
+            attempt,
+            status=JobStatus.COMPLETED,
+            assistant_message_id=assistant_message_id,
+            error=None,
+        )
+
+    async def fail(self, job_id: UUID, attempt: int, error: str) -> bool:
+        """Mark a job as failed.
+
+        Like :meth:`complete`, only applies to the attempt owning the job.
+
+        Returns:
+            Whether the job was still owned by the attempt and got updated
+        """
+        return await self._finish(job_id, attempt, status=JobStatus.FAILED, error=error)
+
+    async def _finish(self, job_id: UUID, attempt: int, **values: Any) -> bool:
+        """Update a job still running the given attempt."""
+        result = await self._session.execute(
+            update(MessageJob)
+            .where(
+                MessageJob.id == job_id,
+                MessageJob.status == JobStatus.RUNNING,
+                MessageJob.attempts == attempt,
+            )
+            .values(**values, updated_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+        return cast(CursorResult[Any], result).rowcount == 1
+
+
+def _claimable(stale_before: datetime) -> ColumnElement[bool]:
+    """Condition matching pending jobs and running jobs whose worker died."""
+    return or_(
+        MessageJob.status == JobStatus.PENDING,
+        and_(
+            MessageJob.status == JobStatus.RUNNING,
+            MessageJob.started_at < stale_before,
+        ),
+    )
@@ -0,0 +1,209 @@
+"""In-process worker pool for background message jobs."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from qna_agent.agent.dependencies import get_llm_client
+from qna_agent.agent.service import AgentService
+from qna_agent.database import async_session_factory
+from qna_agent.events.manager import event_manager
+from qna_agent.events.schemas import AgentProcessingEvent, MessageCreatedEvent
+from qna_agent.jobs.config import get_job_settings
+from qna_agent.jobs.service import JobService
+from qna_agent.knowledge.dependencies import get_knowledge_service
+from qna_agent.messages.models import MessageRole
+from qna_agent.messages.schemas import MessageResponse
+from qna_agent.messages.service import MessageService
+from qna_agent.metrics import registry
+
+JOBS_COMPLETED = registry.counter(
+    "jobs_completed_total",
+    "Background message jobs answered successfully",
+)
+JOBS_FAILED = registry.counter(
+    "jobs_failed_total",
+    "Background message jobs that failed",
+)
+JOB_DURATION = registry.histogram(
+    "job_duration_seconds",
+    "Time from claiming a background job to storing its answer",
+)
+
+
+class JobWorker:
+    """Pool of tasks running queued message jobs.
+
+    Jobs are durable in the ``message_jobs`` table; the in-memory queue only
+    carries IDs to wake workers up. A periodic poll picks up jobs submitted
+    by other processes and reclaims jobs whose worker died mid-run.
+
+    Events are published to this process's event manager only, so clients
+    connected to another process should poll the job instead.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+        self._settings = get_job_settings()
+        self._queue: asyncio.Queue[UUID] = asyncio.Queue()
+        self._queued: set[UUID] = set()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Start worker tasks and the queue table poller."""
+        registry.gauge(
+            "job_queue_depth",
+            "Background message jobs waiting for a worker in this process",
+            lambda: float(self._queue.qsize()),
+        )
+        self._tasks = [
+            asyncio.create_task(self._consume())
+            for _ in range(self._settings.job_workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._poll()))
+        logger.info(f"Started {self._settings.job_workers} job workers")
+
+    async def stop(self) -> None:
+        """Cancel all worker tasks.
+
+        Unfinished jobs stay running in the database and are reclaimed
+        once their timeout expires.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, job_id: UUID) -> None:
+        """Wake a worker for a committed job."""
+        if job_id not in self._queued:
+            self._queued.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def recover(self) -> None:
+        """Queue pending and abandoned jobs from the database."""
+        stale_before = self._stale_before()
+        async with self._session_factory() as session:
+            service = JobService(session)
+            await service.fail_exhausted(stale_before, self._settings.job_max_attempts)
+            job_ids = await service.claimable_ids(
+                stale_before, self._settings.job_max_attempts
+            )
+            await session.commit()
+
+        for job_id in job_ids:
+            self.submit(job_id)
+
+    async def run(self, job_id: UUID) -> None:
+        """Claim a job, run the agent and store the assistant message.
+
+        The database session is released while the agent is running. If the
+        job was reclaimed by another worker in the meantime, this attempt's
+        outcome is discarded: the answer is only stored together with
+        completing the job it still owns.
+        """
+        async with self._session_factory() as session:
+            job = await JobService(session).claim(
+                job_id, self._stale_before(), self._settings.job_max_attempts
+            )
+            await session.commit()
+        if job is None:
+            return
+
+        chat_id = job.chat_id
+        attempt = job.attempts
+        started = asyncio.get_running_loop().time()
+        await self._publish_status(chat_id, job_id, "started")
+
+        try:
+            async with self._session_factory() as session:
+                history = await MessageService(session).get_chat_history_for_llm(
+                    chat_id
+                )
+            agent_service = AgentService(
+                llm_client=get_llm_client(),
+                knowledge_service=get_knowledge_service(),
+            )
+            response = await agent_service.process_message(
+                chat_id=chat_id,
+                messages=history,
+            )
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            async with self._session_factory() as session:
+                owned = await JobService(session).fail(job_id, attempt, str(e))
+                await session.commit()
+            if not owned:
+                logger.warning(f"Job {job_id} is no longer owned, dropping its error")
+                return
+            JOBS_FAILED.inc()
+            await self._publish_status(chat_id, job_id, "failed")
+            return
+
+        async with self._session_factory() as session:
+            message = await MessageService(session).create(
+                chat_id=chat_id,
+                role=MessageRole.ASSISTANT,
+                content=response.content,
+                tool_calls=response.tool_calls,
+            )
+            if not await JobService(session).complete(job_id, attempt, message.id):
+                await session.rollback()
+                logger.warning(f"Job {job_id} is no longer owned, dropping its answer")
+                return
+            await session.commit()
+
+        JOBS_COMPLETED.inc()
+        JOB_DURATION.observe(asyncio.get_running_loop().time() - started)
+        event = MessageCreatedEvent(
+            chat_id=chat_id,
+            message_id=message.id,
+            role=message.role.value,
+            data={
+                "job_id": str(job_id),
+                "message": MessageResponse.model_validate(message).model_dump(
+                    mode="json"
+                ),
+            },
+        )
+        await event_manager.publish(chat_id, event.model_dump(mode="json"))
+
+    async def _consume(self) -> None:
+        """Run queued jobs one at a time."""
+        while True:
+            job_id = await self._queue.get()
+            self._queued.discard(job_id)
+            try:
+                await self.run(job_id)
+            except Exception:
+                logger.exception(f"Unexpected error running job {job_id}")
+            finally:
+                self._queue.task_done()
+
+    async def _poll(self) -> None:
+        """Periodically recover jobs from the queue table."""
+        while True:
+            try:
+                await self.recover()
+            except Exception:
+                logger.exception("Failed to poll message jobs")
+            await asyncio.sleep(self._settings.job_poll_interval)
+
+    def _stale_before(self) -> datetime:
+        """Start time before which a running job is considered abandoned."""
+        return datetime.now(UTC) - timedelta(seconds=self._settings.job_timeout)
+
+    async def _publish_status(self, chat_id: UUID, job_id: UUID, status: str) -> None:
+        """Publish an agent processing event for a job."""
+        event = AgentProcessingEvent(
+            chat_id=chat_id,
+            status=status,
+            data={"job_id": str(job_id)},
+        )
+        await event_manager.publish(chat_id, event.model_dump(mode="json"))
+
+
+job_worker = JobWorker(async_session_factory)
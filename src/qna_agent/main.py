@@ -7,11 +7,11 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
 from loguru import logger
 
 from qna_agent.chats.router import router as chats_router
 from qna_agent.config import get_settings
+from qna_agent.database import wal_checkpointer
 from qna_agent.events.router import router as events_router
 from qna_agent.exceptions import (
     KnowledgeBaseError,
@@ -20,7 +20,13 @@ from qna_agent.exceptions import (
     ValidationError,
 )
 from qna_agent.health.router import router as health_router
+from qna_agent.jobs.router import router as jobs_router
+from qna_agent.jobs.worker import job_worker
 from qna_agent.messages.router import router as messages_router
+from qna_agent.responses import FastJSONResponse
+from qna_agent.retention.worker import retention_worker
+from qna_agent.search.router import router as search_router
+from qna_agent.transfer.router import router as transfer_router
 
 
 def configure_logging() -> None:
@@ -63,9 +69,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         settings.knowledge_base_path.mkdir(parents=True)
         logger.info(f"Created knowledge base directory: {settings.knowledge_base_path}")
 
+    await wal_checkpointer.start()
+    await job_worker.start()
+    await retention_worker.start()
+
     yield
 
     logger.info("Shutting down application")
+    await retention_worker.stop()
+    await job_worker.stop()
+    await wal_checkpointer.stop()
 
 
 def create_app() -> FastAPI:
@@ -80,6 +93,7 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     app.add_middleware(
@@ -95,8 +109,8 @@ def create_app() -> FastAPI:
     @app.exception_handler(NotFoundError)
     async def not_found_handler(  # type: ignore[misc]
         request: Request, exc: NotFoundError
-    ) -> JSONResponse:
-        return JSONResponse(
+    ) -> FastJSONResponse:
+        return FastJSONResponse(
             status_code=404,
             content={"detail": str(exc)},
         )
@@ -104,8 +118,8 @@ def create_app() -> FastAPI:
     @app.exception_handler(ValidationError)
     async def validation_handler(  # type: ignore[misc]
         request: Request, exc: ValidationError
-    ) -> JSONResponse:
-        return JSONResponse(
+    ) -> FastJSONResponse:
+        return FastJSONResponse(
             status_code=400,
             content={"detail": str(exc)},
         )
@@ -113,9 +127,9 @@ def create_app() -> FastAPI:
     @app.exception_handler(LLMError)
     async def llm_error_handler(  # type: ignore[misc]
         request: Request, exc: LLMError
-    ) -> JSONResponse:
+    ) -> FastJSONResponse:
         logger.error(f"LLM error: {exc}")
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=503,
             content={"detail": "AI service temporarily unavailable"},
         )
@@ -123,17 +137,20 @@ def create_app() -> FastAPI:
     @app.exception_handler(KnowledgeBaseError)
     async def kb_error_handler(  # type: ignore[misc]
         request: Request, exc: KnowledgeBaseError
-    ) -> JSONResponse:
+    ) -> FastJSONResponse:
         logger.error(f"Knowledge base error: {exc}")
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"detail": str(exc)},
         )
 
     app.include_router(health_router)
+    app.include_router(transfer_router, prefix="/api/v1")
     app.include_router(chats_router, prefix="/api/v1")
     app.include_router(messages_router, prefix="/api/v1")
     app.include_router(events_router, prefix="/api/v1")
+    app.include_router(jobs_router, prefix="/api/v1")
+    app.include_router(search_router, prefix="/api/v1")
 
     return app
 
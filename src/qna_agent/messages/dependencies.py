@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from qna_agent.database import get_session
+from qna_agent.database import get_read_session, get_session
 from qna_agent.messages.service import MessageService
 
 
@@ -14,3 +14,10 @@ async def get_message_service(
 ) -> MessageService:
     """Dependency to get message service."""
     return MessageService(session)
+
+
+async def get_message_read_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> MessageService:
+    """Dependency to get message service for read-only endpoints."""
+    return MessageService(session)
@@ -1,13 +1,16 @@
 """Message SQLAlchemy model."""
 
+import sqlite3
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import JSON, Enum, ForeignKey, Text
+from sqlalchemy import DDL, Enum, ForeignKey, Index, Text, event
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from qna_agent.models import Base, TimestampMixin, UUIDMixin
+from qna_agent.models import MAPPER_ARGS, Base, TimestampMixin, UUIDMixin
+from qna_agent.types import CompressedJSON, CompressedText, SearchVector
 
 if TYPE_CHECKING:
     from qna_agent.chats.models import Chat
@@ -22,21 +25,26 @@ class MessageRole(StrEnum):
     TOOL = "tool"
 
 
+def _search_document(context: DefaultExecutionContext) -> str:
+    """Index the content of each inserted message."""
+    return context.get_current_parameters()["content"]
+
+
 class Message(Base, UUIDMixin, TimestampMixin):
     """Chat message model."""
 
     chat_id: Mapped[UUID] = mapped_column(
         ForeignKey("chats.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     role: Mapped[MessageRole] = mapped_column(
         Enum(MessageRole, native_enum=False),
         nullable=False,
     )
-    content: Mapped[str] = mapped_column(Text, nullable=False)
+    # Long answers and tool call payloads are compressed transparently
+    content: Mapped[str] = mapped_column(CompressedText(), nullable=False)
     tool_calls: Mapped[list[dict[str, Any]] | None] = mapped_column(
-        JSON,
+        CompressedJSON(),
         nullable=True,
     )
     tool_call_id: Mapped[str | None] = mapped_column(
@@ -44,8 +52,28 @@ class Message(Base, UUIDMixin, TimestampMixin):
         nullable=True,
     )
 
+    # Built from content on insert and never loaded; on SQLite it is cleared
+    # once indexed by a contentless messages_fts, see MESSAGES_FTS_DDL
+    search_vector: Mapped[str | None] = mapped_column(
+        SearchVector(),
+        default=_search_document,
+        deferred=True,
+        nullable=True,
+    )
+
     chat: Mapped[Chat] = relationship("Chat", back_populates="messages")
 
+    __mapper_args__ = MAPPER_ARGS
+    __table_args__ = (
+        # Serves per-chat lookups and keyset pagination over (created_at, id)
+        Index("ix_messages_chat_id_created_at", "chat_id", "created_at", "id"),
+        Index(
+            "ix_messages_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, role={self.role}, chat_id={self.chat_id})>"
 
@@ -64,3 +92,126 @@ class Message(Base, UUIDMixin, TimestampMixin):
         if self.tool_call_id:
             msg["tool_call_id"] = self.tool_call_id
         return msg
+
+
+# SQLite indexes search documents with an FTS5 table kept in sync by triggers.
+# Since SQLite 3.43 the table is contentless: the insert trigger indexes the
+# bound text and clears the column, so the text is not stored twice next to
+# the compressed content. Older SQLite cannot delete from contentless tables
+# and keeps the documents in messages.search_vector as external content, read
+# through the messages_fts_documents view.
+# Documents are keyed by messages_fts_keys rather than by the implicit rowid
+# of messages: with a UUID primary key that rowid is not stable, VACUUM and
+# table rebuilds (batch migrations) may renumber it. Such rebuilds still drop
+# the triggers, so these migrations must recreate them.
+FTS_CONTENTLESS = sqlite3.sqlite_version_info >= (3, 43, 0)
+
+_FTS_KEYS_DDL = """
+    CREATE TABLE messages_fts_keys (
+        id INTEGER PRIMARY KEY,
+        message_id CHAR(32) NOT NULL UNIQUE
+    )
+    """
+
+MESSAGES_FTS_DDL = (
+    (
+        _FTS_KEYS_DDL,
+        """
+        CREATE VIRTUAL TABLE messages_fts USING fts5(
+            search_vector, content='', contentless_delete=1
+        )
+        """,
+        """
+        CREATE TRIGGER messages_fts_insert AFTER INSERT ON messages
+        WHEN new.search_vector IS NOT NULL
+        BEGIN
+            INSERT INTO messages_fts_keys (message_id) VALUES (new.id);
+            INSERT INTO messages_fts (rowid, search_vector)
+            SELECT id, new.search_vector FROM messages_fts_keys
+            WHERE message_id = new.id;
+            UPDATE messages SET search_vector = NULL WHERE rowid = new.rowid;
+        END
+        """,
+        """
+        CREATE TRIGGER messages_fts_delete AFTER DELETE ON messages BEGIN
+            DELETE FROM messages_fts WHERE rowid = (
+                SELECT id FROM messages_fts_keys WHERE message_id = old.id
+            );
+            DELETE FROM messages_fts_keys WHERE message_id = old.id;
+        END
+        """,
+        """
+        CREATE TRIGGER messages_fts_update AFTER UPDATE OF search_vector ON messages
+        WHEN new.search_vector IS NOT NULL
+        BEGIN
+            INSERT OR IGNORE INTO messages_fts_keys (message_id) VALUES (new.id);
+            DELETE FROM messages_fts WHERE rowid = (
+                SELECT id FROM messages_fts_keys WHERE message_id = new.id
+            );
+            INSERT INTO messages_fts (rowid, search_vector)
+            SELECT id, new.search_vector FROM messages_fts_keys
+            WHERE message_id = new.id;
+            UPDATE messages SET search_vector = NULL WHERE rowid = new.rowid;
+        END
+        """,
+    )
+    if FTS_CONTENTLESS
+    else (
+        _FTS_KEYS_DDL,
+        """
+        CREATE VIEW messages_fts_documents AS
+        SELECT messages_fts_keys.id, messages.search_vector
+        FROM messages_fts_keys
+        JOIN messages ON messages.id = messages_fts_keys.message_id
+        """,
+        """
+        CREATE VIRTUAL TABLE messages_fts USING fts5(
+            search_vector, content='messages_fts_documents', content_rowid='id'
+        )
+        """,
+        """
+        CREATE TRIGGER messages_fts_insert AFTER INSERT ON messages BEGIN
+            INSERT INTO messages_fts_keys (message_id) VALUES (new.id);
+            INSERT INTO messages_fts (rowid, search_vector)
+            SELECT id, new.search_vector FROM messages_fts_keys
+            WHERE message_id = new.id;
+        END
+        """,
+        """
+        CREATE TRIGGER messages_fts_delete AFTER DELETE ON messages BEGIN
+            INSERT INTO messages_fts (messages_fts, rowid, search_vector)
+            SELECT 'delete', id, old.search_vector FROM messages_fts_keys
+            WHERE message_id = old.id;
+            DELETE FROM messages_fts_keys WHERE message_id = old.id;
+        END
+        """,
+        """
+        CREATE TRIGGER messages_fts_update AFTER UPDATE OF search_vector ON messages
+        BEGIN
+            INSERT INTO messages_fts (messages_fts, rowid, search_vector)
+            SELECT 'delete', id, old.search_vector FROM messages_fts_keys
+            WHERE message_id = old.id;
+            INSERT INTO messages_fts (rowid, search_vector)
+            SELECT id, new.search_vector FROM messages_fts_keys
+            WHERE message_id = new.id;
+        END
+        """,
+    )
+)
+
+for statement in MESSAGES_FTS_DDL:
+    event.listen(
+        Message.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+for statement in (
+    "DROP TABLE IF EXISTS messages_fts",
+    "DROP VIEW IF EXISTS messages_fts_documents",
+    "DROP TABLE IF EXISTS messages_fts_keys",
+):
+    event.listen(
+        Message.__table__,
+        "before_drop",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
@@ -3,21 +3,29 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from qna_agent.agent.dependencies import get_agent_service
 from qna_agent.agent.service import AgentService
-from qna_agent.chats.dependencies import valid_chat_id
+from qna_agent.chats.dependencies import valid_chat_id_for_read
 from qna_agent.chats.models import Chat
-from qna_agent.messages.dependencies import get_message_service
+from qna_agent.conditional import make_etag, not_modified
+from qna_agent.database import get_session
+from qna_agent.messages.dependencies import (
+    get_message_read_service,
+    get_message_service,
+)
 from qna_agent.messages.models import MessageRole
 from qna_agent.messages.schemas import (
     ChatCompletionResponse,
     MessageCreate,
+    MessageDraft,
     MessageListResponse,
     MessageResponse,
 )
 from qna_agent.messages.service import MessageService
+from qna_agent.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/chats/{chat_id}/messages", tags=["messages"])
 
@@ -26,20 +34,56 @@ router = APIRouter(prefix="/chats/{chat_id}/messages", tags=["messages"])
     "",
     response_model=MessageListResponse,
     summary="Get chat messages",
-    description="Get all messages for a specific chat session.",
+    description=(
+        "Get messages of a chat in chronological order, one page at a time. "
+        "Pass `next_cursor` as `after` for newer messages (also to poll for "
+        "new ones) and `prev_cursor` as `before` for older ones. Supports "
+        "conditional requests with `If-None-Match` and `If-Modified-Since`."
+    ),
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
 )
 async def list_messages(
-    chat: Annotated[Chat, Depends(valid_chat_id)],
-    service: Annotated[MessageService, Depends(get_message_service)],
-) -> MessageListResponse:
-    """Get all messages for a chat."""
-    messages = await service.get_chat_messages(chat.id)
-    total = len(messages)
+    request: Request,
+    response: Response,
+    chat: Annotated[Chat, Depends(valid_chat_id_for_read)],
+    service: Annotated[MessageService, Depends(get_message_read_service)],
+    limit: Annotated[int, Query(ge=1, le=200, description="Page size")] = 50,
+    after: Annotated[
+        str | None,
+        Query(description="Cursor to return messages after"),
+    ] = None,
+    before: Annotated[
+        str | None,
+        Query(description="Cursor to return messages before"),
+    ] = None,
+) -> MessageListResponse | Response:
+    """Get a page of messages for a chat."""
+    # Messages are append-only, so the chat's counters identify the page
+    # contents without loading any messages
+    etag = make_etag(
+        chat.id, chat.message_count, chat.last_message_at, limit, after, before
+    )
+    last_modified = chat.last_message_at or chat.created_at
+    if cached := not_modified(request, response, etag, last_modified):
+        return cached
+
+    messages, has_more = await service.get_page(
+        chat.id,
+        limit=limit,
+        after=decode_cursor(after) if after else None,
+        before=decode_cursor(before) if before else None,
+    )
 
-    return MessageListResponse(
+    page = MessageListResponse(
         items=[MessageResponse.model_validate(msg) for msg in messages],
-        total=total,
+        total=chat.message_count,
+        has_more=has_more,
     )
+    if messages:
+        first, last = messages[0], messages[-1]
+        page.prev_cursor = encode_cursor(first["created_at"], first["id"])
+        page.next_cursor = encode_cursor(last["created_at"], last["id"])
+    return page
 
 
 @router.post(
@@ -52,28 +96,38 @@ async def list_messages(
 async def create_message(
     chat_id: UUID,
     data: MessageCreate,
-    chat: Annotated[Chat, Depends(valid_chat_id)],
+    session: Annotated[AsyncSession, Depends(get_session)],
     message_service: Annotated[MessageService, Depends(get_message_service)],
     agent_service: Annotated[AgentService, Depends(get_agent_service)],
 ) -> ChatCompletionResponse:
-    """Send a message and get AI response."""
-    user_message = await message_service.create(
-        chat_id=chat_id,
-        role=MessageRole.USER,
-        content=data.content,
-    )
+    """Send a message and get AI response.
 
+    The database is used in two short transactions around the agent run so
+    no pooled connection is held while waiting for the LLM. The history
+    query also validates the chat, and both messages are stored together
+    once the response is ready. They are timestamped when stored, not when
+    the request arrived, so they never sort before messages committed
+    during the agent run and an ``after`` cursor taken meanwhile still
+    returns them.
+    """
     history = await message_service.get_chat_history_for_llm(chat_id)
+    await session.commit()
+
     assistant_response = await agent_service.process_message(
         chat_id=chat_id,
-        messages=history,
+        messages=[*history, {"role": MessageRole.USER.value, "content": data.content}],
     )
 
-    assistant_message = await message_service.create(
-        chat_id=chat_id,
-        role=MessageRole.ASSISTANT,
-        content=assistant_response.content,
-        tool_calls=assistant_response.tool_calls,
+    user_message, assistant_message = await message_service.create_many(
+        chat_id,
+        [
+            MessageDraft(role=MessageRole.USER, content=data.content),
+            MessageDraft(
+                role=MessageRole.ASSISTANT,
+                content=assistant_response.content,
+                tool_calls=assistant_response.tool_calls,
+            ),
+        ],
     )
 
     return ChatCompletionResponse(
@@ -26,6 +26,25 @@ class MessageCreate(BaseModel):
     )
 
 
+class MessageDraft(BaseModel):
+    """Message to be stored as part of a turn."""
+
+    role: MessageRole = Field(description="Message role")
+    content: str = Field(description="Message content")
+    tool_calls: list[dict[str, Any]] | None = Field(
+        default=None,
+        description="Tool calls made by assistant",
+    )
+    tool_call_id: str | None = Field(
+        default=None,
+        description="Tool call ID for tool response messages",
+    )
+    created_at: datetime | None = Field(
+        default=None,
+        description="When the message was received, defaults to insert time",
+    )
+
+
 class MessageResponse(MessageBase):
     """Schema for message response."""
 
@@ -48,7 +67,19 @@ class MessageListResponse(BaseModel):
     """Schema for message list response."""
 
     items: list[MessageResponse] = Field(description="List of messages")
-    total: int = Field(ge=0, description="Total number of messages")
+    total: int = Field(ge=0, description="Total number of messages in the chat")
+    has_more: bool = Field(
+        default=False,
+        description="Whether more messages exist in the direction of the page",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor of the last item, pass as `after` for newer messages",
+    )
+    prev_cursor: str | None = Field(
+        default=None,
+        description="Cursor of the first item, pass as `before` for older messages",
+    )
 
 
 class ChatCompletionResponse(BaseModel):
@@ -1,12 +1,44 @@
 """Message service with business logic."""
 
+from collections.abc import Sequence
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    RowMapping,
+    Select,
+    case,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from qna_agent.chats.cache import chat_cache
+from qna_agent.chats.exceptions import ChatNotFoundError
+from qna_agent.chats.models import Chat
+from qna_agent.database import mark_chat_written
 from qna_agent.messages.models import Message, MessageRole
+from qna_agent.messages.schemas import MessageDraft
+
+# Columns of MessageResponse, selected as plain rows for listings
+_LIST_COLUMNS = (
+    Message.id,
+    Message.chat_id,
+    Message.role,
+    Message.content,
+    Message.tool_calls,
+    Message.tool_call_id,
+    Message.created_at,
+)
+
+# Built once: the statement is the same for every batch of messages
+_INSERT_MESSAGES = insert(Message).returning(Message, sort_by_parameter_order=True)
 
 
 class MessageService:
@@ -22,8 +54,14 @@ class MessageService:
         content: str,
         tool_calls: list[dict[str, Any]] | None = None,
         tool_call_id: str | None = None,
+        created_at: datetime | None = None,
     ) -> Message:
-        """Create a new message."""
+        """Create a new message.
+
+        ``created_at`` defaults to now; pass it to keep the time a message
+        was received when it is stored later. Raises ChatNotFoundError if
+        the chat no longer exists.
+        """
         message = Message(
             chat_id=chat_id,
             role=role,
@@ -31,28 +69,134 @@ class MessageService:
             tool_calls=tool_calls,
             tool_call_id=tool_call_id,
         )
+        if created_at is not None:
+            message.created_at = created_at
         self._session.add(message)
-        await self._session.flush()
-        await self._session.refresh(message)
+        try:
+            await self._session.flush()
+        except IntegrityError as e:
+            raise self._chat_gone(chat_id) from e
+        await self._record_activity(chat_id, 1, message.created_at)
         return message
 
+    async def create_many(
+        self,
+        chat_id: UUID,
+        drafts: Sequence[MessageDraft],
+    ) -> list[Message]:
+        """Create several messages of a chat with a single INSERT.
+
+        Args:
+            chat_id: The chat the messages belong to
+            drafts: Messages in the order they were produced
+
+        Returns:
+            The created messages, in the same order as ``drafts``
+
+        Raises:
+            ChatNotFoundError: If the chat no longer exists
+        """
+        if not drafts:
+            return []
+
+        # Every row needs the same keys to be sent as one statement
+        rows = [
+            {
+                "chat_id": chat_id,
+                "role": draft.role,
+                "content": draft.content,
+                "tool_calls": draft.tool_calls,
+                "tool_call_id": draft.tool_call_id,
+                "created_at": draft.created_at or datetime.now(UTC),
+            }
+            for draft in drafts
+        ]
+        try:
+            result = await self._session.scalars(
+                _INSERT_MESSAGES,
+                rows,
+                # Send NULLs instead of omitting them, which would split the batch
+                execution_options={"render_nulls": True},
+            )
+        except IntegrityError as e:
+            raise self._chat_gone(chat_id) from e
+        messages = list(result.all())
+        await self._record_activity(
+            chat_id,
+            len(messages),
+            max(m.created_at for m in messages),
+        )
+        return messages
+
     async def get_chat_messages(
         self,
         chat_id: UUID,
         limit: int | None = None,
     ) -> list[Message]:
         """Get all messages for a chat, ordered by creation time."""
-        query = (
-            select(Message)
-            .where(Message.chat_id == chat_id)
-            .order_by(Message.created_at.asc())
+        query = lambda_stmt(
+            lambda: (
+                select(Message)
+                .where(Message.chat_id == chat_id)
+                .order_by(Message.created_at.asc())
+            )
         )
         if limit:
-            query = query.limit(limit)
+
+            def with_limit(q: Select[tuple[Message]]) -> Select[tuple[Message]]:
+                return q.limit(limit)
+
+            query += with_limit
 
         result = await self._session.execute(query)
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        chat_id: UUID,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+        before: tuple[datetime, UUID] | None = None,
+    ) -> tuple[list[RowMapping], bool]:
+        """Get a page of chat messages using keyset pagination.
+
+        Messages are ordered by ``(created_at, id)``. With only ``before``
+        set, the page ends right before it; otherwise the page starts right
+        after ``after`` (or at the first message). They are returned as Core
+        row mappings with the columns of ``MessageResponse`` rather than ORM
+        objects.
+
+        Args:
+            chat_id: The chat ID
+            limit: Maximum number of messages to return
+            after: Sort key the page starts after
+            before: Sort key the page ends before
+
+        Returns:
+            Messages in chronological order, and whether more messages
+            exist beyond the page in the direction it was read
+        """
+        sort_key = tuple_(Message.created_at, Message.id)
+        query = select(*_LIST_COLUMNS).where(Message.chat_id == chat_id)
+        if after is not None:
+            query = query.where(sort_key > after)
+        if before is not None:
+            query = query.where(sort_key < before)
+
+        backwards = before is not None and after is None
+        if backwards:
+            query = query.order_by(Message.created_at.desc(), Message.id.desc())
+        else:
+            query = query.order_by(Message.created_at.asc(), Message.id.asc())
+
+        result = await self._session.execute(query.limit(limit + 1))
+        messages = list(result.mappings().all())
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+        if backwards:
+            messages.reverse()
+        return messages, has_more
+
     async def count_chat_messages(self, chat_id: UUID) -> int:
         """Count messages in a chat."""
         result = await self._session.execute(
@@ -65,6 +209,67 @@ class MessageService:
         chat_id: UUID,
         max_messages: int = 50,
     ) -> list[dict[str, Any]]:
-        """Get chat history in OpenAI API format."""
-        messages = await self.get_chat_messages(chat_id, limit=max_messages)
-        return [msg.to_openai_format() for msg in messages]
+        """Get the latest messages of a chat in OpenAI API format.
+
+        The chat is validated by the same query: it is outer-joined to its
+        newest ``max_messages`` messages, so a missing chat returns no rows
+        and a chat without messages a single row without one. Messages are
+        returned in chronological order.
+
+        Raises:
+            ChatNotFoundError: If the chat does not exist
+        """
+        result = await self._session.execute(
+            lambda_stmt(
+                lambda: (
+                    select(Chat.id, Message)
+                    .outerjoin(Message, Message.chat_id == Chat.id)
+                    .where(Chat.id == chat_id)
+                    .order_by(Message.created_at.desc(), Message.id.desc())
+                    .limit(max_messages)
+                )
+            )
+        )
+        rows = result.all()
+        if not rows:
+            raise ChatNotFoundError(chat_id)
+        chat_cache.add(chat_id)
+        return [
+            message.to_openai_format()
+            for _, message in reversed(rows)
+            if message is not None
+        ]
+
+    def _chat_gone(self, chat_id: UUID) -> ChatNotFoundError:
+        """Error for an insert rejected by the chat foreign key.
+
+        Chat existence is cached, so a chat deleted by another process can
+        pass validation until its cache entry expires.
+        """
+        chat_cache.discard(chat_id)
+        return ChatNotFoundError(chat_id)
+
+    async def _record_activity(
+        self,
+        chat_id: UUID,
+        added: int,
+        latest: datetime,
+    ) -> None:
+        """Bump the chat's message counters for newly inserted messages."""
+        await self._session.execute(
+            lambda_stmt(
+                lambda: (
+                    update(Chat)
+                    .where(Chat.id == chat_id)
+                    .values(
+                        message_count=Chat.message_count + added,
+                        last_message_at=case(
+                            (Chat.last_message_at > latest, Chat.last_message_at),
+                            else_=latest,
+                        ),
+                    )
+                )
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        mark_chat_written(chat_id)
@@ -0,0 +1,143 @@
+"""Lightweight in-process metrics registry."""
+
+import math
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    def __init__(self, name: str, description: str) -> None:
+        self.name = name
+        self.description = description
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter by the given amount."""
+        self._value += amount
+
+    @property
+    def value(self) -> float:
+        """Current counter value."""
+        return self._value
+
+
+class Gauge:
+    """Point-in-time value computed on read."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        fn: Callable[[], float],
+    ) -> None:
+        self.name = name
+        self.description = description
+        self._fn = fn
+
+    @property
+    def value(self) -> float:
+        """Current gauge value."""
+        return self._fn()
+
+
+class Histogram:
+    """Distribution of observations over a sliding window.
+
+    Count and sum cover every observation; percentiles are computed
+    over the most recent ``window`` samples only.
+    """
+
+    def __init__(self, name: str, description: str, window: int = 1000) -> None:
+        self.name = name
+        self.description = description
+        self._samples: deque[float] = deque(maxlen=window)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        self._samples.append(value)
+        self._count += 1
+        self._sum += value
+
+    @property
+    def count(self) -> int:
+        """Total number of observations."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Sum of all observations."""
+        return self._sum
+
+    def percentile(self, q: float) -> float | None:
+        """Return the nearest-rank percentile (0 < q <= 1) of the window."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(q * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        """Return count, sum and common percentiles."""
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+        }
+
+
+class MetricsRegistry:
+    """Registry of named metrics, shared by the whole process."""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, Counter] = {}
+        self._gauges: dict[str, Gauge] = {}
+        self._histograms: dict[str, Histogram] = {}
+
+    def counter(self, name: str, description: str) -> Counter:
+        """Get or create a counter."""
+        if name not in self._counters:
+            self._counters[name] = Counter(name, description)
+        return self._counters[name]
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        fn: Callable[[], float],
+    ) -> Gauge:
+        """Register a gauge backed by a callback, replacing any previous one."""
+        self._gauges[name] = Gauge(name, description, fn)
+        return self._gauges[name]
+
+    def histogram(self, name: str, description: str, window: int = 1000) -> Histogram:
+        """Get or create a histogram."""
+        if name not in self._histograms:
+            self._histograms[name] = Histogram(name, description, window)
+        return self._histograms[name]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return current values of all registered metrics."""
+        return {
+            "counters": {name: c.value for name, c in self._counters.items()},
+            "gauges": {name: g.value for name, g in self._gauges.items()},
+            "histograms": {name: h.snapshot() for name, h in self._histograms.items()},
+        }
+
+
+def ratio(numerator: Counter, denominator: Counter) -> Callable[[], float]:
+    """Build a gauge callback returning numerator / denominator."""
+
+    def _ratio() -> float:
+        return numerator.value / denominator.value if denominator.value else 0.0
+
+    return _ratio
+
+
+registry = MetricsRegistry()
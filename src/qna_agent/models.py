@@ -16,6 +16,10 @@ NAMING_CONVENTION: dict[str, str] = {
     "pk": "pk_%(table_name)s",
 }
 
+# Mapper options of every model: fetch server-generated values with
+# INSERT/UPDATE ... RETURNING instead of a follow-up SELECT
+MAPPER_ARGS: dict[str, Any] = {"eager_defaults": True}
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -0,0 +1,68 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from qna_agent.exceptions import ValidationError
+
+
+class InvalidCursorError(ValidationError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str) -> None:
+        self.cursor = cursor
+        super().__init__(f"Invalid cursor: {cursor}")
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a ``(created_at, id)`` sort key as an opaque cursor."""
+    return _encode([created_at.isoformat(), str(row_id)])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor created by ``encode_cursor``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        created_at, row_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise InvalidCursorError(cursor) from e
+
+
+def encode_rank_cursor(rank: float, row_id: UUID) -> str:
+    """Encode a ``(rank, id)`` sort key of ranked results as a cursor."""
+    return _encode([rank, str(row_id)])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, UUID]:
+    """Decode a cursor created by ``encode_rank_cursor``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        rank, row_id = _decode(cursor)
+        if not isinstance(rank, int | float):
+            raise TypeError(rank)
+        return float(rank), UUID(row_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise InvalidCursorError(cursor) from e
+
+
+def _encode(key: list[Any]) -> str:
+    """Serialize a sort key into URL-safe base64 JSON."""
+    payload = json.dumps(key, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Any:
+    """Deserialize a sort key produced by ``_encode``."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
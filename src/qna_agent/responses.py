@@ -0,0 +1,18 @@
+"""Response classes shared by the API."""
+
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded by pydantic-core instead of the stdlib encoder.
+
+    FastAPI hands response classes the already-serialized response model,
+    so encoding it in Rust removes the most expensive step of rendering
+    large payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
@@ -0,0 +1 @@
+"""Retention domain - Archival of old monthly message partitions."""
@@ -0,0 +1,39 @@
+"""Message retention configuration."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RetentionSettings(BaseSettings):
+    """Message retention settings loaded from environment variables.
+
+    Retention only applies to PostgreSQL databases whose messages table was
+    partitioned with ``alembic -n partitioning upgrade head``.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env.local",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+    retention_enabled: bool = False
+    # Full months kept in the messages table besides the current one
+    retention_months: int = 12
+    # "archive" dumps expired partitions to gzipped CSV files and drops them;
+    # "detach" only detaches them, leaving the tables for external tooling
+    retention_action: Literal["archive", "detach"] = "archive"
+    retention_archive_path: Path = Path("./archive")
+    # Future monthly partitions kept created ahead of time
+    retention_partitions_ahead: int = 2
+    retention_interval: float = 3600.0
+
+
+@lru_cache
+def get_retention_settings() -> RetentionSettings:
+    """Get cached retention settings instance."""
+    return RetentionSettings()
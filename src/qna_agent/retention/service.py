@@ -0,0 +1,248 @@
+"""Partition management for the monthly partitioned messages table."""
+
+import asyncio
+import gzip
+import re
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import cast
+
+from sqlalchemy import Table, column, func, select, table, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from qna_agent.chats.models import Chat
+from qna_agent.messages.models import Message
+
+PARTITION_PREFIX = "messages_p"
+# Created by the partitioning migration for rows outside every partition
+DEFAULT_PARTITION = "messages_default"
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+
+# Arbitrary key making sure a single transaction changes partitions at a time
+RETENTION_LOCK_KEY = 0x6D736772
+
+_chats = cast(Table, Chat.__table__)
+_messages = cast(Table, Message.__table__)
+
+
+def month_start(value: datetime) -> date:
+    """First day of the UTC month containing ``value``."""
+    return value.astimezone(UTC).date().replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Shift the first day of a month by ``count`` months."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding the given month."""
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def partition_month(name: str) -> date | None:
+    """Month held by a partition, or None for other tables."""
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return date(int(match[1]), int(match[2]), 1)
+
+
+def expired_months(
+    months: list[date],
+    now: datetime,
+    keep: int,
+) -> list[date]:
+    """Months older than the current month and the ``keep`` before it."""
+    cutoff = add_months(month_start(now), -keep)
+    return sorted(month for month in months if month < cutoff)
+
+
+class PartitionService:
+    """Service for creating, detaching and archiving message partitions.
+
+    Statements run on the given connection; the caller owns transactions.
+    """
+
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    async def try_lock(self) -> bool:
+        """Take the retention advisory lock for the current transaction.
+
+        The lock is released when the transaction ends. Unlike a session
+        lock it never outlives the server connection it was taken on, which
+        pgbouncer transaction pooling may hand to another client.
+
+        Returns:
+            False if another transaction holds the lock
+        """
+        result = await self._connection.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"),
+            {"key": RETENTION_LOCK_KEY},
+        )
+        return bool(result.scalar_one())
+
+    def _quote(self, name: str) -> str:
+        """Quote a table name for use in a text statement."""
+        return self._connection.dialect.identifier_preparer.quote(name)
+
+    async def is_partitioned(self) -> bool:
+        """Whether the messages table has been partitioned."""
+        result = await self._connection.execute(
+            text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_partitioned_table
+                    WHERE partrelid = 'messages'::regclass
+                )
+            """)
+        )
+        return bool(result.scalar_one())
+
+    async def attached_months(self) -> list[date]:
+        """Months of the partitions currently attached to ``messages``."""
+        result = await self._connection.execute(
+            text("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = 'messages'
+            """)
+        )
+        months = (partition_month(name) for name in result.scalars())
+        return sorted(month for month in months if month is not None)
+
+    async def detached_months(self) -> list[date]:
+        """Months of partition tables left detached by an earlier run."""
+        result = await self._connection.execute(
+            text("""
+                SELECT relname FROM pg_class
+                WHERE relkind = 'r'
+                  AND relname LIKE 'messages\\_p%'
+                  AND NOT relispartition
+            """)
+        )
+        months = (partition_month(name) for name in result.scalars())
+        return sorted(month for month in months if month is not None)
+
+    async def create(self, month: date) -> int:
+        """Create the partition of a month if it does not exist.
+
+        Messages of that month already stored in the default partition
+        would make ``CREATE TABLE ... PARTITION OF`` fail, so the table is
+        created standalone, the messages are moved into it and it is then
+        attached.
+
+        Returns:
+            Number of messages moved out of the default partition
+        """
+        name = partition_name(month)
+        result = await self._connection.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+        )
+        if result.scalar_one():
+            return 0
+
+        partition = self._quote(name)
+        default = self._quote(DEFAULT_PARTITION)
+        start = f"{month.isoformat()} 00:00:00+00"
+        end = f"{add_months(month, 1).isoformat()} 00:00:00+00"
+        await self._connection.execute(
+            text(f"""
+                CREATE TABLE {partition} (
+                    LIKE messages INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+                )
+            """)
+        )
+        moved = await self._connection.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default} "  # nosec B608 - quoted names
+                "WHERE created_at >= CAST(:start AS timestamptz) "
+                "AND created_at < CAST(:end AS timestamptz) RETURNING *) "
+                f"INSERT INTO {partition} SELECT * FROM moved"
+            ),
+            {"start": start, "end": end},
+        )
+        await self._connection.execute(
+            text(
+                f"ALTER TABLE messages ATTACH PARTITION {partition} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+        )
+        return moved.rowcount
+
+    async def default_rows(self) -> int:
+        """Number of messages stored in the default partition."""
+        result = await self._connection.execute(
+            select(func.count()).select_from(table(DEFAULT_PARTITION))
+        )
+        return int(result.scalar_one())
+
+    async def detach(self, month: date) -> None:
+        """Detach the partition of a month from ``messages``.
+
+        The counters of the chats with detached messages are recomputed in
+        the same transaction.
+        """
+        await self._connection.execute(
+            text(
+                "ALTER TABLE messages DETACH PARTITION "
+                + self._quote(partition_name(month))
+            )
+        )
+        await self.recount_chats(month)
+
+    async def recount_chats(self, month: date) -> None:
+        """Recompute the counters of chats with messages in a detached month.
+
+        ``message_count`` and ``last_message_at`` are set from the messages
+        left in ``messages``, so chat totals and ETags stop counting the
+        detached ones. ``updated_at`` is set to itself to keep its onupdate
+        from firing.
+        """
+        detached = table(partition_name(month), column("chat_id"))
+        remaining = _messages.c.chat_id == _chats.c.id
+        await self._connection.execute(
+            update(_chats)
+            .where(_chats.c.id.in_(select(detached.c.chat_id).distinct()))
+            .values(
+                message_count=select(func.count())
+                .select_from(_messages)
+                .where(remaining)
+                .scalar_subquery(),
+                last_message_at=select(func.max(_messages.c.created_at))
+                .where(remaining)
+                .scalar_subquery(),
+                updated_at=_chats.c.updated_at,
+            )
+        )
+
+    async def archive(self, month: date, directory: Path) -> int:
+        """Dump a detached partition to a gzipped CSV file and drop it.
+
+        The file is written under a temporary name and renamed once
+        complete, so a finished archive is never partial.
+
+        Returns:
+            Number of archived rows
+        """
+        name = partition_name(month)
+        await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+        target = directory / f"{name}.csv.gz"
+        partial = target.with_suffix(".partial")
+
+        raw = await self._connection.get_raw_connection()
+        with gzip.open(partial, "wb") as archive:
+
+            async def write(chunk: bytes) -> None:
+                await asyncio.to_thread(archive.write, chunk)
+
+            status = await raw.driver_connection.copy_from_table(  # type: ignore[union-attr]
+                name, output=write, format="csv", header=True
+            )
+        await asyncio.to_thread(partial.replace, target)
+
+        await self._connection.execute(text(f"DROP TABLE {self._quote(name)}"))
+        return int(status.split()[-1])
@@ -0,0 +1,178 @@
+"""Periodic retention of monthly message partitions."""
+
+import asyncio
+from datetime import UTC, date, datetime
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from qna_agent.database import engine
+from qna_agent.metrics import registry
+from qna_agent.retention.config import get_retention_settings
+from qna_agent.retention.service import (
+    DEFAULT_PARTITION,
+    PartitionService,
+    add_months,
+    expired_months,
+    month_start,
+    partition_name,
+)
+
+PARTITIONS_DETACHED = registry.counter(
+    "retention_partitions_detached_total",
+    "Expired message partitions detached from the messages table",
+)
+PARTITIONS_ARCHIVED = registry.counter(
+    "retention_partitions_archived_total",
+    "Expired message partitions archived to files and dropped",
+)
+ROWS_ARCHIVED = registry.counter(
+    "retention_rows_archived_total",
+    "Messages written to partition archives",
+)
+DEFAULT_ROWS_MOVED = registry.counter(
+    "retention_default_rows_moved_total",
+    "Messages moved from the default partition into a new monthly partition",
+)
+
+
+class RetentionWorker:
+    """Task maintaining the monthly partitions of the messages table.
+
+    Each run creates the upcoming monthly partitions whenever the table is
+    partitioned, so new messages never pile up in the default partition.
+    With retention enabled it also detaches, and optionally archives, the
+    partitions older than the retention window. A transaction-level
+    advisory lock makes sure only one process changes partitions at a time.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self._settings = get_retention_settings()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start the partition maintenance loop for a PostgreSQL database."""
+        if self._engine.dialect.name != "postgresql":
+            if self._settings.retention_enabled:
+                logger.warning("Message retention requires PostgreSQL, not starting")
+            return
+        self._task = asyncio.create_task(self._loop())
+        if self._settings.retention_enabled:
+            logger.info(
+                "Started message retention keeping "
+                f"{self._settings.retention_months} months"
+            )
+
+    async def stop(self) -> None:
+        """Cancel the retention loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def run_once(self, now: datetime | None = None) -> list[str]:
+        """Run a single retention pass.
+
+        Every partition change is committed on its own, so an interrupted
+        pass leaves the table consistent and the next one resumes. Each of
+        these transactions takes the transaction-level advisory lock, which
+        keeps working behind pgbouncer transaction pooling, and rereads the
+        partitions it acts on; the pass stops once another process holds
+        the lock.
+
+        Returns:
+            Names of the partitions detached during this pass
+        """
+        now = now or datetime.now(UTC)
+        current = month_start(now)
+        processed: list[str] = []
+
+        async with self._engine.connect() as connection:
+            service = PartitionService(connection)
+            if not await service.try_lock():
+                logger.debug("Message retention is running elsewhere, skipping")
+                return processed
+
+            if not await service.is_partitioned():
+                if self._settings.retention_enabled:
+                    logger.warning(
+                        "Messages table is not partitioned, skipping retention"
+                    )
+                return processed
+
+            for offset in range(self._settings.retention_partitions_ahead + 1):
+                month = add_months(current, offset)
+                moved = await service.create(month)
+                locked = await self._next_step(connection, service)
+                if moved:
+                    DEFAULT_ROWS_MOVED.inc(moved)
+                    logger.warning(
+                        f"Moved {moved} messages from {DEFAULT_PARTITION} "
+                        f"into {partition_name(month)}"
+                    )
+                if not locked:
+                    return processed
+
+            # Months without a partition, e.g. imported or detached ones
+            if stuck := await service.default_rows():
+                logger.warning(
+                    f"{stuck} messages are stored in {DEFAULT_PARTITION} "
+                    "outside every monthly partition"
+                )
+
+            if not self._settings.retention_enabled:
+                return processed
+
+            while months := expired_months(
+                await service.attached_months(),
+                now,
+                self._settings.retention_months,
+            ):
+                await service.detach(months[0])
+                locked = await self._next_step(connection, service)
+                PARTITIONS_DETACHED.inc()
+                processed.append(partition_name(months[0]))
+                logger.info(f"Detached {partition_name(months[0])}")
+                if not locked:
+                    return processed
+
+            if self._settings.retention_action == "archive":
+                # Also picks up partitions whose archiving was interrupted
+                while months := await service.detached_months():
+                    await self._archive(service, months[0])
+                    if not await self._next_step(connection, service):
+                        return processed
+
+        return processed
+
+    async def _next_step(
+        self, connection: AsyncConnection, service: PartitionService
+    ) -> bool:
+        """Commit a partition change and lock the next transaction.
+
+        Returns:
+            False if another process took the lock in between
+        """
+        await connection.commit()
+        return await service.try_lock()
+
+    async def _archive(self, service: PartitionService, month: date) -> None:
+        """Archive a detached partition and record its metrics."""
+        rows = await service.archive(month, self._settings.retention_archive_path)
+        PARTITIONS_ARCHIVED.inc()
+        ROWS_ARCHIVED.inc(rows)
+        logger.info(f"Archived {rows} messages from {partition_name(month)}")
+
+    async def _loop(self) -> None:
+        """Periodically run retention passes."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Message retention pass failed")
+            await asyncio.sleep(self._settings.retention_interval)
+
+
+retention_worker = RetentionWorker(engine)
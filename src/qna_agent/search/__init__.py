@@ -0,0 +1,5 @@
+"""Search domain - Full-text search over chat messages."""
+
+from qna_agent.search.router import router
+
+__all__ = ["router"]
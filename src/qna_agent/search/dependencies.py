@@ -0,0 +1,16 @@
+"""Search domain dependencies for FastAPI."""
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.database import get_read_session
+from qna_agent.search.service import SearchService
+
+
+async def get_search_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> SearchService:
+    """Dependency to get search service."""
+    return SearchService(session)
@@ -0,0 +1,57 @@
+"""Search API router."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from qna_agent.pagination import decode_rank_cursor, encode_rank_cursor
+from qna_agent.search.dependencies import get_search_service
+from qna_agent.search.schemas import MessageSearchResponse, MessageSearchResult
+from qna_agent.search.service import SearchService
+
+router = APIRouter(prefix="/messages", tags=["search"])
+
+
+@router.get(
+    ":search",
+    response_model=MessageSearchResponse,
+    summary="Search messages",
+    description=(
+        "Full-text search over the content of all messages, or of one chat "
+        "with `chat_id`. Every word of `q` must match; results are ranked by "
+        "relevance. Pass `next_cursor` as `after` for the next page."
+    ),
+)
+async def search_messages(
+    service: Annotated[SearchService, Depends(get_search_service)],
+    q: Annotated[
+        str,
+        Query(min_length=1, max_length=256, description="Words to search for"),
+    ],
+    chat_id: Annotated[
+        UUID | None,
+        Query(description="Only search the messages of this chat"),
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="Page size")] = 20,
+    after: Annotated[
+        str | None,
+        Query(description="Cursor to return results after"),
+    ] = None,
+) -> MessageSearchResponse:
+    """Search messages by content."""
+    rows, has_more = await service.search_messages(
+        q,
+        limit=limit,
+        chat_id=chat_id,
+        after=decode_rank_cursor(after) if after else None,
+    )
+
+    page = MessageSearchResponse(
+        items=[MessageSearchResult.model_validate(row) for row in rows],
+        has_more=has_more,
+    )
+    if page.items:
+        last = page.items[-1]
+        page.next_cursor = encode_rank_cursor(last.rank, last.id)
+    return page
@@ -0,0 +1,27 @@
+"""Pydantic schemas for search domain."""
+
+from pydantic import BaseModel, Field
+
+from qna_agent.messages.schemas import MessageResponse
+
+
+class MessageSearchResult(MessageResponse):
+    """A message matching a search query."""
+
+    rank: float = Field(description="Relevance of the message, higher is better")
+
+
+class MessageSearchResponse(BaseModel):
+    """Schema for a page of search results."""
+
+    items: list[MessageSearchResult] = Field(
+        description="Matching messages, most relevant first"
+    )
+    has_more: bool = Field(
+        default=False,
+        description="Whether more matching messages exist after the page",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor of the last item, pass as `after` for the next page",
+    )
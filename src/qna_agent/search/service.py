@@ -0,0 +1,132 @@
+"""Message search service."""
+
+import re
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    RowMapping,
+    Select,
+    column,
+    func,
+    literal_column,
+    select,
+    table,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.messages.models import Message
+from qna_agent.types import SEARCH_CONFIG
+
+# Columns of MessageSearchResult besides the rank
+_RESULT_COLUMNS = (
+    Message.id,
+    Message.chat_id,
+    Message.role,
+    Message.content,
+    Message.tool_calls,
+    Message.tool_call_id,
+    Message.created_at,
+)
+
+# FTS5 index of message contents on SQLite and its document keys,
+# see messages.models
+_messages_fts = table("messages_fts", column("rowid"))
+_messages_fts_keys = table("messages_fts_keys", column("id"), column("message_id"))
+# The table itself, as the first argument of bm25() and MATCH
+_messages_fts_table: ColumnElement[str] = literal_column("messages_fts")
+
+_WORD = re.compile(r"\w+")
+
+
+def fts5_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching all of its words.
+
+    Words are quoted, so FTS5 operators and syntax in the input are
+    searched for literally instead of being interpreted.
+    """
+    return " ".join(f'"{word}"' for word in _WORD.findall(query))
+
+
+class SearchService:
+    """Service for full-text search over messages."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def search_messages(
+        self,
+        query: str,
+        limit: int,
+        chat_id: UUID | None = None,
+        after: tuple[float, UUID] | None = None,
+    ) -> tuple[Sequence[RowMapping], bool]:
+        """Find messages matching a query, most relevant first.
+
+        Results are ordered by ``(rank, id)`` descending and paginated by
+        keyset; they are returned as row mappings with a ``rank`` key.
+
+        Args:
+            query: Words to search for, all of which must match
+            limit: Maximum number of messages to return
+            chat_id: Optional chat to restrict the search to
+            after: Sort key the page starts after
+
+        Returns:
+            Matching messages, and whether more exist after the page
+        """
+        if self._session.get_bind().dialect.name == "postgresql":
+            statement, rank = self._postgres_query(query)
+        else:
+            match = fts5_query(query)
+            if not match:
+                return [], False
+            statement, rank = self._sqlite_query(match)
+
+        if chat_id is not None:
+            statement = statement.where(Message.chat_id == chat_id)
+        if after is not None:
+            statement = statement.where(tuple_(rank, Message.id) < after)
+        statement = statement.order_by(rank.desc(), Message.id.desc())
+
+        result = await self._session.execute(statement.limit(limit + 1))
+        rows = result.mappings().all()
+        return rows[:limit], len(rows) > limit
+
+    @staticmethod
+    def _postgres_query(
+        query: str,
+    ) -> tuple[Select[tuple[Any, ...]], ColumnElement[float]]:
+        """Match the tsvector column with the GIN index."""
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank: ColumnElement[float] = func.ts_rank(
+            Message.search_vector, tsquery, type_=Float
+        )
+        statement = select(*_RESULT_COLUMNS, rank.label("rank")).where(
+            Message.search_vector.op("@@")(tsquery)
+        )
+        return statement, rank
+
+    @staticmethod
+    def _sqlite_query(
+        match: str,
+    ) -> tuple[Select[tuple[Any, ...]], ColumnElement[float]]:
+        """Match the FTS5 table and join it back to messages by its keys."""
+        bm25: ColumnElement[float] = func.bm25(_messages_fts_table, type_=Float)
+        # bm25() is lower for better matches
+        rank = -bm25
+        statement = (
+            select(*_RESULT_COLUMNS, rank.label("rank"))
+            .join_from(
+                Message,
+                _messages_fts_keys,
+                _messages_fts_keys.c.message_id == Message.id,
+            )
+            .join(_messages_fts, _messages_fts.c.rowid == _messages_fts_keys.c.id)
+            .where(_messages_fts_table.op("MATCH")(match))
+        )
+        return statement, rank
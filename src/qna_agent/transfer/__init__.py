@@ -0,0 +1,5 @@
+"""Transfer domain - Bulk export and import of chats."""
+
+from qna_agent.transfer.router import router
+
+__all__ = ["router"]
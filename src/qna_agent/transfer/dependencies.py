@@ -0,0 +1,23 @@
+"""Transfer domain dependencies for FastAPI."""
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.database import get_read_session, get_session
+from qna_agent.transfer.service import TransferService
+
+
+async def get_transfer_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> TransferService:
+    """Dependency to get transfer service."""
+    return TransferService(session)
+
+
+async def get_transfer_read_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> TransferService:
+    """Dependency to get transfer service for exports."""
+    return TransferService(session)
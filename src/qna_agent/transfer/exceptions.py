@@ -0,0 +1,11 @@
+"""Transfer domain exceptions."""
+
+from qna_agent.exceptions import ValidationError
+
+
+class InvalidRecordError(ValidationError):
+    """Raised when an import stream contains an invalid record."""
+
+    def __init__(self, line: int, reason: str) -> None:
+        self.line = line
+        super().__init__(f"Invalid record on line {line}: {reason}")
@@ -0,0 +1,58 @@
+"""Transfer API router."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from qna_agent.transfer.dependencies import (
+    get_transfer_read_service,
+    get_transfer_service,
+)
+from qna_agent.transfer.schemas import ImportResponse
+from qna_agent.transfer.service import TransferService
+
+router = APIRouter(prefix="/chats", tags=["transfer"])
+
+NDJSON = "application/x-ndjson"
+
+
+@router.get(
+    ":export",
+    response_class=StreamingResponse,
+    summary="Export chats",
+    description=(
+        "Stream every chat and message as NDJSON: one `chat` record per "
+        "line, followed by one `message` record per line."
+    ),
+    responses={200: {"content": {NDJSON: {}}}},
+)
+async def export_chats(
+    service: Annotated[TransferService, Depends(get_transfer_read_service)],
+) -> StreamingResponse:
+    """Export all chats and messages as NDJSON."""
+    return StreamingResponse(service.export(), media_type=NDJSON)
+
+
+@router.post(
+    ":import",
+    response_model=ImportResponse,
+    summary="Import chats",
+    description=(
+        "Import chats and messages from an NDJSON body in the export format. "
+        "Records are inserted in batches and existing IDs are skipped, so a "
+        "failed import can be retried with the same file."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON: {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def import_chats(
+    request: Request,
+    service: Annotated[TransferService, Depends(get_transfer_service)],
+) -> ImportResponse:
+    """Import chats and messages from NDJSON."""
+    return await service.import_stream(request.stream())
@@ -0,0 +1,57 @@
+"""Pydantic schemas for transfer domain."""
+
+from datetime import datetime
+from typing import Annotated, Any, Literal
+from uuid import UUID
+
+from pydantic import AliasChoices, BaseModel, Field
+
+from qna_agent.messages.models import MessageRole
+
+
+class ChatRecord(BaseModel):
+    """A chat line of an NDJSON export or import."""
+
+    type: Literal["chat"] = "chat"
+    id: UUID = Field(description="Chat ID")
+    title: str | None = Field(default=None, max_length=255, description="Title")
+    metadata: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Chat metadata",
+        validation_alias=AliasChoices("metadata", "metadata_"),
+    )
+    created_at: datetime = Field(description="Chat creation timestamp")
+    updated_at: datetime = Field(description="Last update timestamp")
+
+
+class MessageRecord(BaseModel):
+    """A message line of an NDJSON export or import."""
+
+    type: Literal["message"] = "message"
+    id: UUID = Field(description="Message ID")
+    chat_id: UUID = Field(description="Parent chat ID")
+    role: MessageRole = Field(description="Message role")
+    content: str = Field(description="Message content")
+    tool_calls: list[dict[str, Any]] | None = Field(
+        default=None,
+        description="Tool calls made by assistant",
+    )
+    tool_call_id: str | None = Field(
+        default=None,
+        description="Tool call ID for tool response messages",
+    )
+    created_at: datetime = Field(description="Message creation timestamp")
+
+
+type TransferRecord = Annotated[ChatRecord | MessageRecord, Field(discriminator="type")]
+
+
+class ImportResponse(BaseModel):
+    """Schema for import summary response."""
+
+    chats: int = Field(ge=0, description="Number of chats inserted")
+    messages: int = Field(ge=0, description="Number of messages inserted")
+    skipped: int = Field(
+        ge=0,
+        description="Records skipped because their ID already exists",
+    )
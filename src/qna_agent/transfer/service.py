@@ -0,0 +1,293 @@
+"""Transfer service streaming chats in and out as NDJSON."""
+
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime
+from typing import Any, cast
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import DateTime, Insert, Table, bindparam, case, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.chats.models import Chat
+from qna_agent.database import mark_chat_written
+from qna_agent.messages.models import Message
+from qna_agent.retention.service import PartitionService
+from qna_agent.transfer.exceptions import InvalidRecordError
+from qna_agent.transfer.schemas import (
+    ChatRecord,
+    ImportResponse,
+    MessageRecord,
+    TransferRecord,
+)
+
+# Rows fetched per server-side cursor round trip and inserted per statement
+BATCH_SIZE = 500
+# Longest accepted import line; bounds memory for a stream without newlines
+MAX_LINE_BYTES = 1024 * 1024
+
+# The alias carries the discriminator, which type checkers cannot express
+_record_adapter: TypeAdapter[ChatRecord | MessageRecord] = TypeAdapter(
+    cast(Any, TransferRecord)
+)
+
+_CHAT_COLUMNS = (
+    Chat.id,
+    Chat.title,
+    Chat.metadata_,
+    Chat.created_at,
+    Chat.updated_at,
+)
+_MESSAGE_COLUMNS = (
+    Message.id,
+    Message.chat_id,
+    Message.role,
+    Message.content,
+    Message.tool_calls,
+    Message.tool_call_id,
+    Message.created_at,
+)
+
+# Bumps the counters of one chat per parameter set, sent as an executemany.
+# updated_at is set to itself so its onupdate default keeps the imported value
+_chats = cast(Table, Chat.__table__)
+_latest = bindparam("latest", type_=DateTime(timezone=True))
+_bump_counters = (
+    update(_chats)
+    .where(_chats.c.id == bindparam("chat", type_=_chats.c.id.type))
+    .values(
+        message_count=_chats.c.message_count + bindparam("added"),
+        last_message_at=case(
+            (_chats.c.last_message_at > _latest, _chats.c.last_message_at),
+            else_=_latest,
+        ),
+        updated_at=_chats.c.updated_at,
+    )
+)
+
+
+class TransferService:
+    """Service streaming chats and their messages in and out as NDJSON.
+
+    An export lists every chat first and then every message, ordered by
+    chat, so an import never sees a message before its chat. Memory use
+    is bounded by the batch size whatever the size of the dataset.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._messages_partitioned: bool | None = None
+
+    async def export(self) -> AsyncIterator[bytes]:
+        """Stream all chats and messages, one NDJSON chunk per batch."""
+        chats = await self._session.stream(
+            select(*_CHAT_COLUMNS)
+            .order_by(Chat.id)
+            .execution_options(yield_per=BATCH_SIZE)
+        )
+        async for rows in chats.mappings().partitions():
+            yield b"".join(_encode(ChatRecord.model_validate(row)) for row in rows)
+
+        messages = await self._session.stream(
+            select(*_MESSAGE_COLUMNS)
+            .order_by(Message.chat_id, Message.created_at, Message.id)
+            .execution_options(yield_per=BATCH_SIZE)
+        )
+        async for rows in messages.mappings().partitions():
+            yield b"".join(_encode(MessageRecord.model_validate(row)) for row in rows)
+
+    async def import_stream(self, body: AsyncIterable[bytes]) -> ImportResponse:
+        """Insert the records of an NDJSON stream in batches.
+
+        Records whose ID already exists are skipped, so an interrupted
+        import can be retried with the same file. Each batch is committed
+        as it is written.
+
+        Raises:
+            InvalidRecordError: If a line is not a valid record, or a message
+                belongs to a chat that does not exist
+        """
+        chats: list[ChatRecord] = []
+        messages: list[MessageRecord] = []
+        summary = ImportResponse(chats=0, messages=0, skipped=0)
+
+        line_number = 0
+        async for line in _lines(body):
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                record = _record_adapter.validate_json(line)
+            except PydanticValidationError as e:
+                error = e.errors(include_url=False)[0]
+                location = ".".join(str(part) for part in error["loc"])
+                reason = f"{location}: {error['msg']}" if location else error["msg"]
+                raise InvalidRecordError(line_number, reason) from e
+
+            if isinstance(record, ChatRecord):
+                chats.append(record)
+                if len(chats) >= BATCH_SIZE:
+                    await self._insert_chats(chats, summary)
+            else:
+                # Chats of pending messages must be written first
+                if chats:
+                    await self._insert_chats(chats, summary)
+                messages.append(record)
+                if len(messages) >= BATCH_SIZE:
+                    await self._insert_messages(messages, summary, line_number)
+
+        if chats:
+            await self._insert_chats(chats, summary)
+        if messages:
+            await self._insert_messages(messages, summary, line_number)
+        return summary
+
+    async def _insert_chats(
+        self,
+        records: list[ChatRecord],
+        summary: ImportResponse,
+    ) -> None:
+        """Insert a batch of chats, skipping existing IDs, and commit."""
+        rows = [
+            {
+                "id": record.id,
+                "title": record.title,
+                "metadata_": record.metadata,
+                "created_at": record.created_at,
+                "updated_at": record.updated_at,
+            }
+            for record in records
+        ]
+        result = await self._session.scalars(
+            _insert_ignoring_duplicates(self._dialect(), Chat, ["id"]).returning(
+                Chat.id
+            ),
+            rows,
+            execution_options={"render_nulls": True},
+        )
+        inserted = len(result.all())
+        await self._session.commit()
+
+        summary.chats += inserted
+        summary.skipped += len(records) - inserted
+        records.clear()
+
+    async def _insert_messages(
+        self,
+        records: list[MessageRecord],
+        summary: ImportResponse,
+        line_number: int,
+    ) -> None:
+        """Insert a batch of messages and bump their chats' counters."""
+        rows = [
+            {
+                "id": record.id,
+                "chat_id": record.chat_id,
+                "role": record.role,
+                "content": record.content,
+                "tool_calls": record.tool_calls,
+                "tool_call_id": record.tool_call_id,
+                "created_at": record.created_at,
+            }
+            for record in records
+        ]
+        try:
+            insert = _insert_ignoring_duplicates(
+                self._dialect(), Message, await self._message_conflict_columns()
+            )
+            result = await self._session.execute(
+                insert.returning(Message.chat_id, Message.created_at),
+                rows,
+                execution_options={"render_nulls": True},
+            )
+            inserted = result.all()
+            if inserted:
+                await self._session.execute(_bump_counters, _activity(inserted))
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise InvalidRecordError(
+                line_number,
+                "a message in the batch ending here belongs to an unknown chat",
+            ) from e
+        await self._session.commit()
+
+        for chat_id in {row.chat_id for row in inserted}:
+            mark_chat_written(chat_id)
+        summary.messages += len(inserted)
+        summary.skipped += len(records) - len(inserted)
+        records.clear()
+
+    def _dialect(self) -> str:
+        """Name of the database dialect in use."""
+        return self._session.get_bind().dialect.name
+
+    async def _message_conflict_columns(self) -> list[str]:
+        """Columns of the unique index duplicate messages conflict on.
+
+        Unique indexes of a partitioned table must include the partition
+        key, so a messages table partitioned by month is only unique on
+        ``(id, created_at)``. Exports carry both, so re-imported messages
+        still conflict.
+        """
+        if self._dialect() != "postgresql":
+            return ["id"]
+        if self._messages_partitioned is None:
+            connection = await self._session.connection()
+            self._messages_partitioned = await PartitionService(
+                connection
+            ).is_partitioned()
+        return ["id", "created_at"] if self._messages_partitioned else ["id"]
+
+
+def _insert_ignoring_duplicates(
+    dialect: str,
+    model: type[Chat | Message],
+    index_elements: list[str],
+) -> Insert:
+    """Build an INSERT for ``model`` that skips rows conflicting on a key."""
+    if dialect == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing(
+            index_elements=index_elements
+        )
+    return sqlite.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+
+
+def _encode(record: ChatRecord | MessageRecord) -> bytes:
+    """Encode a record as one NDJSON line."""
+    return record.model_dump_json().encode() + b"\n"
+
+
+def _activity(rows: Any) -> list[dict[str, Any]]:
+    """Aggregate inserted (chat_id, created_at) rows into counter updates."""
+    added: dict[UUID, int] = defaultdict(int)
+    latest: dict[UUID, datetime] = {}
+    for chat_id, created_at in rows:
+        added[chat_id] += 1
+        if chat_id not in latest or created_at > latest[chat_id]:
+            latest[chat_id] = created_at
+    return [
+        {"chat": chat_id, "added": count, "latest": latest[chat_id]}
+        for chat_id, count in added.items()
+    ]
+
+
+async def _lines(body: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines without buffering more than one line."""
+    buffer = b""
+    count = 0
+    async for chunk in body:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            count += 1
+            yield line
+        if len(buffer) > MAX_LINE_BYTES:
+            raise InvalidRecordError(
+                count + 1, f"line is longer than {MAX_LINE_BYTES} bytes"
+            )
+    if buffer:
+        yield buffer
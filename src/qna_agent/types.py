@@ -0,0 +1,130 @@
+"""Custom SQLAlchemy column types."""
+
+from compression import zstd
+from typing import Any
+
+import pydantic_core
+from sqlalchemy import Dialect, LargeBinary, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import BindParameter, ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+# Values are stored with a one-byte header describing the payload encoding
+PLAIN = b"\x00"
+ZSTD = b"\x01"
+
+# Payloads shorter than this are stored as-is; compressing them saves
+# little and costs a decompression on every read
+COMPRESSION_THRESHOLD = 1024
+COMPRESSION_LEVEL = 3
+
+# Language-agnostic text search configuration: chats mix several languages,
+# so words are lowercased but not stemmed
+SEARCH_CONFIG = "simple"
+
+
+def pack(data: bytes, threshold: int = COMPRESSION_THRESHOLD) -> bytes:
+    """Encode a payload, compressing it if it is large enough to pay off."""
+    if len(data) >= threshold:
+        compressed = zstd.compress(data, level=COMPRESSION_LEVEL)
+        if len(compressed) < len(data):
+            return ZSTD + compressed
+    return PLAIN + data
+
+
+def unpack(value: bytes) -> bytes:
+    """Decode a payload produced by :func:`pack`."""
+    header, data = value[:1], value[1:]
+    if header == ZSTD:
+        return zstd.decompress(data)
+    if header == PLAIN:
+        return data
+    raise ValueError(f"Unknown payload header: {header!r}")
+
+
+class CompressedText(TypeDecorator[str]):
+    """Text stored as a binary payload, zstd-compressed above a threshold."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, threshold: int = COMPRESSION_THRESHOLD) -> None:
+        super().__init__()
+        self.threshold = threshold
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        if value is None:
+            return None
+        return pack(value.encode(), self.threshold)
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        return unpack(value).decode()
+
+
+class CompressedJSON(TypeDecorator[Any]):
+    """JSON stored as a binary payload, zstd-compressed above a threshold.
+
+    Unlike ``JSON``, the stored value cannot be queried by the database.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, threshold: int = COMPRESSION_THRESHOLD) -> None:
+        super().__init__()
+        self.threshold = threshold
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> bytes | None:
+        if value is None:
+            return None
+        return pack(pydantic_core.to_json(value), self.threshold)
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> Any:
+        if value is None:
+            return None
+        return pydantic_core.from_json(unpack(value))
+
+
+class to_search_vector(FunctionElement[str]):  # noqa: N801
+    """SQL expression turning plain text into a search document."""
+
+    inherit_cache = True
+
+
+@compiles(to_search_vector)
+def _compile_search_vector(  # pyright: ignore[reportUnusedFunction]
+    element: to_search_vector, compiler: SQLCompiler, **kw: Any
+) -> str:
+    """Plain text, indexed by an FTS5 table fed by triggers."""
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(to_search_vector, "postgresql")
+def _compile_search_vector_postgresql(  # pyright: ignore[reportUnusedFunction]
+    element: to_search_vector, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return f"to_tsvector('{SEARCH_CONFIG}', {compiler.process(element.clauses, **kw)})"
+
+
+class SearchVector(TypeDecorator[str]):
+    """Write-only full-text search document built from plain text.
+
+    Stored as ``tsvector`` on PostgreSQL, computed by the database from the
+    bound text. On SQLite the text is handed to an FTS5 index by triggers.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(TSVECTOR())
+        return dialect.type_descriptor(Text())
+
+    def bind_expression(self, bindparam: BindParameter[str]) -> ColumnElement[str]:
+        return to_search_vector(bindparam)
@@ -0,0 +1,223 @@
+"""Tests for LLMClient."""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from qna_agent.agent.client import (
+    LLM_CACHED_PROMPT_TOKENS,
+    LLM_HEDGE_WINS,
+    LLM_HEDGED_REQUESTS,
+    LLM_REQUEST_DURATION,
+    LLMClient,
+)
+
+
+def _response(content: str) -> MagicMock:
+    """Build a fake litellm ModelResponse."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.model_dump.return_value = {
+        "choices": [{"message": {"content": content}, "finish_reason": "stop"}]
+    }
+    return response
+
+
+def _client(**overrides: Any) -> LLMClient:
+    """Create an LLMClient with hedging configured via overrides."""
+    with patch("qna_agent.agent.client.get_agent_settings") as mock_settings:
+        settings = mock_settings.return_value
+        settings.langfuse_public_key = ""
+        settings.langfuse_secret_key = ""
+        settings.litellm_api_base = "https://primary.example/v1"
+        settings.litellm_model = "openrouter/openai/gpt-4o-mini"
+        settings.llm_prompt_cache_hints = "auto"
+        settings.llm_hedge_enabled = True
+        settings.llm_hedge_percentile = 0.95
+        settings.llm_hedge_min_delay = 0.05
+        settings.llm_hedge_min_samples = 1_000_000
+        settings.llm_hedge_api_base = ""
+        for key, value in overrides.items():
+            setattr(settings, key, value)
+        return LLMClient()
+
+
+@pytest.mark.anyio
+async def test_chat_completion_without_hedging() -> None:
+    """Test that only one request is sent when hedging is disabled."""
+    client = _client(llm_hedge_enabled=False)
+    calls: list[dict[str, Any]] = []
+
+    async def fake_completion(**kwargs: Any) -> MagicMock:
+        calls.append(kwargs)
+        return _response("primary")
+
+    with patch("qna_agent.agent.client.acompletion", side_effect=fake_completion):
+        result = await client.chat_completion([{"role": "user", "content": "Hi"}])
+
+    assert len(calls) == 1
+    assert result["choices"][0]["message"]["content"] == "primary"
+
+
+@pytest.mark.anyio
+async def test_fast_primary_is_not_hedged() -> None:
+    """Test that a request finishing before the hedge delay is not duplicated."""
+    client = _client()
+    calls: list[dict[str, Any]] = []
+    hedged_before = LLM_HEDGED_REQUESTS.value
+
+    async def fake_completion(**kwargs: Any) -> MagicMock:
+        calls.append(kwargs)
+        return _response("primary")
+
+    with patch("qna_agent.agent.client.acompletion", side_effect=fake_completion):
+        await client.chat_completion([{"role": "user", "content": "Hi"}])
+
+    assert len(calls) == 1
+    assert LLM_HEDGED_REQUESTS.value == hedged_before
+
+
+@pytest.mark.anyio
+async def test_slow_primary_is_hedged_and_cancelled() -> None:
+    """Test that a hedge wins over a slow primary, which is then cancelled."""
+    client = _client(llm_hedge_api_base="https://hedge.example/v1")
+    primary_cancelled = asyncio.Event()
+    hedged_before = LLM_HEDGED_REQUESTS.value
+    wins_before = LLM_HEDGE_WINS.value
+
+    async def fake_completion(**kwargs: Any) -> MagicMock:
+        if kwargs["api_base"] == "https://primary.example/v1":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+        return _response("hedge")
+
+    with patch("qna_agent.agent.client.acompletion", side_effect=fake_completion):
+        result = await client.chat_completion([{"role": "user", "content": "Hi"}])
+        await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+
+    assert result["choices"][0]["message"]["content"] == "hedge"
+    assert LLM_HEDGED_REQUESTS.value == hedged_before + 1
+    assert LLM_HEDGE_WINS.value == wins_before + 1
+
+
+@pytest.mark.anyio
+async def test_cancelled_primary_latency_is_recorded() -> None:
+    """Test that a primary cancelled by a winning hedge is still timed."""
+    client = _client()
+    primary_cancelled = asyncio.Event()
+    observed_before = LLM_REQUEST_DURATION.count
+    attempts = 0
+
+    async def fake_completion(**kwargs: Any) -> MagicMock:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+        return _response("hedge")
+
+    with patch("qna_agent.agent.client.acompletion", side_effect=fake_completion):
+        await client.chat_completion([{"role": "user", "content": "Hi"}])
+        await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+
+    # The hedge and the cancelled primary, which ran past the hedge delay
+    assert LLM_REQUEST_DURATION.count == observed_before + 2
+    assert (LLM_REQUEST_DURATION.percentile(1.0) or 0.0) >= 0.05
+
+
+@pytest.mark.anyio
+async def test_hedge_failure_falls_back_to_primary() -> None:
+    """Test that a failing hedge does not fail the call if the primary succeeds."""
+    client = _client()
+    wins_before = LLM_HEDGE_WINS.value
+    attempts = 0
+
+    async def fake_completion(**kwargs: Any) -> MagicMock:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(0.2)
+            return _response("primary")
+        raise RuntimeError("hedge failed")
+
+    with patch("qna_agent.agent.client.acompletion", side_effect=fake_completion):
+        result = await client.chat_completion([{"role": "user", "content": "Hi"}])
+
+    assert result["choices"][0]["message"]["content"] == "primary"
+    assert LLM_HEDGE_WINS.value == wins_before
+
+
+@pytest.mark.anyio
+async def test_cache_hints_for_anthropic_models() -> None:
+    """Test cache_control breakpoints on the system prompt and latest message."""
+    client = _client(
+        llm_hedge_enabled=False,
+        litellm_model="openrouter/anthropic/claude-sonnet-4",
+    )
+    messages = [
+        {"role": "system", "content": "System prompt"},
+        {"role": "user", "content": "Earlier question"},
+        {"role": "user", "content": "Latest question"},
+    ]
+    calls: list[dict[str, Any]] = []
+
+    async def fake_completion(**kwargs: Any) -> MagicMock:
+        calls.append(kwargs)
+        return _response("ok")
+
+    with patch("qna_agent.agent.client.acompletion", side_effect=fake_completion):
+        await client.chat_completion(messages)
+
+    sent = calls[0]["messages"]
+    assert sent[0]["content"] == [
+        {
+            "type": "text",
+            "text": "System prompt",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    assert sent[1] == messages[1]
+    assert sent[2]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert messages[0]["content"] == "System prompt"
+
+
+@pytest.mark.anyio
+async def test_no_cache_hints_for_openai_models() -> None:
+    """Test that OpenAI-style models receive plain string content."""
+    client = _client(llm_hedge_enabled=False)
+    messages = [{"role": "system", "content": "System prompt"}]
+    calls: list[dict[str, Any]] = []
+
+    async def fake_completion(**kwargs: Any) -> MagicMock:
+        calls.append(kwargs)
+        return _response("ok")
+
+    with patch("qna_agent.agent.client.acompletion", side_effect=fake_completion):
+        await client.chat_completion(messages)
+
+    assert calls[0]["messages"] == messages
+
+
+@pytest.mark.anyio
+async def test_cached_tokens_recorded() -> None:
+    """Test that cached prompt tokens from usage are recorded."""
+    client = _client(llm_hedge_enabled=False)
+    response = _response("ok")
+    response.model_dump.return_value["usage"] = {
+        "prompt_tokens": 2000,
+        "prompt_tokens_details": {"cached_tokens": 1536},
+    }
+    cached_before = LLM_CACHED_PROMPT_TOKENS.value
+
+    with patch("qna_agent.agent.client.acompletion", return_value=response):
+        await client.chat_completion([{"role": "user", "content": "Hi"}])
+
+    assert LLM_CACHED_PROMPT_TOKENS.value == cached_before + 1536
@@ -1,12 +1,19 @@
 """Tests for AgentService."""
 
+import asyncio
+import json
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
 from qna_agent.agent.exceptions import MaxIterationsExceededError, ToolExecutionError
-from qna_agent.agent.service import AgentResponse, AgentService
+from qna_agent.agent.service import (
+    AGENT_COALESCED_REQUESTS,
+    AgentResponse,
+    AgentService,
+)
 
 
 @pytest.fixture
@@ -255,3 +262,145 @@ async def test_execute_tool_invalid_json(agent_service: AgentService) -> None:
         )
 
     assert "Invalid arguments" in str(exc_info.value)
+
+
+@pytest.mark.anyio
+async def test_process_message_keeps_prefix_stable(
+    agent_service: AgentService,
+    mock_llm_client: MagicMock,
+    mock_knowledge_service: MagicMock,
+) -> None:
+    """Test that each loop iteration resends an identical prefix."""
+    mock_knowledge_service.list_files = AsyncMock(return_value=[])
+    sent: list[str] = []
+    responses = [
+        {
+            "choices": [
+                {
+                    "message": {
+                        "content": None,
+                        "tool_calls": [
+                            {
+                                "id": "call_1",
+                                "function": {
+                                    "name": "list_knowledge_files",
+                                    "arguments": "{}",
+                                },
+                            }
+                        ],
+                        "provider_specific_fields": {"refusal": None},
+                    },
+                    "finish_reason": "tool_calls",
+                }
+            ]
+        },
+        {"choices": [{"message": {"content": "Done"}, "finish_reason": "stop"}]},
+    ]
+
+    async def record(messages: list[dict[str, Any]], **_: Any) -> dict[str, Any]:
+        sent.append(json.dumps(messages))
+        return responses[len(sent) - 1]
+
+    mock_llm_client.chat_completion = AsyncMock(side_effect=record)
+
+    await agent_service.process_message(
+        chat_id=uuid4(),
+        messages=[{"role": "user", "content": "List files"}],
+    )
+
+    assert sent[1].startswith(sent[0][:-1])
+    assert "provider_specific_fields" not in sent[1]
+
+
+@pytest.mark.anyio
+async def test_identical_concurrent_requests_are_coalesced(
+    agent_service: AgentService,
+    mock_llm_client: MagicMock,
+) -> None:
+    """Test that identical in-flight requests share a single LLM call."""
+    release = asyncio.Event()
+    coalesced_before = AGENT_COALESCED_REQUESTS.value
+
+    async def slow_completion(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        await release.wait()
+        return {"choices": [{"message": {"content": "Shared"}}]}
+
+    mock_llm_client.chat_completion = AsyncMock(side_effect=slow_completion)
+    messages = [{"role": "user", "content": "What is Evrone?"}]
+
+    runs = [
+        asyncio.ensure_future(agent_service.process_message(uuid4(), messages))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(*runs)
+
+    assert mock_llm_client.chat_completion.await_count == 1
+    assert [r.content for r in responses] == ["Shared"] * 3
+    assert AGENT_COALESCED_REQUESTS.value == coalesced_before + 2
+    # The shared run answers several chats, so it is traced under none
+    assert mock_llm_client.chat_completion.await_args.kwargs["chat_id"] is None
+
+
+@pytest.mark.anyio
+async def test_requests_are_not_coalesced_when_disabled(
+    agent_service: AgentService,
+    mock_llm_client: MagicMock,
+) -> None:
+    """Test that every request runs and is traced under its own chat."""
+    agent_service._settings.agent_coalesce_requests = False
+    mock_llm_client.chat_completion = AsyncMock(
+        return_value={"choices": [{"message": {"content": "Answer"}}]}
+    )
+    messages = [{"role": "user", "content": "Same question"}]
+    chat_ids = [uuid4(), uuid4()]
+
+    await asyncio.gather(
+        *(agent_service.process_message(chat_id, messages) for chat_id in chat_ids)
+    )
+
+    traced = [
+        call.kwargs["chat_id"]
+        for call in mock_llm_client.chat_completion.await_args_list
+    ]
+    assert sorted(traced) == sorted(str(chat_id) for chat_id in chat_ids)
+
+
+@pytest.mark.anyio
+async def test_different_requests_are_not_coalesced(
+    agent_service: AgentService,
+    mock_llm_client: MagicMock,
+) -> None:
+    """Test that requests with different history run independently."""
+    mock_llm_client.chat_completion = AsyncMock(
+        return_value={"choices": [{"message": {"content": "Answer"}}]}
+    )
+
+    await asyncio.gather(
+        agent_service.process_message(uuid4(), [{"role": "user", "content": "A"}]),
+        agent_service.process_message(uuid4(), [{"role": "user", "content": "B"}]),
+    )
+
+    assert mock_llm_client.chat_completion.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_coalesced_failure_reaches_all_waiters(
+    agent_service: AgentService,
+    mock_llm_client: MagicMock,
+) -> None:
+    """Test that an error in the shared run is raised to every caller."""
+    mock_llm_client.chat_completion = AsyncMock(
+        side_effect=MaxIterationsExceededError(10)
+    )
+    messages = [{"role": "user", "content": "Same question"}]
+
+    results = await asyncio.gather(
+        agent_service.process_message(uuid4(), messages),
+        agent_service.process_message(uuid4(), messages),
+        return_exceptions=True,
+    )
+
+    assert mock_llm_client.chat_completion.await_count == 1
+    assert all(isinstance(r, MaxIterationsExceededError) for r in results)
@@ -0,0 +1 @@
+"""Benchmarks for database access patterns."""
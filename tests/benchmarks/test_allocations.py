@@ -0,0 +1,64 @@
+"""Memory retained per listed item.
+
+List endpoints select plain Core rows instead of hydrating ORM objects;
+these tests compare what each approach keeps alive for the same page.
+"""
+
+import tracemalloc
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.chats.models import Chat
+from qna_agent.chats.schemas import ChatCreate
+from qna_agent.chats.service import ChatService
+
+PAGE_SIZE = 100
+
+
+async def _retained(
+    session: AsyncSession,
+    load: Callable[[], Awaitable[Sequence[Any]]],
+) -> int:
+    """Bytes kept alive by a loaded page, with an empty identity map."""
+    session.expunge_all()
+    tracemalloc.start()
+    try:
+        page = await load()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(page) == PAGE_SIZE
+    return retained
+
+
+@pytest.mark.benchmark
+@pytest.mark.anyio
+async def test_chat_rows_retain_less_than_orm_objects(
+    async_session: AsyncSession,
+) -> None:
+    """Test that listing chats as rows retains a fraction of ORM hydration."""
+    service = ChatService(async_session)
+    for i in range(PAGE_SIZE):
+        await service.create(ChatCreate(title=f"Chat {i}", metadata={"n": i}))
+    await async_session.commit()
+
+    async def load_orm() -> Sequence[Chat]:
+        result = await async_session.execute(select(Chat).limit(PAGE_SIZE))
+        return result.scalars().all()
+
+    async def load_rows() -> Sequence[Any]:
+        rows, _ = await service.list(page_size=PAGE_SIZE)
+        return rows
+
+    # Warm up compiled statement caches so only the results are measured
+    await load_orm()
+    await load_rows()
+
+    orm = await _retained(async_session, load_orm)
+    rows = await _retained(async_session, load_rows)
+
+    assert rows * 2 < orm
@@ -0,0 +1,138 @@
+"""Cost and savings of compressed message payloads.
+
+Stores the same long assistant answers with tool calls in a plain
+Text/JSON table and in a CompressedText/CompressedJSON table, and compares
+stored bytes and insert and read throughput.
+"""
+
+import json
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any
+
+import pytest
+from sqlalchemy import (
+    JSON,
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    delete,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from qna_agent.types import CompressedJSON, CompressedText
+
+ROWS = 200
+
+metadata = MetaData()
+plain = Table(
+    "plain",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("content", Text),
+    Column("tool_calls", JSON),
+)
+compressed = Table(
+    "compressed",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("content", CompressedText()),
+    Column("tool_calls", CompressedJSON()),
+)
+
+
+def _rows() -> list[dict[str, Any]]:
+    """Long answers quoting a document, with a search tool call."""
+    document = "\n".join(
+        f"Section {n}: pricing, plans and limits of the product tier {n % 7}."
+        for n in range(120)
+    )
+    return [
+        {
+            "id": i,
+            "content": f"Answer {i}. According to the knowledge base:\n{document}",
+            "tool_calls": [
+                {
+                    "id": f"call_{i}",
+                    "type": "function",
+                    "function": {
+                        "name": "read_document",
+                        "arguments": json.dumps({"filename": "pricing.md"}),
+                        "result": document,
+                    },
+                }
+            ],
+        }
+        for i in range(ROWS)
+    ]
+
+
+@pytest.fixture
+async def connection() -> AsyncGenerator[AsyncConnection]:
+    """In-memory database holding both tables."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as connection:
+        await connection.run_sync(metadata.create_all)
+        yield connection
+    await engine.dispose()
+
+
+async def _best_of(fn: Callable[[], Awaitable[Any]], repeat: int = 5) -> float:
+    """Return the best runtime of ``fn`` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.mark.anyio
+async def test_compressed_payloads_take_less_space(
+    connection: AsyncConnection,
+) -> None:
+    """Test that long answers and tool calls shrink several times."""
+    rows = _rows()
+    await connection.execute(insert(plain), rows)
+    await connection.execute(insert(compressed), rows)
+
+    async def stored(table: Table) -> int:
+        query = select(
+            func.sum(func.length(table.c.content) + func.length(table.c.tool_calls))
+        )
+        return (await connection.execute(query)).scalar_one()
+
+    assert await stored(compressed) * 5 < await stored(plain)
+
+
+@pytest.mark.anyio
+async def test_compression_insert_and_read_overhead(
+    connection: AsyncConnection,
+) -> None:
+    """Test that compression keeps insert and read throughput in range.
+
+    Smaller rows mean less I/O and buffer cache pressure on a real server;
+    in memory only the CPU cost shows, which must stay a small multiple.
+    """
+    rows = _rows()
+
+    async def insert_into(table: Table) -> None:
+        await connection.execute(delete(table))
+        await connection.execute(insert(table), rows)
+
+    async def read_from(table: Table) -> None:
+        result = await connection.execute(select(table))
+        assert len(result.all()) == ROWS
+
+    insert_plain = await _best_of(lambda: insert_into(plain))
+    insert_compressed = await _best_of(lambda: insert_into(compressed))
+    read_plain = await _best_of(lambda: read_from(plain))
+    read_compressed = await _best_of(lambda: read_from(compressed))
+
+    assert insert_compressed < insert_plain * 3
+    assert read_compressed < read_plain * 3
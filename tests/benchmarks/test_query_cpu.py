@@ -0,0 +1,121 @@
+"""CPU time of the hot chat lookup and history queries.
+
+Both run on every message turn. They are lambda statements, which
+SQLAlchemy builds and cache-keys once per call site instead of on every
+request; these tests compare that with rebuilding the same statement.
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Select, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.chats.models import Chat
+from qna_agent.chats.schemas import ChatCreate
+from qna_agent.chats.service import ChatService
+from qna_agent.messages.models import Message, MessageRole
+from qna_agent.messages.service import MessageService
+
+
+def _cpu_per_call(fn: Callable[[], Any], repeat: int = 5, number: int = 500) -> float:
+    """Return the best average CPU time of ``fn`` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.process_time()
+        for _ in range(number):
+            fn()
+        timings.append((time.process_time() - started) / number)
+    return min(timings)
+
+
+async def _async_cpu_per_call(
+    fn: Callable[[], Awaitable[Any]],
+    repeat: int = 5,
+    number: int = 100,
+) -> float:
+    """Return the best average CPU time of an async ``fn`` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.process_time()
+        for _ in range(number):
+            await fn()
+        timings.append((time.process_time() - started) / number)
+    return min(timings)
+
+
+@pytest.mark.benchmark
+def test_lambda_lookup_builds_faster() -> None:
+    """Test that the cached chat lookup is cheaper to build than a new one."""
+    chat_id = uuid4()
+
+    def rebuilt() -> None:
+        select(Chat).where(Chat.id == chat_id)._generate_cache_key()
+
+    def cached() -> None:
+        lambda_stmt(
+            lambda: select(Chat).where(Chat.id == chat_id)
+        )._generate_cache_key()
+
+    assert _cpu_per_call(cached) < _cpu_per_call(rebuilt)
+
+
+@pytest.mark.benchmark
+def test_lambda_history_builds_faster() -> None:
+    """Test that the cached history query is cheaper to build than a new one."""
+    chat_id = uuid4()
+    limit = 50
+
+    def history() -> Select[Any]:
+        return (
+            select(Chat.id, Message)
+            .outerjoin(Message, Message.chat_id == Chat.id)
+            .where(Chat.id == chat_id)
+            .order_by(Message.created_at.desc(), Message.id.desc())
+            .limit(limit)
+        )
+
+    def rebuilt() -> None:
+        history()._generate_cache_key()
+
+    def cached() -> None:
+        lambda_stmt(history)._generate_cache_key()
+
+    assert _cpu_per_call(cached) < _cpu_per_call(rebuilt)
+
+
+@pytest.mark.anyio
+async def test_hot_path_cpu_per_request(
+    async_session: AsyncSession,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Record per-request CPU time of the chat lookup and LLM history.
+
+    The lookup calls ``ChatService.get``: ``valid_chat_id`` answers from the
+    chat existence cache after the first call and would measure no query.
+    """
+    chat = await ChatService(async_session).create(ChatCreate(title="Bench"))
+    message_service = MessageService(async_session)
+    for i in range(20):
+        await message_service.create(chat.id, MessageRole.USER, f"Question {i}")
+    await async_session.commit()
+
+    async def lookup() -> None:
+        await ChatService(async_session).get(chat.id)
+
+    async def history() -> None:
+        await message_service.get_chat_history_for_llm(chat.id)
+
+    # Warm up compiled statement caches so only steady state is measured
+    await lookup()
+    await history()
+
+    lookup_cpu = await _async_cpu_per_call(lookup)
+    history_cpu = await _async_cpu_per_call(history)
+    record_property("chat_get_cpu_us", round(lookup_cpu * 1e6))
+    record_property("get_chat_history_for_llm_cpu_us", round(history_cpu * 1e6))
+
+    assert len(await message_service.get_chat_history_for_llm(chat.id)) == 20
@@ -0,0 +1,175 @@
+"""Database round trips per request.
+
+Each statement is one round trip to the database, so these tests pin the
+number of statements the hot endpoints send.
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+from qna_agent.agent.service import AgentResponse
+from qna_agent.chats.cache import chat_cache
+
+
+def _count(statements: list[str], verb: str) -> int:
+    """Count statements starting with the given SQL verb."""
+    return sum(s.lstrip().upper().startswith(verb) for s in statements)
+
+
+@pytest.mark.anyio
+async def test_create_chat_round_trips(
+    client: AsyncClient,
+    statement_counter: list[str],
+) -> None:
+    """Test that creating a chat is a single INSERT."""
+    response = await client.post("/api/v1/chats", json={"title": "Bench"})
+
+    assert response.status_code == 201
+    assert len(statement_counter) == 1
+    assert _count(statement_counter, "INSERT") == 1
+
+
+@pytest.mark.anyio
+async def test_message_turn_round_trips(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    statement_counter: list[str],
+) -> None:
+    """Test one turn: history, one INSERT and the chat counters.
+
+    The history query also validates the chat. Before dropping
+    refresh() and the eager load of Chat.messages the same turn took 7
+    statements without maintaining any counters.
+    """
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        return_value=AgentResponse(content="Answer"),
+    ):
+        response = await client.post(
+            f"/api/v1/chats/{created_chat['id']}/messages",
+            json={"content": "Question"},
+        )
+
+    assert response.status_code == 201
+    assert _count(statement_counter, "SELECT") == 1
+    assert _count(statement_counter, "INSERT") == 1
+    assert _count(statement_counter, "UPDATE") == 1
+    assert len(statement_counter) == 3
+
+
+@pytest.mark.anyio
+async def test_message_turn_validates_chat_with_history(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    statement_counter: list[str],
+) -> None:
+    """Test that an uncached chat is validated by the history query itself."""
+    chat_cache.clear()
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        return_value=AgentResponse(content="Answer"),
+    ):
+        response = await client.post(
+            f"/api/v1/chats/{created_chat['id']}/messages",
+            json={"content": "Question"},
+        )
+
+    assert response.status_code == 201
+    assert _count(statement_counter, "SELECT") == 1
+    assert len(statement_counter) == 3
+
+
+@pytest.mark.anyio
+async def test_uncached_chat_is_looked_up_once(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    statement_counter: list[str],
+) -> None:
+    """Test that only the first check of an uncached chat queries it."""
+    chat_cache.clear()
+    url = f"/api/v1/chats/{created_chat['id']}/jobs/{created_chat['id']}"
+
+    await client.get(url)
+    await client.get(url)
+
+    # One existence check, then one job lookup per request
+    assert _count(statement_counter, "SELECT") == 3
+
+
+@pytest.mark.anyio
+async def test_chat_lookup_does_not_load_messages(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    statement_counter: list[str],
+) -> None:
+    """Test that fetching a chat is a single SELECT regardless of history."""
+    response = await client.get(f"/api/v1/chats/{created_chat['id']}")
+
+    assert response.status_code == 200
+    assert len(statement_counter) == 1
+
+
+@pytest.mark.anyio
+async def test_not_modified_messages_skip_message_query(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    statement_counter: list[str],
+) -> None:
+    """Test that a 304 on the message list only looks up the chat."""
+    url = f"/api/v1/chats/{created_chat['id']}/messages"
+    etag = (await client.get(url)).headers["etag"]
+    statement_counter.clear()
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert len(statement_counter) == 1
+
+
+@pytest.mark.anyio
+async def test_update_chat_round_trips(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    statement_counter: list[str],
+) -> None:
+    """Test that a PATCH is a single UPDATE ... RETURNING."""
+    response = await client.patch(
+        f"/api/v1/chats/{created_chat['id']}",
+        json={"title": "Renamed", "metadata": {"key": "value"}},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["metadata"] == {"key": "value"}
+    assert len(statement_counter) == 1
+    assert _count(statement_counter, "UPDATE") == 1
+
+
+@pytest.mark.anyio
+async def test_delete_chat_round_trips(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    statement_counter: list[str],
+) -> None:
+    """Test that deleting a chat is one DELETE, whatever its history size."""
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        return_value=AgentResponse(content="Answer"),
+    ):
+        for _ in range(5):
+            await client.post(
+                f"/api/v1/chats/{created_chat['id']}/messages",
+                json={"content": "Question"},
+            )
+    statement_counter.clear()
+
+    response = await client.delete(f"/api/v1/chats/{created_chat['id']}")
+
+    assert response.status_code == 204
+    assert len(statement_counter) == 1
+    assert _count(statement_counter, "DELETE") == 1
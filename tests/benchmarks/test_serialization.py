@@ -0,0 +1,84 @@
+"""Response rendering cost for large message lists.
+
+Compares the stdlib JSON encoder used by FastAPI's default response class
+with FastJSONResponse, both fed by FastAPI's own response-model
+serialization, on a page of long assistant messages with tool calls.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from qna_agent.messages.models import MessageRole
+from qna_agent.messages.schemas import MessageListResponse, MessageResponse
+from qna_agent.responses import FastJSONResponse
+
+
+def _large_page(size: int = 200) -> MessageListResponse:
+    """Build a page of long messages with tool call payloads."""
+    chat_id = uuid4()
+    tool_calls = [
+        {
+            "id": "call_1",
+            "type": "function",
+            "function": {
+                "name": "search_knowledge_base",
+                "arguments": json.dumps({"query": "pricing " * 20}),
+            },
+        }
+    ]
+    items = [
+        MessageResponse(
+            id=uuid4(),
+            chat_id=chat_id,
+            role=MessageRole.ASSISTANT,
+            content="Here is what the knowledge base says about pricing. " * 80,
+            tool_calls=tool_calls,
+            created_at=datetime.now(UTC),
+        )
+        for _ in range(size)
+    ]
+    return MessageListResponse(items=items, total=size)
+
+
+def _best_of(fn: Callable[[], Any], repeat: int = 5, number: int = 10) -> float:
+    """Return the best average runtime of ``fn`` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - started) / number)
+    return min(timings)
+
+
+@pytest.mark.anyio
+async def test_fast_json_response_matches_default() -> None:
+    """Test that both response classes render the same document."""
+    field = create_model_field("response", MessageListResponse, mode="serialization")
+    content = await serialize_response(field=field, response_content=_large_page())
+
+    assert json.loads(FastJSONResponse(content).body) == json.loads(
+        JSONResponse(content).body
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.anyio
+async def test_fast_json_response_is_faster_on_large_lists() -> None:
+    """Test that rendering a large message list beats the stdlib encoder."""
+    field = create_model_field("response", MessageListResponse, mode="serialization")
+    content = await serialize_response(field=field, response_content=_large_page())
+
+    before = _best_of(lambda: JSONResponse(content))
+    after = _best_of(lambda: FastJSONResponse(content))
+
+    assert after < before
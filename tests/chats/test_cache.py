@@ -0,0 +1,50 @@
+"""Tests for ChatExistenceCache."""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+from qna_agent.chats.cache import ChatExistenceCache
+
+
+def test_cached_chat_expires_after_ttl() -> None:
+    """Test that an entry is only trusted within its TTL."""
+    cache = ChatExistenceCache(ttl=5.0, max_size=10)
+    chat_id = uuid4()
+
+    with patch("qna_agent.chats.cache.time.monotonic", return_value=100.0):
+        cache.add(chat_id)
+    with patch("qna_agent.chats.cache.time.monotonic", return_value=104.0):
+        assert chat_id in cache
+    with patch("qna_agent.chats.cache.time.monotonic", return_value=105.0):
+        assert chat_id not in cache
+
+    assert len(cache) == 0
+
+
+def test_least_recently_used_chat_is_evicted() -> None:
+    """Test that the cache stays within its size bound."""
+    cache = ChatExistenceCache(ttl=60.0, max_size=2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    cache.add(first)
+    cache.add(second)
+    assert first in cache
+    cache.add(third)
+
+    assert first in cache
+    assert second not in cache
+    assert third in cache
+
+
+def test_discard_and_disabled_cache() -> None:
+    """Test that discarded chats and a zero TTL are never cached."""
+    cache = ChatExistenceCache(ttl=60.0, max_size=10)
+    chat_id = uuid4()
+    cache.add(chat_id)
+    cache.discard(chat_id)
+
+    disabled = ChatExistenceCache(ttl=0, max_size=10)
+    disabled.add(chat_id)
+
+    assert chat_id not in cache
+    assert chat_id not in disabled
@@ -166,6 +166,36 @@ async def test_list_chats_pagination_beyond_total(client: AsyncClient) -> None:
     assert data["total"] == 1
 
 
+@pytest.mark.anyio
+async def test_list_chats_filtered_by_metadata(client: AsyncClient) -> None:
+    """Test filtering chats by a metadata value."""
+    await client.post("/api/v1/chats", json={"metadata": {"tenant_id": "acme"}})
+    await client.post("/api/v1/chats", json={"metadata": {"tenant_id": "globex"}})
+
+    response = await client.get(
+        "/api/v1/chats", params={"metadata": '{"tenant_id": "acme"}'}
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["total"] == 1
+    assert data["items"][0]["metadata"] == {"tenant_id": "acme"}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "metadata",
+    ["not json", "[1]", "{}", '{"nested": {"a": 1}}', '{"bad key": 1}'],
+)
+async def test_list_chats_invalid_metadata_filter(
+    client: AsyncClient, metadata: str
+) -> None:
+    """Test that malformed metadata filters are rejected."""
+    response = await client.get("/api/v1/chats", params={"metadata": metadata})
+
+    assert response.status_code == 400
+
+
 @pytest.mark.anyio
 async def test_list_chats_page_size_boundary(client: AsyncClient) -> None:
     """Test listing chats with max page_size (100)."""
@@ -271,7 +301,7 @@ async def test_update_chat(client: AsyncClient) -> None:
 
 @pytest.mark.anyio
 async def test_update_chat_metadata(client: AsyncClient) -> None:
-    """Test updating a chat's metadata."""
+    """Test that metadata updates are merged into existing metadata."""
     create_response = await client.post(
         "/api/v1/chats",
         json={"metadata": {"old": "data"}},
@@ -283,7 +313,43 @@ async def test_update_chat_metadata(client: AsyncClient) -> None:
         json={"metadata": {"new": "data"}},
     )
     assert response.status_code == 200
-    assert response.json()["metadata"] == {"new": "data"}
+    assert response.json()["metadata"] == {"old": "data", "new": "data"}
+
+
+@pytest.mark.anyio
+async def test_update_chat_metadata_merge_patch(client: AsyncClient) -> None:
+    """Test that nested objects are merged and nulls remove keys at any depth."""
+    create_response = await client.post(
+        "/api/v1/chats",
+        json={
+            "metadata": {
+                "keep": 1,
+                "drop": "me",
+                "nested": {"a": 1, "b": 2},
+                "scalar": "replaced",
+            }
+        },
+    )
+    chat_id = create_response.json()["id"]
+
+    response = await client.patch(
+        f"/api/v1/chats/{chat_id}",
+        json={
+            "metadata": {
+                "drop": None,
+                "nested": {"a": None, "c": 3},
+                "scalar": {"x": 1, "y": None},
+                "missing": None,
+            }
+        },
+    )
+
+    expected = {"keep": 1, "nested": {"b": 2, "c": 3}, "scalar": {"x": 1}}
+    assert response.status_code == 200
+    assert response.json()["metadata"] == expected
+
+    fetched = await client.get(f"/api/v1/chats/{chat_id}")
+    assert fetched.json()["metadata"] == expected
 
 
 @pytest.mark.anyio
@@ -477,3 +543,146 @@ async def test_list_chats_ordered_by_created_at_desc(client: AsyncClient) -> Non
     assert items[0]["title"] == "Third"
     assert items[1]["title"] == "Second"
     assert items[2]["title"] == "First"
+
+
+@pytest.mark.anyio
+async def test_chat_message_stats(client: AsyncClient) -> None:
+    """Test that chats expose their message count and latest message time."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+    assert create_response.json()["message_count"] == 0
+    assert create_response.json()["last_message_at"] is None
+
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        return_value=AgentResponse(content="Answer"),
+    ):
+        message_response = await client.post(
+            f"/api/v1/chats/{chat_id}/messages",
+            json={"content": "Hello"},
+        )
+
+    data = (await client.get(f"/api/v1/chats/{chat_id}")).json()
+    assert data["message_count"] == 2
+    assert (
+        data["last_message_at"]
+        == message_response.json()["assistant_message"]["created_at"]
+    )
+
+
+@pytest.mark.anyio
+async def test_list_chats_ordered_by_activity(client: AsyncClient) -> None:
+    """Test ordering chats by latest message, chats without messages last."""
+    titles = ["Quiet", "Old", "Recent"]
+    ids = {}
+    for title in titles:
+        response = await client.post("/api/v1/chats", json={"title": title})
+        ids[title] = response.json()["id"]
+
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        return_value=AgentResponse(content="Answer"),
+    ):
+        for title in ["Recent", "Old"]:
+            await client.post(
+                f"/api/v1/chats/{ids[title]}/messages",
+                json={"content": "Hello"},
+            )
+
+    response = await client.get("/api/v1/chats", params={"order_by": "activity"})
+    items = response.json()["items"]
+
+    assert [item["title"] for item in items] == ["Old", "Recent", "Quiet"]
+
+
+@pytest.mark.anyio
+async def test_list_chats_invalid_order(client: AsyncClient) -> None:
+    """Test that an unknown ordering is rejected."""
+    response = await client.get("/api/v1/chats", params={"order_by": "title"})
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_get_chat_not_modified(client: AsyncClient) -> None:
+    """Test that a matching If-None-Match returns 304 without a body."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+
+    first = await client.get(f"/api/v1/chats/{chat_id}")
+    etag = first.headers["etag"]
+    second = await client.get(
+        f"/api/v1/chats/{chat_id}",
+        headers={"If-None-Match": etag},
+    )
+
+    assert etag.startswith('W/"')
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+@pytest.mark.anyio
+async def test_get_chat_etag_changes_on_update(client: AsyncClient) -> None:
+    """Test that updating a chat invalidates its ETag."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+    etag = (await client.get(f"/api/v1/chats/{chat_id}")).headers["etag"]
+
+    await client.patch(f"/api/v1/chats/{chat_id}", json={"title": "Renamed"})
+    response = await client.get(
+        f"/api/v1/chats/{chat_id}",
+        headers={"If-None-Match": etag},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.anyio
+async def test_get_chat_if_modified_since(client: AsyncClient) -> None:
+    """Test Last-Modified round-tripping through If-Modified-Since."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+    last_modified = (await client.get(f"/api/v1/chats/{chat_id}")).headers[
+        "last-modified"
+    ]
+
+    fresh = await client.get(
+        f"/api/v1/chats/{chat_id}",
+        headers={"If-Modified-Since": last_modified},
+    )
+    stale = await client.get(
+        f"/api/v1/chats/{chat_id}",
+        headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+    )
+
+    assert fresh.status_code == 304
+    assert stale.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_batch_delete_chats(client: AsyncClient) -> None:
+    """Test deleting several chats and reporting unknown IDs."""
+    ids = [(await client.post("/api/v1/chats", json={})).json()["id"] for _ in range(3)]
+    fake_id = "01930000-0000-7000-8000-000000000000"
+
+    response = await client.post(
+        "/api/v1/chats:batchDelete",
+        json={"ids": [ids[0], ids[1], fake_id]},
+    )
+
+    assert response.status_code == 200
+    assert set(response.json()["deleted"]) == {ids[0], ids[1]}
+    assert response.json()["not_found"] == [fake_id]
+    assert (await client.get(f"/api/v1/chats/{ids[0]}")).status_code == 404
+    assert (await client.get(f"/api/v1/chats/{ids[2]}")).status_code == 200
+
+
+@pytest.mark.anyio
+async def test_batch_delete_chats_requires_ids(client: AsyncClient) -> None:
+    """Test that an empty batch is rejected."""
+    response = await client.post("/api/v1/chats:batchDelete", json={"ids": []})
+    assert response.status_code == 422
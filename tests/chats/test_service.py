@@ -3,11 +3,17 @@
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from qna_agent.chats.exceptions import ChatNotFoundError
-from qna_agent.chats.schemas import ChatCreate, ChatUpdate
-from qna_agent.chats.service import ChatService
+from qna_agent.chats.models import Chat
+from qna_agent.chats.schemas import ChatCreate, ChatResponse, ChatUpdate
+from qna_agent.chats.service import ChatService, _jsonb_merge_patch
+from qna_agent.messages.models import Message, MessageRole
+from qna_agent.messages.schemas import MessageDraft
+from qna_agent.messages.service import MessageService
 
 
 @pytest.fixture
@@ -75,9 +81,9 @@ async def test_list_chats_ordered_by_created_at_desc(
 
     chats, _ = await chat_service.list()
 
-    assert chats[0].title == "Third"
-    assert chats[1].title == "Second"
-    assert chats[2].title == "First"
+    assert chats[0]["title"] == "Third"
+    assert chats[1]["title"] == "Second"
+    assert chats[2]["title"] == "First"
 
 
 @pytest.mark.anyio
@@ -128,3 +134,118 @@ async def test_delete_success(chat_service: ChatService) -> None:
 
     with pytest.raises(ChatNotFoundError):
         await chat_service.get(chat.id)
+
+
+@pytest.mark.anyio
+async def test_delete_evicts_cached_chat(chat_service: ChatService) -> None:
+    """Test that a deleted chat no longer passes the existence check."""
+    chat = await chat_service.create(ChatCreate())
+    await chat_service.ensure_exists(chat.id)
+
+    await chat_service.delete(chat.id)
+
+    with pytest.raises(ChatNotFoundError):
+        await chat_service.ensure_exists(chat.id)
+
+
+@pytest.mark.anyio
+async def test_chat_deleted_elsewhere_rejects_messages(
+    chat_service: ChatService,
+    async_session: AsyncSession,
+) -> None:
+    """Test a chat deleted by another process while cached in this one."""
+    chat = await chat_service.create(ChatCreate())
+    await async_session.execute(delete(Chat).where(Chat.id == chat.id))
+
+    # Still cached as existing, until a message insert proves otherwise
+    await chat_service.ensure_exists(chat.id)
+    with pytest.raises(ChatNotFoundError):
+        await MessageService(async_session).create(chat.id, MessageRole.USER, "Hi")
+    await async_session.rollback()
+
+    with pytest.raises(ChatNotFoundError):
+        await chat_service.ensure_exists(chat.id)
+
+
+@pytest.mark.anyio
+async def test_list_chats_returns_response_rows(chat_service: ChatService) -> None:
+    """Test that listed rows carry every ChatResponse field."""
+    created = await chat_service.create(
+        ChatCreate(title="Listed", metadata={"team": "sales"})
+    )
+
+    chats, _ = await chat_service.list()
+    item = ChatResponse.model_validate(chats[0])
+
+    assert item.id == created.id
+    assert item.metadata == {"team": "sales"}
+    assert item.message_count == 0
+
+
+@pytest.mark.anyio
+async def test_list_chats_filtered_by_metadata(chat_service: ChatService) -> None:
+    """Test that only chats with all filtered metadata values are listed."""
+    acme = await chat_service.create(
+        ChatCreate(metadata={"tenant_id": "acme", "user_id": 7, "vip": True})
+    )
+    await chat_service.create(ChatCreate(metadata={"tenant_id": "acme", "user_id": 8}))
+    await chat_service.create(ChatCreate(metadata={"tenant_id": "globex"}))
+
+    chats, total = await chat_service.list(metadata={"tenant_id": "acme"})
+    assert total == 2
+    assert len(chats) == 2
+
+    chats, total = await chat_service.list(
+        metadata={"tenant_id": "acme", "user_id": 7, "vip": True}
+    )
+    assert total == 1
+    assert chats[0]["id"] == acme.id
+
+    _, total = await chat_service.list(metadata={"tenant_id": "initech"})
+    assert total == 0
+
+
+@pytest.mark.anyio
+async def test_delete_cascades_in_database(
+    chat_service: ChatService,
+    async_session: AsyncSession,
+) -> None:
+    """Test that deleting a chat removes its messages via ON DELETE CASCADE."""
+    chat = await chat_service.create(ChatCreate())
+    await MessageService(async_session).create_many(
+        chat.id,
+        [MessageDraft(role=MessageRole.USER, content=f"m{i}") for i in range(5)],
+    )
+
+    await chat_service.delete(chat.id)
+
+    remaining = await async_session.scalar(
+        select(func.count()).select_from(Message).where(Message.chat_id == chat.id)
+    )
+    assert remaining == 0
+
+
+@pytest.mark.anyio
+async def test_delete_many_returns_deleted_ids(chat_service: ChatService) -> None:
+    """Test that delete_many reports only chats that existed."""
+    first = await chat_service.create(ChatCreate())
+    second = await chat_service.create(ChatCreate())
+    kept = await chat_service.create(ChatCreate())
+
+    deleted = await chat_service.delete_many([first.id, second.id, uuid4()])
+
+    assert set(deleted) == {first.id, second.id}
+    assert (await chat_service.get(kept.id)).id == kept.id
+
+
+def test_postgres_metadata_merge_recurses_into_objects() -> None:
+    """Test that PostgreSQL merges nested patch objects instead of replacing."""
+    merged = _jsonb_merge_patch(
+        Chat.metadata_.expression, {"a": 1, "nested": {"b": None}, "gone": None}
+    )
+
+    sql = str(merged.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("jsonb_set(") == 1
+    assert "jsonb_typeof(chats.metadata #> " in sql
+    assert sql.count(" - ") == 2
@@ -1,18 +1,20 @@
 """Pytest fixtures for async testing."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from contextlib import contextmanager
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from qna_agent.agent.service import AgentResponse
-from qna_agent.database import get_session
+from qna_agent.chats.cache import chat_cache
+from qna_agent.database import get_read_session, get_session
 from qna_agent.main import app
 from qna_agent.models import Base
 
@@ -26,6 +28,13 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def clear_chat_cache() -> Generator[None]:
+    """Keep cached chat existence from leaking between test databases."""
+    yield
+    chat_cache.clear()
+
+
 @pytest.fixture
 async def async_engine() -> AsyncGenerator[Any]:
     """Create an in-memory SQLite engine for testing."""
@@ -34,6 +43,7 @@ async def async_engine() -> AsyncGenerator[Any]:
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    event.listen(engine.sync_engine, "connect", _enable_foreign_keys)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -46,6 +56,31 @@ async def async_engine() -> AsyncGenerator[Any]:
     await engine.dispose()
 
 
+def _enable_foreign_keys(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Enforce foreign keys (and ON DELETE CASCADE) like the app engine."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+@pytest.fixture
+def statement_counter(async_engine: Any) -> Generator[list[str]]:
+    """Record SQL statements sent to the test database."""
+    statements: list[str] = []
+
+    def record(
+        _conn: Any,
+        _cursor: Any,
+        statement: str,
+        *_args: Any,
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 async def async_session(
     async_engine: Any,
@@ -69,6 +104,7 @@ async def client(async_session: AsyncSession) -> AsyncGenerator[AsyncClient]:
         yield async_session
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
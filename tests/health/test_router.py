@@ -65,3 +65,15 @@ async def test_readiness_database_unhealthy(client: AsyncClient) -> None:
         data = response.json()
         assert data["database"] == "unhealthy"
         assert data["status"] == "not_ready"
+
+
+@pytest.mark.anyio
+async def test_metrics_snapshot(client: AsyncClient) -> None:
+    """Test metrics endpoint exposes counters, gauges and histograms."""
+    response = await client.get("/health/metrics")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert "llm_requests_total" in data["counters"]
+    assert "llm_hedge_rate" in data["gauges"]
+    assert "llm_request_duration_seconds" in data["histograms"]
@@ -0,0 +1,208 @@
+"""Tests for background message job endpoints."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from qna_agent.agent.exceptions import LLMConnectionError
+from qna_agent.agent.service import AgentResponse
+from qna_agent.jobs.service import JobService
+from qna_agent.jobs.worker import JobWorker
+
+
+@pytest.fixture
+def worker(async_engine: AsyncEngine) -> JobWorker:
+    """Create a job worker bound to the test database."""
+    return JobWorker(async_sessionmaker(async_engine, expire_on_commit=False))
+
+
+async def _send_async(client: AsyncClient, chat_id: str) -> dict[str, Any]:
+    """Send a message in background mode without waking the global worker."""
+    with patch("qna_agent.jobs.router.job_worker") as mock_worker:
+        response = await client.post(
+            f"/api/v1/chats/{chat_id}/messages/async",
+            json={"content": "Hello"},
+        )
+    assert response.status_code == 202
+    data = response.json()
+    mock_worker.submit.assert_called_once()
+    assert str(mock_worker.submit.call_args.args[0]) == data["id"]
+    assert response.headers["location"] == f"/api/v1/chats/{chat_id}/jobs/{data['id']}"
+    return data
+
+
+@pytest.mark.anyio
+async def test_send_message_async_accepted(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+) -> None:
+    """Test that the user message is stored and a pending job returned."""
+    job = await _send_async(client, created_chat["id"])
+
+    assert job["status"] == "pending"
+    assert job["assistant_message_id"] is None
+
+    messages = (await client.get(f"/api/v1/chats/{created_chat['id']}/messages")).json()
+    assert [m["id"] for m in messages["items"]] == [job["user_message_id"]]
+
+
+@pytest.mark.anyio
+async def test_send_message_async_chat_not_found(client: AsyncClient) -> None:
+    """Test background mode for non-existent chat."""
+    fake_id = "01930000-0000-7000-8000-000000000000"
+
+    response = await client.post(
+        f"/api/v1/chats/{fake_id}/messages/async",
+        json={"content": "Hello"},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_job_completes(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    worker: JobWorker,
+) -> None:
+    """Test that a worker run stores the answer and completes the job."""
+    chat_id = created_chat["id"]
+    job = await _send_async(client, chat_id)
+
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        return_value=AgentResponse(content="Background answer"),
+    ) as mock_process:
+        await worker.run(UUID(job["id"]))
+
+    history = mock_process.call_args.kwargs["messages"]
+    assert history == [{"role": "user", "content": "Hello"}]
+
+    response = await client.get(f"/api/v1/chats/{chat_id}/jobs/{job['id']}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "completed"
+
+    messages = (await client.get(f"/api/v1/chats/{chat_id}/messages")).json()
+    assert messages["items"][-1]["id"] == data["assistant_message_id"]
+    assert messages["items"][-1]["content"] == "Background answer"
+
+
+@pytest.mark.anyio
+async def test_job_runs_once(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    worker: JobWorker,
+) -> None:
+    """Test that a finished job is not claimed again."""
+    job = await _send_async(client, created_chat["id"])
+
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        return_value=AgentResponse(content="Answer"),
+    ) as mock_process:
+        await worker.run(UUID(job["id"]))
+        await worker.run(UUID(job["id"]))
+
+    assert mock_process.await_count == 1
+
+
+@pytest.mark.anyio
+async def test_reclaimed_job_drops_late_answer(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    worker: JobWorker,
+    async_engine: AsyncEngine,
+) -> None:
+    """Test that a run whose job was reclaimed meanwhile stores nothing."""
+    chat_id = created_chat["id"]
+    job = await _send_async(client, chat_id)
+    job_id = UUID(job["id"])
+
+    async def reclaim_then_answer(**_: Any) -> AgentResponse:
+        async with async_sessionmaker(async_engine)() as session:
+            future = datetime.now(UTC) + timedelta(seconds=1)
+            assert await JobService(session).claim(job_id, future, max_attempts=3)
+            await session.commit()
+        return AgentResponse(content="Late answer")
+
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        side_effect=reclaim_then_answer,
+    ):
+        await worker.run(job_id)
+
+    data = (await client.get(f"/api/v1/chats/{chat_id}/jobs/{job['id']}")).json()
+    assert data["status"] == "running"
+    assert data["assistant_message_id"] is None
+    messages = (await client.get(f"/api/v1/chats/{chat_id}/messages")).json()
+    assert [m["id"] for m in messages["items"]] == [job["user_message_id"]]
+
+
+@pytest.mark.anyio
+async def test_job_failure_recorded(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    worker: JobWorker,
+) -> None:
+    """Test that an agent error marks the job failed."""
+    chat_id = created_chat["id"]
+    job = await _send_async(client, chat_id)
+
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        side_effect=LLMConnectionError("Connection failed"),
+    ):
+        await worker.run(UUID(job["id"]))
+
+    data = (await client.get(f"/api/v1/chats/{chat_id}/jobs/{job['id']}")).json()
+    assert data["status"] == "failed"
+    assert data["error"] == "Connection failed"
+    assert data["assistant_message_id"] is None
+
+
+@pytest.mark.anyio
+async def test_recover_queues_pending_jobs(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+    worker: JobWorker,
+) -> None:
+    """Test that pending jobs in the queue table are picked up by polling."""
+    job = await _send_async(client, created_chat["id"])
+
+    with patch.object(worker, "submit") as mock_submit:
+        await worker.recover()
+
+    assert [str(c.args[0]) for c in mock_submit.call_args_list] == [job["id"]]
+
+
+@pytest.mark.anyio
+async def test_get_job_not_found(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+) -> None:
+    """Test polling a job that does not exist."""
+    fake_id = "01930000-0000-7000-8000-000000000000"
+
+    response = await client.get(f"/api/v1/chats/{created_chat['id']}/jobs/{fake_id}")
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_get_job_other_chat(
+    client: AsyncClient,
+    created_chat: dict[str, Any],
+) -> None:
+    """Test that a job is not visible through another chat."""
+    job = await _send_async(client, created_chat["id"])
+    other_chat = (await client.post("/api/v1/chats", json={})).json()
+
+    response = await client.get(f"/api/v1/chats/{other_chat['id']}/jobs/{job['id']}")
+    assert response.status_code == 404
@@ -0,0 +1,108 @@
+"""Tests for JobService."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.chats.schemas import ChatCreate
+from qna_agent.chats.service import ChatService
+from qna_agent.jobs.models import JobStatus, MessageJob
+from qna_agent.jobs.service import JobService
+from qna_agent.messages.models import MessageRole
+from qna_agent.messages.service import MessageService
+
+
+@pytest.fixture
+async def job(async_session: AsyncSession) -> MessageJob:
+    """Create a pending job for a new chat."""
+    chat = await ChatService(async_session).create(ChatCreate())
+    message = await MessageService(async_session).create(
+        chat_id=chat.id,
+        role=MessageRole.USER,
+        content="Hello",
+    )
+    return await JobService(async_session).enqueue(chat.id, message.id)
+
+
+@pytest.mark.anyio
+async def test_claim_pending_job(async_session: AsyncSession, job: MessageJob) -> None:
+    """Test that claiming a pending job marks it running."""
+    service = JobService(async_session)
+
+    claimed = await service.claim(job.id, datetime.now(UTC), max_attempts=3)
+
+    assert claimed is not None
+    assert claimed.status == JobStatus.RUNNING
+    assert claimed.attempts == 1
+    assert claimed.started_at is not None
+
+
+@pytest.mark.anyio
+async def test_claim_running_job_fails(
+    async_session: AsyncSession,
+    job: MessageJob,
+) -> None:
+    """Test that a job being run by a live worker cannot be claimed."""
+    service = JobService(async_session)
+    stale_before = datetime.now(UTC) - timedelta(minutes=5)
+
+    assert await service.claim(job.id, stale_before, max_attempts=3) is not None
+    assert await service.claim(job.id, stale_before, max_attempts=3) is None
+
+
+@pytest.mark.anyio
+async def test_claim_abandoned_job(
+    async_session: AsyncSession,
+    job: MessageJob,
+) -> None:
+    """Test that a running job past its timeout is reclaimed."""
+    service = JobService(async_session)
+    await service.claim(job.id, datetime.now(UTC), max_attempts=3)
+
+    future = datetime.now(UTC) + timedelta(seconds=1)
+    reclaimed = await service.claim(job.id, future, max_attempts=3)
+
+    assert reclaimed is not None
+    assert reclaimed.attempts == 2
+
+
+@pytest.mark.anyio
+async def test_exhausted_job_fails(
+    async_session: AsyncSession,
+    job: MessageJob,
+) -> None:
+    """Test that an abandoned job out of attempts is failed, not retried."""
+    service = JobService(async_session)
+    await service.claim(job.id, datetime.now(UTC), max_attempts=1)
+    future = datetime.now(UTC) + timedelta(seconds=1)
+
+    assert await service.claimable_ids(future, max_attempts=1) == []
+    await service.fail_exhausted(future, max_attempts=1)
+
+    failed = await async_session.get(MessageJob, job.id, populate_existing=True)
+    assert failed is not None
+    assert failed.status == JobStatus.FAILED
+
+
+@pytest.mark.anyio
+async def test_reclaimed_attempt_cannot_finish_job(
+    async_session: AsyncSession,
+    job: MessageJob,
+) -> None:
+    """Test that only the attempt owning a job can complete or fail it."""
+    service = JobService(async_session)
+    await service.claim(job.id, datetime.now(UTC), max_attempts=3)
+    future = datetime.now(UTC) + timedelta(seconds=1)
+    await service.claim(job.id, future, max_attempts=3)
+    answer_id = job.user_message_id
+
+    assert not await service.complete(job.id, 1, answer_id)
+    assert not await service.fail(job.id, 1, "Too late")
+    assert await service.complete(job.id, 2, answer_id)
+    assert not await service.fail(job.id, 2, "Already done")
+
+    finished = await async_session.get(MessageJob, job.id, populate_existing=True)
+    assert finished is not None
+    assert finished.status == JobStatus.COMPLETED
+    assert finished.error is None
@@ -1,9 +1,11 @@
 """Tests for message router endpoints."""
 
 from unittest.mock import AsyncMock, patch
+from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from qna_agent.agent.exceptions import (
     LLMConnectionError,
@@ -11,6 +13,8 @@ from qna_agent.agent.exceptions import (
     MaxIterationsExceededError,
 )
 from qna_agent.agent.service import AgentResponse
+from qna_agent.messages.models import MessageRole
+from qna_agent.messages.service import MessageService
 
 
 # GET /api/v1/chats/{chat_id}/messages - List Messages Tests
@@ -271,6 +275,88 @@ async def test_send_message_roles_correct(client: AsyncClient) -> None:
     assert data["assistant_message"]["role"] == "assistant"
 
 
+@pytest.mark.anyio
+async def test_send_message_releases_session_during_llm_call(
+    client: AsyncClient,
+    async_session: AsyncSession,
+) -> None:
+    """Test that no transaction is open while the agent is running."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+    in_transaction: list[bool] = []
+
+    async def process_message(**kwargs: object) -> AgentResponse:
+        in_transaction.append(async_session.in_transaction())
+        return AgentResponse(content="Answer")
+
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        side_effect=process_message,
+    ) as mock_process:
+        response = await client.post(
+            f"/api/v1/chats/{chat_id}/messages",
+            json={"content": "Question"},
+        )
+
+    assert response.status_code == 201
+    assert in_transaction == [False]
+    history = mock_process.call_args.kwargs["messages"]
+    assert history[-1] == {"role": "user", "content": "Question"}
+
+
+@pytest.mark.anyio
+async def test_send_message_sorts_after_messages_stored_meanwhile(
+    client: AsyncClient,
+    async_session: AsyncSession,
+) -> None:
+    """Test that a cursor taken during the agent run still returns the turn."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+
+    async def process_message(**kwargs: object) -> AgentResponse:
+        await MessageService(async_session).create(
+            UUID(chat_id), MessageRole.USER, "Concurrent"
+        )
+        await async_session.commit()
+        return AgentResponse(content="Answer")
+
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        side_effect=process_message,
+    ):
+        await client.post(
+            f"/api/v1/chats/{chat_id}/messages",
+            json={"content": "Question"},
+        )
+
+    url = f"/api/v1/chats/{chat_id}/messages"
+    first = (await client.get(url, params={"limit": 1})).json()
+    rest = (await client.get(url, params={"after": first["next_cursor"]})).json()
+    assert [m["content"] for m in first["items"]] == ["Concurrent"]
+    assert [m["content"] for m in rest["items"]] == ["Question", "Answer"]
+
+
+@pytest.mark.anyio
+async def test_send_message_llm_failure_stores_nothing(client: AsyncClient) -> None:
+    """Test that a failed agent run does not leave an unanswered message."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        side_effect=LLMConnectionError("Connection refused"),
+    ):
+        response = await client.post(
+            f"/api/v1/chats/{chat_id}/messages",
+            json={"content": "Hello"},
+        )
+
+    assert response.status_code == 503
+    list_response = await client.get(f"/api/v1/chats/{chat_id}/messages")
+    assert list_response.json()["total"] == 0
+
+
 # LLM Error Scenarios (mocked)
 @pytest.mark.anyio
 async def test_send_message_llm_unavailable(client: AsyncClient) -> None:
@@ -420,3 +506,156 @@ async def test_list_messages_includes_all_fields(client: AsyncClient) -> None:
     assert "created_at" in message
     assert "tool_calls" in message
     assert "tool_call_id" in message
+
+
+async def _send_messages(client: AsyncClient, chat_id: str, count: int) -> None:
+    """Send messages with mocked answers, two stored messages per call."""
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        return_value=AgentResponse(content="Answer"),
+    ):
+        for i in range(count):
+            await client.post(
+                f"/api/v1/chats/{chat_id}/messages",
+                json={"content": f"Message {i}"},
+            )
+
+
+@pytest.mark.anyio
+async def test_list_messages_paginates_forward(client: AsyncClient) -> None:
+    """Test walking all messages with limit and after cursors."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+    await _send_messages(client, chat_id, 3)
+
+    first = (
+        await client.get(f"/api/v1/chats/{chat_id}/messages", params={"limit": 4})
+    ).json()
+    second = (
+        await client.get(
+            f"/api/v1/chats/{chat_id}/messages",
+            params={"limit": 4, "after": first["next_cursor"]},
+        )
+    ).json()
+
+    assert first["total"] == 6
+    assert first["has_more"] is True
+    assert len(first["items"]) == 4
+    assert second["has_more"] is False
+    assert [m["content"] for m in second["items"]] == ["Message 2", "Answer"]
+
+    all_ids = [m["id"] for m in first["items"] + second["items"]]
+    assert len(set(all_ids)) == 6
+
+
+@pytest.mark.anyio
+async def test_list_messages_polls_for_newer(client: AsyncClient) -> None:
+    """Test fetching only messages newer than the last one seen."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+    await _send_messages(client, chat_id, 1)
+
+    seen = (await client.get(f"/api/v1/chats/{chat_id}/messages")).json()
+    await _send_messages(client, chat_id, 1)
+    newer = (
+        await client.get(
+            f"/api/v1/chats/{chat_id}/messages",
+            params={"after": seen["next_cursor"]},
+        )
+    ).json()
+
+    assert [m["content"] for m in newer["items"]] == ["Message 0", "Answer"]
+    assert newer["items"][0]["id"] not in {m["id"] for m in seen["items"]}
+
+
+@pytest.mark.anyio
+async def test_list_messages_paginates_backward(client: AsyncClient) -> None:
+    """Test reading older messages with a before cursor."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+    await _send_messages(client, chat_id, 3)
+
+    everything = (await client.get(f"/api/v1/chats/{chat_id}/messages")).json()
+    last_id = everything["items"][-1]["id"]
+    older = (
+        await client.get(
+            f"/api/v1/chats/{chat_id}/messages",
+            params={"limit": 2, "before": everything["next_cursor"]},
+        )
+    ).json()
+
+    assert [m["id"] for m in older["items"]] == [
+        m["id"] for m in everything["items"][-3:-1]
+    ]
+    assert last_id not in {m["id"] for m in older["items"]}
+    assert older["has_more"] is True
+
+
+@pytest.mark.anyio
+async def test_list_messages_invalid_cursor(client: AsyncClient) -> None:
+    """Test that a malformed cursor is rejected."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+
+    response = await client.get(
+        f"/api/v1/chats/{chat_id}/messages",
+        params={"after": "not-a-cursor"},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_list_messages_limit_bounds(client: AsyncClient) -> None:
+    """Test that the page size is validated."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+
+    response = await client.get(
+        f"/api/v1/chats/{chat_id}/messages",
+        params={"limit": 0},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_list_messages_not_modified(client: AsyncClient) -> None:
+    """Test 304 for an unchanged message list and 200 after a new message."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+    await _send_messages(client, chat_id, 1)
+
+    etag = (await client.get(f"/api/v1/chats/{chat_id}/messages")).headers["etag"]
+    unchanged = await client.get(
+        f"/api/v1/chats/{chat_id}/messages",
+        headers={"If-None-Match": etag},
+    )
+    await _send_messages(client, chat_id, 1)
+    changed = await client.get(
+        f"/api/v1/chats/{chat_id}/messages",
+        headers={"If-None-Match": etag},
+    )
+
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.json()["total"] == 4
+
+
+@pytest.mark.anyio
+async def test_list_messages_etag_depends_on_page(client: AsyncClient) -> None:
+    """Test that different pages of the same chat have different ETags."""
+    create_response = await client.post("/api/v1/chats", json={})
+    chat_id = create_response.json()["id"]
+    await _send_messages(client, chat_id, 2)
+
+    full = await client.get(f"/api/v1/chats/{chat_id}/messages")
+    page = await client.get(
+        f"/api/v1/chats/{chat_id}/messages",
+        params={"limit": 1},
+        headers={"If-None-Match": full.headers["etag"]},
+    )
+
+    assert page.status_code == 200
+    assert len(page.json()["items"]) == 1
@@ -1,10 +1,14 @@
 """Tests for MessageService."""
 
+from uuid import uuid4
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from qna_agent.chats.exceptions import ChatNotFoundError
 from qna_agent.chats.models import Chat
 from qna_agent.messages.models import MessageRole
+from qna_agent.messages.schemas import MessageDraft, MessageResponse
 from qna_agent.messages.service import MessageService
 
 
@@ -60,6 +64,56 @@ async def test_create_message_with_tool_calls(
     assert message.tool_calls == tool_calls
 
 
+@pytest.mark.anyio
+async def test_create_many_single_statement(
+    message_service: MessageService,
+    chat_in_db: Chat,
+    statement_counter: list[str],
+) -> None:
+    """Test that a whole turn is stored with one INSERT, in order.
+
+    The second statement updates the chat's message counters.
+    """
+    tool_calls = [{"id": "call_1", "function": {"name": "list_knowledge_files"}}]
+
+    messages = await message_service.create_many(
+        chat_in_db.id,
+        [
+            MessageDraft(role=MessageRole.USER, content="Question"),
+            MessageDraft(
+                role=MessageRole.ASSISTANT,
+                content="",
+                tool_calls=tool_calls,
+            ),
+            MessageDraft(role=MessageRole.TOOL, content="[]", tool_call_id="call_1"),
+            MessageDraft(role=MessageRole.ASSISTANT, content="Answer"),
+        ],
+    )
+
+    assert [s.split()[0] for s in statement_counter] == ["INSERT", "UPDATE"]
+    assert [m.role for m in messages] == [
+        MessageRole.USER,
+        MessageRole.ASSISTANT,
+        MessageRole.TOOL,
+        MessageRole.ASSISTANT,
+    ]
+    assert messages[1].tool_calls == tool_calls
+    assert messages[2].tool_call_id == "call_1"
+    assert all(m.chat_id == chat_in_db.id and m.id is not None for m in messages)
+
+    stored = await message_service.get_chat_messages(chat_in_db.id)
+    assert [m.id for m in stored] == [m.id for m in messages]
+
+
+@pytest.mark.anyio
+async def test_create_many_empty(
+    message_service: MessageService,
+    chat_in_db: Chat,
+) -> None:
+    """Test that an empty batch sends nothing."""
+    assert await message_service.create_many(chat_in_db.id, []) == []
+
+
 @pytest.mark.anyio
 async def test_get_chat_messages_ordered(
     message_service: MessageService,
@@ -90,6 +144,24 @@ async def test_get_chat_messages_ordered(
     assert messages[2].content == "Third"
 
 
+@pytest.mark.anyio
+async def test_get_chat_messages_limit(
+    message_service: MessageService,
+    chat_in_db: Chat,
+) -> None:
+    """Test that each call applies its own limit to the cached statement."""
+    for content in ("First", "Second", "Third"):
+        await message_service.create(chat_in_db.id, MessageRole.USER, content)
+
+    unlimited = await message_service.get_chat_messages(chat_in_db.id)
+    one = await message_service.get_chat_messages(chat_in_db.id, limit=1)
+    two = await message_service.get_chat_messages(chat_in_db.id, limit=2)
+
+    assert len(unlimited) == 3
+    assert [m.content for m in one] == ["First"]
+    assert [m.content for m in two] == ["First", "Second"]
+
+
 @pytest.mark.anyio
 async def test_get_chat_history_for_llm_format(
     message_service: MessageService,
@@ -133,6 +205,25 @@ async def test_get_chat_history_limit(
     )
 
     assert len(history) == 5
+    assert [m["content"] for m in history] == [f"Message {i}" for i in range(5, 10)]
+
+
+@pytest.mark.anyio
+async def test_get_chat_history_empty_chat(
+    message_service: MessageService,
+    chat_in_db: Chat,
+) -> None:
+    """Test that an existing chat without messages has an empty history."""
+    assert await message_service.get_chat_history_for_llm(chat_in_db.id) == []
+
+
+@pytest.mark.anyio
+async def test_get_chat_history_missing_chat(
+    message_service: MessageService,
+) -> None:
+    """Test that the history query also validates the chat."""
+    with pytest.raises(ChatNotFoundError):
+        await message_service.get_chat_history_for_llm(uuid4())
 
 
 @pytest.mark.anyio
@@ -205,3 +296,60 @@ async def test_get_chat_history_includes_tool_call_id(
     history = await message_service.get_chat_history_for_llm(chat_in_db.id)
 
     assert history[0]["tool_call_id"] == "call_1"
+
+
+@pytest.mark.anyio
+async def test_create_updates_chat_counters(
+    message_service: MessageService,
+    chat_in_db: Chat,
+    async_session: AsyncSession,
+) -> None:
+    """Test that message inserts keep the chat's count and latest time."""
+    await message_service.create(
+        chat_id=chat_in_db.id,
+        role=MessageRole.USER,
+        content="Hello",
+    )
+    batch = await message_service.create_many(
+        chat_in_db.id,
+        [
+            MessageDraft(role=MessageRole.USER, content="Question"),
+            MessageDraft(role=MessageRole.ASSISTANT, content="Answer"),
+        ],
+    )
+
+    await async_session.refresh(chat_in_db)
+    assert chat_in_db.message_count == 3
+    assert chat_in_db.last_message_at == batch[-1].created_at
+
+
+@pytest.mark.anyio
+async def test_get_page_returns_response_rows(
+    message_service: MessageService,
+    chat_in_db: Chat,
+) -> None:
+    """Test that paged rows carry every MessageResponse field."""
+    await message_service.create_many(
+        chat_in_db.id,
+        [
+            MessageDraft(role=MessageRole.USER, content="Question"),
+            MessageDraft(
+                role=MessageRole.ASSISTANT,
+                content="Answer",
+                tool_calls=[{"id": "call_1", "type": "function"}],
+            ),
+        ],
+    )
+
+    rows, has_more = await message_service.get_page(chat_in_db.id, limit=1)
+    rest, _ = await message_service.get_page(
+        chat_in_db.id,
+        limit=1,
+        after=(rows[0]["created_at"], rows[0]["id"]),
+    )
+    answer = MessageResponse.model_validate(rest[0])
+
+    assert has_more is True
+    assert rows[0]["content"] == "Question"
+    assert answer.role == MessageRole.ASSISTANT
+    assert answer.tool_calls == [{"id": "call_1", "type": "function"}]
@@ -0,0 +1,102 @@
+"""Tests for partition helpers and PartitionService."""
+
+from datetime import UTC, date, datetime, timedelta, timezone
+from typing import cast
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, Uuid, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.chats.models import Chat
+from qna_agent.messages.models import Message, MessageRole
+from qna_agent.messages.service import MessageService
+from qna_agent.retention.service import (
+    PartitionService,
+    add_months,
+    expired_months,
+    month_start,
+    partition_month,
+    partition_name,
+)
+
+
+def test_month_start_uses_utc() -> None:
+    """Test that months are computed in UTC."""
+    local = datetime(2026, 3, 1, 1, 0, tzinfo=timezone(timedelta(hours=3)))
+
+    assert month_start(local) == date(2026, 2, 1)
+
+
+def test_add_months_across_years() -> None:
+    """Test month arithmetic over year boundaries."""
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert add_months(date(2026, 1, 1), -24) == date(2024, 1, 1)
+
+
+def test_partition_name_round_trip() -> None:
+    """Test that partition names map back to their month."""
+    month = date(2026, 7, 1)
+
+    assert partition_name(month) == "messages_p202607"
+    assert partition_month(partition_name(month)) == month
+    assert partition_month("messages_default") is None
+    assert partition_month("messages_p2026") is None
+
+
+def test_expired_months_keeps_retention_window() -> None:
+    """Test that only months before the retention window expire."""
+    now = datetime(2026, 10, 19, tzinfo=UTC)
+    months = [add_months(date(2026, 10, 1), -offset) for offset in range(6)]
+
+    assert expired_months(months, now, keep=3) == [
+        date(2026, 5, 1),
+        date(2026, 6, 1),
+    ]
+    assert expired_months(months, now, keep=12) == []
+
+
+@pytest.mark.anyio
+async def test_recount_chats_after_detach(async_session: AsyncSession) -> None:
+    """Test that chat counters drop the messages of a detached month."""
+    kept_chat = Chat(title="Kept")
+    expired_chat = Chat(title="Expired")
+    async_session.add_all([kept_chat, expired_chat])
+    await async_session.flush()
+    service = MessageService(async_session)
+    january = datetime(2026, 1, 10, tzinfo=UTC)
+    march = datetime(2026, 3, 10, tzinfo=UTC)
+    for chat_id, created_at in [
+        (kept_chat.id, january),
+        (kept_chat.id, march),
+        (expired_chat.id, january),
+    ]:
+        await service.create(chat_id, MessageRole.USER, "Hi", created_at=created_at)
+    await async_session.commit()
+
+    # Stands in for DETACH PARTITION, which SQLite lacks
+    messages = cast(Table, Message.__table__)
+    expired = messages.c.created_at < datetime(2026, 2, 1, tzinfo=UTC)
+    month = date(2026, 1, 1)
+    detached = Table(
+        partition_name(month), MetaData(), Column("chat_id", Uuid, nullable=False)
+    )
+    connection = await async_session.connection()
+    await connection.run_sync(detached.create)
+    await connection.execute(
+        insert(detached).from_select(
+            ["chat_id"], select(messages.c.chat_id).where(expired)
+        )
+    )
+    await connection.execute(delete(messages).where(expired))
+
+    await PartitionService(connection).recount_chats(month)
+    await async_session.commit()
+
+    await async_session.refresh(kept_chat)
+    await async_session.refresh(expired_chat)
+    assert kept_chat.message_count == 1
+    # SQLite drops the time zone
+    assert kept_chat.last_message_at == march.replace(tzinfo=None)
+    assert expired_chat.message_count == 0
+    assert expired_chat.last_message_at is None
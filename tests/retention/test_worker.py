@@ -0,0 +1,98 @@
+"""Tests for RetentionWorker."""
+
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from qna_agent.retention.worker import RetentionWorker
+
+
+@pytest.mark.anyio
+async def test_start_is_noop_when_disabled(async_engine: AsyncEngine) -> None:
+    """Test that no task is started on SQLite while retention is disabled."""
+    worker = RetentionWorker(async_engine)
+
+    await worker.start()
+
+    assert worker._task is None
+    await worker.stop()
+
+
+@pytest.mark.anyio
+async def test_start_requires_postgres(async_engine: AsyncEngine) -> None:
+    """Test that retention does not start on SQLite even when enabled."""
+    with patch("qna_agent.retention.worker.get_retention_settings") as mock_settings:
+        mock_settings.return_value.retention_enabled = True
+        worker = RetentionWorker(async_engine)
+
+    await worker.start()
+
+    assert worker._task is None
+
+
+def _postgres_worker(service: AsyncMock) -> RetentionWorker:
+    """Create a worker on a fake PostgreSQL engine using ``service``."""
+    engine = MagicMock()
+    engine.dialect.name = "postgresql"
+    engine.connect.return_value.__aenter__.return_value = AsyncMock()
+    service.try_lock.return_value = True
+    service.is_partitioned.return_value = True
+    service.create.return_value = 0
+    service.default_rows.return_value = 0
+    return RetentionWorker(engine)
+
+
+@pytest.mark.anyio
+async def test_start_on_postgres_when_disabled() -> None:
+    """Test that partition maintenance starts on PostgreSQL regardless."""
+    worker = _postgres_worker(AsyncMock())
+
+    with patch.object(worker, "run_once", AsyncMock()):
+        await worker.start()
+        assert worker._task is not None
+        await worker.stop()
+
+
+@pytest.mark.anyio
+async def test_run_once_creates_partitions_when_disabled() -> None:
+    """Test that upcoming partitions are created without detaching any."""
+    service = AsyncMock()
+    worker = _postgres_worker(service)
+    worker._settings = worker._settings.model_copy(
+        update={"retention_enabled": False, "retention_partitions_ahead": 2}
+    )
+
+    with patch("qna_agent.retention.worker.PartitionService", return_value=service):
+        detached = await worker.run_once(datetime(2026, 11, 5, tzinfo=UTC))
+
+    assert detached == []
+    created = [call.args[0] for call in service.create.await_args_list]
+    assert created == [date(2026, 11, 1), date(2026, 12, 1), date(2027, 1, 1)]
+    service.default_rows.assert_awaited_once()
+    service.attached_months.assert_not_awaited()
+    service.detach.assert_not_awaited()
+    # One lock for the first transaction and one after each commit
+    assert service.try_lock.await_count == 4
+
+
+@pytest.mark.anyio
+async def test_run_once_stops_when_lock_is_taken_between_steps() -> None:
+    """Test that a pass stops once another process holds the lock."""
+    service = AsyncMock()
+    worker = _postgres_worker(service)
+    worker._settings = worker._settings.model_copy(
+        update={"retention_enabled": True, "retention_months": 1}
+    )
+    service.try_lock.side_effect = [True, True, True, True, True, False]
+    service.attached_months.side_effect = [
+        [date(2026, 7, 1), date(2026, 8, 1), date(2026, 11, 1)],
+        [date(2026, 8, 1), date(2026, 11, 1)],
+    ]
+
+    with patch("qna_agent.retention.worker.PartitionService", return_value=service):
+        detached = await worker.run_once(datetime(2026, 11, 5, tzinfo=UTC))
+
+    assert detached == ["messages_p202607", "messages_p202608"]
+    service.detached_months.assert_not_awaited()
@@ -0,0 +1,92 @@
+"""Tests for search router endpoints."""
+
+from typing import Any
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.messages.models import MessageRole
+from qna_agent.messages.service import MessageService
+
+
+async def _add_messages(
+    session: AsyncSession, chat_id: str, contents: list[str]
+) -> None:
+    """Store user messages in a chat."""
+    service = MessageService(session)
+    for content in contents:
+        await service.create(UUID(chat_id), MessageRole.USER, content)
+    await session.commit()
+
+
+@pytest.mark.anyio
+async def test_search_messages(
+    client: AsyncClient,
+    async_session: AsyncSession,
+    created_chat: dict[str, Any],
+) -> None:
+    """Test searching messages by content."""
+    await _add_messages(
+        async_session,
+        created_chat["id"],
+        ["How do refunds work?", "Tell me about delivery"],
+    )
+
+    response = await client.get("/api/v1/messages:search", params={"q": "refunds"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["content"] for item in data["items"]] == ["How do refunds work?"]
+    assert data["items"][0]["chat_id"] == created_chat["id"]
+    assert data["items"][0]["rank"] > 0
+    assert data["has_more"] is False
+
+
+@pytest.mark.anyio
+async def test_search_messages_keyset_pagination(
+    client: AsyncClient,
+    async_session: AsyncSession,
+    created_chat: dict[str, Any],
+) -> None:
+    """Test walking all results with the next cursor."""
+    await _add_messages(
+        async_session,
+        created_chat["id"],
+        [f"invoice {'invoice ' * i}number {i}" for i in range(5)],
+    )
+
+    seen: list[str] = []
+    ranks: list[float] = []
+    params: dict[str, Any] = {"q": "invoice", "limit": 2}
+    while True:
+        data = (await client.get("/api/v1/messages:search", params=params)).json()
+        seen.extend(item["id"] for item in data["items"])
+        ranks.extend(item["rank"] for item in data["items"])
+        if not data["has_more"]:
+            break
+        params["after"] = data["next_cursor"]
+
+    assert len(seen) == len(set(seen)) == 5
+    assert ranks == sorted(ranks, reverse=True)
+
+
+@pytest.mark.anyio
+async def test_search_messages_no_match(client: AsyncClient) -> None:
+    """Test that queries without words return no results."""
+    response = await client.get("/api/v1/messages:search", params={"q": "*"})
+
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+
+@pytest.mark.anyio
+async def test_search_messages_invalid_cursor(client: AsyncClient) -> None:
+    """Test that a malformed cursor is rejected."""
+    response = await client.get(
+        "/api/v1/messages:search",
+        params={"q": "anything", "after": "not-a-cursor"},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,118 @@
+"""Tests for SearchService."""
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.chats.schemas import ChatCreate
+from qna_agent.chats.service import ChatService
+from qna_agent.messages.models import FTS_CONTENTLESS, Message, MessageRole
+from qna_agent.messages.schemas import MessageDraft
+from qna_agent.messages.service import MessageService
+from qna_agent.search.service import SearchService, fts5_query
+
+
+def test_fts5_query_quotes_words() -> None:
+    """Test that FTS5 syntax in the input is not interpreted."""
+    assert fts5_query('pricing AND "plans" OR -x*') == (
+        '"pricing" "AND" "plans" "OR" "x"'
+    )
+    assert fts5_query("  ?! ") == ""
+
+
+@pytest.mark.anyio
+async def test_search_ranks_and_filters(async_session: AsyncSession) -> None:
+    """Test ranking, chat filtering and messages inserted in bulk."""
+    chat_service = ChatService(async_session)
+    message_service = MessageService(async_session)
+    first = await chat_service.create(ChatCreate(title="First"))
+    second = await chat_service.create(ChatCreate(title="Second"))
+    await message_service.create(
+        first.id, MessageRole.USER, "What are the pricing plans?"
+    )
+    await message_service.create_many(
+        second.id,
+        [
+            MessageDraft(
+                role=MessageRole.ASSISTANT,
+                content="Pricing: the pricing of plans depends on pricing tiers.",
+            ),
+            MessageDraft(role=MessageRole.USER, content="Unrelated question"),
+        ],
+    )
+    await async_session.commit()
+    service = SearchService(async_session)
+
+    rows, has_more = await service.search_messages("pricing plans", limit=10)
+
+    assert [row["chat_id"] for row in rows] == [second.id, first.id]
+    assert rows[0]["rank"] > rows[1]["rank"]
+    assert not has_more
+
+    rows, _ = await service.search_messages("pricing", limit=10, chat_id=first.id)
+    assert [row["content"] for row in rows] == ["What are the pricing plans?"]
+
+
+@pytest.mark.anyio
+async def test_deleted_messages_leave_the_index(async_session: AsyncSession) -> None:
+    """Test that messages deleted with their chat are no longer found."""
+    chat_service = ChatService(async_session)
+    chat = await chat_service.create(ChatCreate(title="Gone"))
+    await MessageService(async_session).create(
+        chat.id, MessageRole.USER, "ephemeral words"
+    )
+    await async_session.commit()
+
+    await chat_service.delete(chat.id)
+    await async_session.commit()
+
+    rows, _ = await SearchService(async_session).search_messages("ephemeral", limit=10)
+    assert rows == []
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(not FTS_CONTENTLESS, reason="requires SQLite 3.43 or later")
+async def test_sqlite_index_does_not_store_text(async_session: AsyncSession) -> None:
+    """Test that a contentless FTS5 index leaves search_vector unset."""
+    chat = await ChatService(async_session).create(ChatCreate(title="Chat"))
+    message = await MessageService(async_session).create(
+        chat.id, MessageRole.USER, "compressed elsewhere"
+    )
+    await async_session.commit()
+
+    stored = await async_session.scalar(
+        select(Message.search_vector).where(Message.id == message.id)
+    )
+    rows, _ = await SearchService(async_session).search_messages("elsewhere", limit=10)
+
+    assert stored is None
+    assert [row["id"] for row in rows] == [message.id]
+
+
+@pytest.mark.anyio
+async def test_index_survives_renumbered_rowids(async_session: AsyncSession) -> None:
+    """Test that the index does not rely on the rowids VACUUM may change."""
+    chat = await ChatService(async_session).create(ChatCreate(title="Chat"))
+    service = MessageService(async_session)
+    first = await service.create(chat.id, MessageRole.USER, "first answer")
+    second = await service.create(chat.id, MessageRole.USER, "second answer")
+    await async_session.commit()
+
+    await async_session.execute(
+        text("UPDATE messages SET rowid = -rowid WHERE id = :id"),
+        {"id": first.id.hex},
+    )
+    await async_session.execute(
+        text("UPDATE messages SET rowid = -rowid - 1 WHERE id = :id"),
+        {"id": second.id.hex},
+    )
+    await async_session.commit()
+
+    search = SearchService(async_session)
+    rows, _ = await search.search_messages("first", limit=10)
+    assert [row["id"] for row in rows] == [first.id]
+
+    await async_session.delete(await async_session.get_one(Message, second.id))
+    await async_session.commit()
+    rows, _ = await search.search_messages("answer", limit=10)
+    assert [row["id"] for row in rows] == [first.id]
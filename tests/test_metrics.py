@@ -0,0 +1,53 @@
+"""Tests for the in-process metrics registry."""
+
+from qna_agent.metrics import MetricsRegistry, ratio
+
+
+def test_counter_get_or_create() -> None:
+    """Test that counters are shared by name."""
+    registry = MetricsRegistry()
+
+    registry.counter("requests_total", "Requests").inc()
+    registry.counter("requests_total", "Requests").inc(2)
+
+    assert registry.snapshot()["counters"]["requests_total"] == 3
+
+
+def test_histogram_percentiles() -> None:
+    """Test nearest-rank percentiles over the sample window."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency")
+
+    for value in range(1, 101):
+        histogram.observe(float(value))
+
+    assert histogram.percentile(0.5) == 50.0
+    assert histogram.percentile(0.95) == 95.0
+    assert histogram.count == 100
+
+
+def test_histogram_window_bounds_samples() -> None:
+    """Test that percentiles only consider the most recent samples."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", window=10)
+
+    for value in range(100):
+        histogram.observe(float(value))
+
+    assert histogram.percentile(0.1) == 90.0
+    assert histogram.count == 100
+
+
+def test_ratio_gauge() -> None:
+    """Test ratio gauges, including a zero denominator."""
+    registry = MetricsRegistry()
+    hits = registry.counter("hits_total", "Hits")
+    total = registry.counter("lookups_total", "Lookups")
+    registry.gauge("hit_rate", "Hit rate", ratio(hits, total))
+
+    assert registry.snapshot()["gauges"]["hit_rate"] == 0.0
+
+    total.inc(4)
+    hits.inc()
+
+    assert registry.snapshot()["gauges"]["hit_rate"] == 0.25
@@ -0,0 +1,11 @@
+"""Tests for the declarative base."""
+
+from qna_agent.models import Base
+
+
+def test_every_model_fetches_defaults_eagerly() -> None:
+    """Test that no model loses eager_defaults to its own mapper args."""
+    mappers = list(Base.registry.mappers)
+
+    assert mappers
+    assert all(mapper.eager_defaults is True for mapper in mappers)
@@ -0,0 +1,70 @@
+"""Tests for custom column types."""
+
+import os
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.chats.models import Chat
+from qna_agent.messages.models import Message, MessageRole
+from qna_agent.types import COMPRESSION_THRESHOLD, PLAIN, ZSTD, pack, unpack
+
+
+def test_small_payload_is_stored_plain() -> None:
+    """Test that payloads below the threshold are not compressed."""
+    packed = pack(b"short answer")
+
+    assert packed == PLAIN + b"short answer"
+    assert unpack(packed) == b"short answer"
+
+
+def test_large_payload_is_compressed() -> None:
+    """Test that payloads above the threshold are zstd-compressed."""
+    data = b"knowledge base excerpt " * COMPRESSION_THRESHOLD
+
+    packed = pack(data)
+
+    assert packed[:1] == ZSTD
+    assert len(packed) < len(data) // 10
+    assert unpack(packed) == data
+
+
+def test_incompressible_payload_is_stored_plain() -> None:
+    """Test that compression is skipped when it does not shrink the payload."""
+    data = os.urandom(COMPRESSION_THRESHOLD * 4)
+
+    assert pack(data)[:1] == PLAIN
+
+
+def test_unknown_header_is_rejected() -> None:
+    """Test that unknown payload encodings fail loudly."""
+    with pytest.raises(ValueError, match="Unknown payload header"):
+        unpack(b"\x07data")
+
+
+@pytest.mark.anyio
+async def test_message_payloads_round_trip(async_session: AsyncSession) -> None:
+    """Test that compressed columns read back the original values."""
+    chat = Chat(title="Compression")
+    async_session.add(chat)
+    await async_session.flush()
+    content = "Quoted document line.\n" * 500
+    tool_calls = [{"id": "call_1", "arguments": "x" * 5000}]
+    async_session.add(
+        Message(
+            chat_id=chat.id,
+            role=MessageRole.ASSISTANT,
+            content=content,
+            tool_calls=tool_calls,
+        )
+    )
+    await async_session.commit()
+    async_session.expunge_all()
+
+    row = (
+        await async_session.execute(select(Message.content, Message.tool_calls))
+    ).one()
+
+    assert row.content == content
+    assert row.tool_calls == tool_calls
@@ -0,0 +1,127 @@
+"""Tests for transfer router endpoints."""
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+from qna_agent.agent.service import AgentResponse
+
+
+async def _chat_with_turn(client: AsyncClient, title: str) -> str:
+    """Create a chat with one question and answer, returning its ID."""
+    create_response = await client.post(
+        "/api/v1/chats",
+        json={"title": title, "metadata": {"k": "v"}},
+    )
+    chat_id = create_response.json()["id"]
+    with patch(
+        "qna_agent.agent.service.AgentService.process_message",
+        new_callable=AsyncMock,
+        return_value=AgentResponse(content="Answer"),
+    ):
+        await client.post(
+            f"/api/v1/chats/{chat_id}/messages",
+            json={"content": "Question"},
+        )
+    return chat_id
+
+
+async def _export(client: AsyncClient) -> list[dict[str, Any]]:
+    """Export all chats and parse the NDJSON records."""
+    response = await client.get("/api/v1/chats:export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.anyio
+async def test_export_chats(client: AsyncClient) -> None:
+    """Test that an export lists chats before their messages."""
+    chat_id = await _chat_with_turn(client, "Exported")
+
+    records = await _export(client)
+
+    assert [r["type"] for r in records] == ["chat", "message", "message"]
+    assert records[0]["id"] == chat_id
+    assert records[0]["metadata"] == {"k": "v"}
+    assert [r["content"] for r in records[1:]] == ["Question", "Answer"]
+
+
+@pytest.mark.anyio
+async def test_export_empty(client: AsyncClient) -> None:
+    """Test exporting an empty database."""
+    assert await _export(client) == []
+
+
+@pytest.mark.anyio
+async def test_import_round_trip(client: AsyncClient) -> None:
+    """Test that an export can be re-imported after deleting the chats."""
+    chat_id = await _chat_with_turn(client, "Moved")
+    body = (await client.get("/api/v1/chats:export")).content
+    exported = json.loads(body.splitlines()[0])
+    await client.delete(f"/api/v1/chats/{chat_id}")
+
+    response = await client.post(
+        "/api/v1/chats:import",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"chats": 1, "messages": 2, "skipped": 0}
+    chat = (await client.get(f"/api/v1/chats/{chat_id}")).json()
+    assert chat["title"] == "Moved"
+    assert chat["metadata"] == {"k": "v"}
+    assert chat["message_count"] == 2
+    assert chat["last_message_at"] is not None
+    # Bumping the counters must not touch the imported timestamps
+    assert (await _export(client))[0] == exported
+    messages = (await client.get(f"/api/v1/chats/{chat_id}/messages")).json()
+    assert [m["content"] for m in messages["items"]] == ["Question", "Answer"]
+
+
+@pytest.mark.anyio
+async def test_import_skips_existing_records(client: AsyncClient) -> None:
+    """Test that re-importing the same data is a no-op."""
+    chat_id = await _chat_with_turn(client, "Existing")
+    body = (await client.get("/api/v1/chats:export")).content
+
+    response = await client.post("/api/v1/chats:import", content=body)
+
+    assert response.json() == {"chats": 0, "messages": 0, "skipped": 3}
+    chat = (await client.get(f"/api/v1/chats/{chat_id}")).json()
+    assert chat["message_count"] == 2
+
+
+@pytest.mark.anyio
+async def test_import_invalid_line(client: AsyncClient) -> None:
+    """Test that an invalid record is reported with its line number."""
+    body = b'\n{"type": "chat", "id": "not-a-uuid"}\n'
+
+    response = await client.post("/api/v1/chats:import", content=body)
+
+    assert response.status_code == 400
+    assert "line 2" in response.json()["detail"]
+
+
+@pytest.mark.anyio
+async def test_import_message_for_unknown_chat(client: AsyncClient) -> None:
+    """Test that a message of a missing chat is rejected."""
+    record = {
+        "type": "message",
+        "id": "01930000-0000-7000-8000-000000000001",
+        "chat_id": "01930000-0000-7000-8000-000000000000",
+        "role": "user",
+        "content": "Orphan",
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+    response = await client.post(
+        "/api/v1/chats:import",
+        content=json.dumps(record).encode() + b"\n",
+    )
+
+    assert response.status_code == 400
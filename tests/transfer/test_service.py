@@ -0,0 +1,76 @@
+"""Tests for TransferService."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from qna_agent.chats.schemas import ChatCreate
+from qna_agent.chats.service import ChatService
+from qna_agent.messages.models import Message
+from qna_agent.transfer import service as transfer_service
+from qna_agent.transfer.exceptions import InvalidRecordError
+from qna_agent.transfer.service import TransferService
+
+
+async def _chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    """Yield ``data`` in fixed-size chunks, splitting lines arbitrarily."""
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+@pytest.mark.anyio
+async def test_import_in_batches_across_chunks(
+    async_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test importing more records than a batch from a chunked stream."""
+    monkeypatch.setattr(transfer_service, "BATCH_SIZE", 2)
+    chat_service = ChatService(async_session)
+    for i in range(5):
+        await chat_service.create(ChatCreate(title=f"Chat {i}"))
+    service = TransferService(async_session)
+    body = b"".join([chunk async for chunk in service.export()])
+    for chat_id in [row.id for row in (await chat_service.list())[0]]:
+        await chat_service.delete(chat_id)
+
+    summary = await service.import_stream(_chunks(body, 7))
+
+    assert summary.chats == 5
+    assert summary.skipped == 0
+    assert (await chat_service.list())[1] == 5
+
+
+@pytest.mark.anyio
+async def test_import_rejects_overlong_line(
+    async_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a line longer than the limit is rejected while streaming."""
+    monkeypatch.setattr(transfer_service, "MAX_LINE_BYTES", 16)
+    service = TransferService(async_session)
+
+    with pytest.raises(InvalidRecordError):
+        await service.import_stream(_chunks(b"x" * 64, 8))
+
+
+def test_message_insert_conflicts_on_partition_key() -> None:
+    """Test that partitioned messages can conflict on ID and creation time."""
+    insert = transfer_service._insert_ignoring_duplicates(
+        "postgresql", Message, ["id", "created_at"]
+    )
+
+    sql = str(insert.compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (id, created_at) DO NOTHING" in sql
+
+
+@pytest.mark.anyio
+async def test_message_conflict_columns_on_sqlite(
+    async_session: AsyncSession,
+) -> None:
+    """Test that SQLite messages conflict on the ID alone."""
+    columns = await TransferService(async_session)._message_conflict_columns()
+
+    assert columns == ["id"]